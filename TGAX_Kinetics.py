@@ -6,18 +6,23 @@ Version 1.0
 
 # ───────── Crash Handler ─────────
 import sys, traceback, datetime, pathlib, io, json, tkinter as _tk, tkinter.messagebox as _mb
+_ERROR_LOG = pathlib.Path(__file__).with_suffix(".error.log")
 def _fatal(et, ev, tb):
-    log = pathlib.Path(__file__).with_suffix(".error.log")
-    with log.open("a", encoding="utf-8") as f:
-        f.write(f"\n=== {datetime.datetime.now()} ===\n")
-        traceback.print_exception(et, ev, tb, file=f)
+    # Render the traceback into a buffer first so the log file sees a single
+    # write instead of one per formatted line.
+    buf = io.StringIO()
+    buf.write(f"\n=== {datetime.datetime.now()} ===\n")
+    traceback.print_exception(et, ev, tb, file=buf)
+    with _ERROR_LOG.open("ab") as f:
+        f.write(buf.getvalue().encode("utf-8"))
     _tk.Tk().withdraw()
-    _mb.showerror("Fatal Error", f"{ev}\n\nDetails have been saved to {log.name}")
+    _mb.showerror("Fatal Error", f"{ev}\n\nDetails have been saved to {_ERROR_LOG.name}")
     sys.exit(1)
 sys.excepthook = _fatal
 
 # ───────── Standard Libraries ─────────
-import math, re, os, textwrap, ctypes
+import math, re, os, textwrap, ctypes, pickle, hashlib, functools
+from dataclasses import dataclass, field
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
@@ -26,7 +31,9 @@ import warnings
 # --- START: MODIFICATION (Threading) ---
 # Import threading and queue for background processing
 import threading
-from queue import Queue, Empty
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 # --- END: MODIFICATION (Threading) ---
 
 # ───────── High-DPI Awareness for Windows ─────────
@@ -38,22 +45,26 @@ except (AttributeError, TypeError):
 
 # ───────── Third-Party Libraries ─────────
 import numpy as np, pandas as pd
+from openpyxl import Workbook
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.ticker import MaxNLocator
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from scipy.optimize import least_squares, minimize_scalar
 from scipy import integrate
+from scipy.sparse import block_diag as sparse_block_diag
+from scipy.stats import qmc
 from scipy.integrate import quad, solve_ivp
-from scipy.signal import savgol_filter
+from scipy.signal import savgol_filter, savgol_coeffs
 from scipy.interpolate import PchipInterpolator
-from docx import Document
-from docx.shared import Inches, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from scipy.special import exp1
+# python-docx is only needed for Word report export — imported lazily there
+# (see _save_report_worker) so normal analysis sessions never pay for it.
 
 # ───────── Matplotlib Style (High-Contrast Journal Style) ─────────
-plt.rcParams.update({
+_RCPARAMS = {
     "legend.labelspacing": 0.1,
     "legend.handlelength": 0.8,
     "legend.handletextpad": 0.2,
@@ -63,14 +74,19 @@ plt.rcParams.update({
     "font.family": "Arial", "font.size": 10, "axes.titlesize": 12, "axes.labelsize": 10,
     "axes.linewidth": 1.0, "lines.linewidth": 1.5, "lines.markersize": 5, "legend.fontsize": 7,
     "legend.frameon": False, "xtick.major.size": 4, "ytick.major.size": 4, "xtick.major.width": 1.0,
-    "ytick.major.width": 1.0, "xtick.direction": "in", 
-})
+    "ytick.major.width": 1.0, "xtick.direction": "in",
+}
 # REVISION: High-contrast color palette for visual distinction
 NATURE_COLORS = [
     '#EE7733', '#0077BB', '#33BBEE', '#EE3377', '#CC3311', '#009988', '#BBBBBB',
     '#77AADD', '#99DDFF', '#44BB99', '#DDDD77', '#FFAABB', '#EEDD88', '#AAAA00'
 ]
-plt.rcParams['axes.prop_cycle'] = plt.cycler(color=NATURE_COLORS)
+# Build the cycler once and share it; guard the rcParams pass so a re-import
+# (reload, test harness) does not re-run matplotlib's key validation.
+_PROP_CYCLE = plt.cycler(color=NATURE_COLORS)
+if plt.rcParams['axes.prop_cycle'] != _PROP_CYCLE:
+    plt.rcParams.update(_RCPARAMS)
+    plt.rcParams['axes.prop_cycle'] = _PROP_CYCLE
 
 # ───────── Constants ─────────
 R, EPS = 8.314462618, 1e-6 # Ideal gas constant (J·mol⁻¹·K⁻¹), Epsilon for float comparisons
@@ -78,91 +94,471 @@ R, EPS = 8.314462618, 1e-6 # Ideal gas constant (J·mol⁻¹·K⁻¹), Epsilon f
 # --- START: Mechanism Plot Integration ---
 # Step 1: Create the Ideal Mechanism Model Library (EXPANDED TO >60 MODELS)
 # This library has been expanded to include over 60 unique and variant models from literature tables.
-IDEAL_MODELS = {
+#
+# PERFORMANCE REFACTOR: the models used to be `lambda a: ...` closures that
+# recomputed -ln(1-a) and the fractional powers from scratch on every call.
+# During mechanism comparison the same α grid is evaluated for every selected
+# model, so the shared subexpressions are now computed once per grid in a
+# ModelEvalContext and each model reads from it. -ln(1-a) is computed via
+# np.log1p for better accuracy near α→0.
+
+@dataclass
+class ModelEvalContext:
+    """Precomputed α-derived arrays shared by all f(α) model evaluations."""
+    a: np.ndarray            # conversion grid
+    one_minus_a: np.ndarray  # 1 - α
+    log1m: np.ndarray        # -ln(1-α), via log1p for accuracy near α→0
+    a13: np.ndarray          # α^(1/3)
+    om_a13: np.ndarray       # (1-α)^(1/3)
+    sqrt_a: np.ndarray       # α^(1/2)
+    sqrt_1ma: np.ndarray     # (1-α)^(1/2)
+    sqrt_log1m: np.ndarray   # (-ln(1-α))^(1/2)
+    om_a13_sq: np.ndarray    # (1-α)^(2/3)
+    endpoint_mask: np.ndarray  # α outside [EPS, 1-EPS], where f(α) may be singular
+    cache: dict = field(default_factory=dict)  # canonical key → f(α) values
+
+def make_model_context(a):
+    """Build the shared-subexpression bundle for an α grid (built once per grid)."""
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    one_minus_a = 1.0 - a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log1m = -np.log1p(-a)
+        om_a13 = np.cbrt(one_minus_a)
+        return ModelEvalContext(
+            a=a,
+            one_minus_a=one_minus_a,
+            log1m=log1m,
+            a13=np.cbrt(a),
+            om_a13=om_a13,
+            sqrt_a=np.sqrt(a),
+            sqrt_1ma=np.sqrt(one_minus_a),
+            sqrt_log1m=np.sqrt(log1m),
+            om_a13_sq=om_a13 * om_a13,
+            endpoint_mask=(a < EPS) | (a > 1.0 - EPS),
+        )
+
+IDEAL_MODEL_NAMES = {
     # --- Reaction Order Models (Fn) ---
-    'F0': ('Zero-Order', lambda a: np.ones_like(a)),
-    'F0.5': ('Reaction Order (n=0.5)', lambda a: (1 - a)**0.5),
-    'F1': ('First-Order / Mampel', lambda a: 1 - a),
-    'F1.5': ('Reaction Order (n=1.5)', lambda a: (1 - a)**1.5),
-    'F2': ('Second-Order', lambda a: (1 - a)**2),
-    'F2.5': ('Reaction Order (n=2.5)', lambda a: (1 - a)**2.5),
-    'F3': ('Third-Order', lambda a: (1 - a)**3),
-    'F4': ('Fourth-Order', lambda a: (1 - a)**4),
+    'F0': 'Zero-Order',
+    'F0.5': 'Reaction Order (n=0.5)',
+    'F1': 'First-Order / Mampel',
+    'F1.5': 'Reaction Order (n=1.5)',
+    'F2': 'Second-Order',
+    'F2.5': 'Reaction Order (n=2.5)',
+    'F3': 'Third-Order',
+    'F4': 'Fourth-Order',
 
     # --- Nucleation and Growth Models (Avrami-Erofeev, An) ---
-    'A1': ('Avrami-Erofeev (n=1, equiv. F1)', lambda a: 1 - a), # A1 is mathematically equivalent to F1
-    'A1.5': ('Avrami-Erofeev (n=1.5)', lambda a: 1.5 * (1 - a) * (-np.log(1 - a))**(1/3)),
-    'A2': ('Avrami-Erofeev (n=2)', lambda a: 2 * (1 - a) * (-np.log(1 - a))**0.5),
-    'A2.5': ('Avrami-Erofeev (n=2.5)', lambda a: 2.5 * (1 - a) * (-np.log(1 - a))**(3/5)),
-    'A3': ('Avrami-Erofeev (n=3)', lambda a: 3 * (1 - a) * (-np.log(1 - a))**(2/3)),
-    'A3.5': ('Avrami-Erofeev (n=3.5)', lambda a: 3.5 * (1 - a) * (-np.log(1 - a))**(2.5/3.5)),
-    'A4': ('Avrami-Erofeev (n=4)', lambda a: 4 * (1 - a) * (-np.log(1 - a))**(3/4)),
-    'A5': ('Avrami-Erofeev (n=5)', lambda a: 5 * (1 - a) * (-np.log(1 - a))**(4/5)),
+    'A1': 'Avrami-Erofeev (n=1, equiv. F1)', # A1 is mathematically equivalent to F1
+    'A1.5': 'Avrami-Erofeev (n=1.5)',
+    'A2': 'Avrami-Erofeev (n=2)',
+    'A2.5': 'Avrami-Erofeev (n=2.5)',
+    'A3': 'Avrami-Erofeev (n=3)',
+    'A3.5': 'Avrami-Erofeev (n=3.5)',
+    'A4': 'Avrami-Erofeev (n=4)',
+    'A5': 'Avrami-Erofeev (n=5)',
 
     # --- Geometrical Contraction Models (Rn) & Shrinking Core (SC) ---
-    'R1': ('Contracting Line / Zero-Order', lambda a: np.ones_like(a)),
-    'R2': ('Contracting Area / Cylinder', lambda a: 2 * (1 - a)**0.5),
-    'R3': ('Contracting Volume / Sphere', lambda a: 3 * (1 - a)**(2/3)),
-    'SC-RC': ('Shrinking Core (Reaction)', lambda a: 3 * (1 - a)**(2/3)), # Same as R3
+    'R1': 'Contracting Line / Zero-Order',
+    'R2': 'Contracting Area / Cylinder',
+    'R3': 'Contracting Volume / Sphere',
+    'SC-RC': 'Shrinking Core (Reaction)', # Same as R3
 
     # --- Power Law Models (Pn) ---
-    'P1/5': ('Power Law (n=1/5)', lambda a: 5 * a**(4/5)),
-    'P1/4': ('Power Law (n=1/4)', lambda a: 4 * a**(3/4)),
-    'P1/3': ('Power Law (n=1/3)', lambda a: 3 * a**(2/3)),
-    'P3/5': ('Power Law (n=3/5)', lambda a: (5/3) * a**(2/5)),
-    'P1/2': ('Power Law (n=1/2)', lambda a: 2 * a**0.5),
-    'P2/3': ('Power Law (n=2/3)', lambda a: (3/2) * a**(1/3)),
-    'P3/4': ('Power Law (n=3/4)', lambda a: (4/3) * a**(1/4)),
-    'P4/5': ('Power Law (n=4/5)', lambda a: (5/4) * a**(1/5)),
-    'P3/2': ('Power Law (n=3/2)', lambda a: (2/3) * a**(-0.5)),
-    'P2': ('Power Law (n=2)', lambda a: 0.5 * a**(-1)),
+    'P1/5': 'Power Law (n=1/5)',
+    'P1/4': 'Power Law (n=1/4)',
+    'P1/3': 'Power Law (n=1/3)',
+    'P3/5': 'Power Law (n=3/5)',
+    'P1/2': 'Power Law (n=1/2)',
+    'P2/3': 'Power Law (n=2/3)',
+    'P3/4': 'Power Law (n=3/4)',
+    'P4/5': 'Power Law (n=4/5)',
+    'P3/2': 'Power Law (n=3/2)',
+    'P2': 'Power Law (n=2)',
 
     # --- Diffusion Models (Dn) & Shrinking Core (SC) ---
-    'D1': ('1D Diffusion', lambda a: 0.5 / a),
-    'D2': ('2D Diffusion (Valensi)', lambda a: 1 / (-np.log(1 - a))),
-    'D3-J': ('3D Diffusion (Jander)', lambda a: (3/2) * (1 - a)**(2/3) / (1 - (1 - a)**(1/3))),
-    'D4-GB': ('3D Diffusion (Ginstling-Brounshtein)', lambda a: (3/2) / ((1 - a)**(-1/3) - 1)),
-    'D5-ZL': ('3D Diffusion (Zhuravlev-Lesokine)', lambda a: (3/2) / (np.power(1 + a, 1/3) - 1)),
-    'D6': ('3D Diffusion (Variant D3d)', lambda a: (3/2) * (1-a)**(1/3) / (1 - (1-a)**(1/3))),
-    'D7': ('3D Diffusion (Variant D3g)', lambda a: 6*(1-a)*(-np.log(1-a))**0.5 / (1-(1-a)**(1/3))),
-    'D-AJ': ('Anti-Jander', lambda a: (3/2) * (1 - (1-a)**(1/3))**(-1)),
-    'D-AGB': ('Anti-Ginstling-Brounshtein', lambda a: (3/2) * (1-a)**(-1/3)),
-    'D10-Ash': ('Shrinking Core (Ash Diffusion)', lambda a: (3/2) / ((1 - a)**(-1/3) - 1)), # Same shape as D4-GB
-    'SC-DA': ('Shrinking Core (Ash Diffusion)', lambda a: (3/2) / ((1 - a)**(-1/3) - 1)), # Alias for D10-Ash
-    'D11-Film': ('Shrinking Core (Film Diffusion)', lambda a: np.ones_like(a)), # Same as F0
-    'SC-FD': ('Shrinking Core (Film Diffusion)', lambda a: np.ones_like(a)), # Alias for D11-Film
+    'D1': '1D Diffusion',
+    'D2': '2D Diffusion (Valensi)',
+    'D3-J': '3D Diffusion (Jander)',
+    'D4-GB': '3D Diffusion (Ginstling-Brounshtein)',
+    'D5-ZL': '3D Diffusion (Zhuravlev-Lesokine)',
+    'D6': '3D Diffusion (Variant D3d)',
+    'D7': '3D Diffusion (Variant D3g)',
+    'D-AJ': 'Anti-Jander',
+    'D-AGB': 'Anti-Ginstling-Brounshtein',
+    'D10-Ash': 'Shrinking Core (Ash Diffusion)', # Same shape as D4-GB
+    'SC-DA': 'Shrinking Core (Ash Diffusion)', # Alias for D10-Ash
+    'D11-Film': 'Shrinking Core (Film Diffusion)', # Same as F0
+    'SC-FD': 'Shrinking Core (Film Diffusion)', # Alias for D11-Film
 
     # --- Chemical Reaction Models (Cn) ---
-    'C1': ('Chemical Reaction (C1)', lambda a: (3/2) * (1-a)**(1/3)),
-    'C2': ('Chemical Reaction (C2)', lambda a: 4 * (1-a)**(3/4)),
-    'C4': ('Chemical Reaction (C4)', lambda a: (1/2) * (1-a)**(-0.5)),
-    'C5': ('Chemical Reaction (C5)', lambda a: (1/3) * (1-a)**(-2/3)),
-    'C6': ('Chemical Reaction (C6)', lambda a: (1/4) * (1-a)**(-3/4)),
-    'C7': ('Chemical Reaction (C7)', lambda a: (1/2) * (1-a)**(-1)),
-    'C8': ('Chemical Reaction (C8)', lambda a: (1/3) * (1-a)**(-1)),
-    'C9': ('Chemical Reaction (C9)', lambda a: (1/5) * (1-a)**(-4/5)),
-    'C10': ('Chemical Reaction (C10)', lambda a: (1/6) * (1-a)**(-5/6)),
-    
+    'C1': 'Chemical Reaction (C1)',
+    'C2': 'Chemical Reaction (C2)',
+    'C4': 'Chemical Reaction (C4)',
+    'C5': 'Chemical Reaction (C5)',
+    'C6': 'Chemical Reaction (C6)',
+    'C7': 'Chemical Reaction (C7)',
+    'C8': 'Chemical Reaction (C8)',
+    'C9': 'Chemical Reaction (C9)',
+    'C10': 'Chemical Reaction (C10)',
+
+    # --- Autocatalytic Models (For Shape Comparison) ---
+    'PT(1,1)': 'Prout-Tompkins (m=1, n=1)',
+    'AC(0.5,1)': 'Autocatalytic (m=0.5, n=1)',
+    'AC(1.5,1)': 'Autocatalytic (m=1.5, n=1)',
+    'AC(2,1)': 'Autocatalytic (m=2, n=1)',
+    'AC(1,0.5)': 'Autocatalytic (m=1, n=0.5)',
+    'AC(1,1.5)': 'Autocatalytic (m=1, n=1.5)',
+    'AC(1,2)': 'Autocatalytic (m=1, n=2)',
+    'AC(0.5,2)': 'Autocatalytic (m=0.5, n=2)',
+    'AC(2,0.5)': 'Autocatalytic (m=2, n=0.5)',
+    'AC(2,2)': 'Autocatalytic (m=2, n=2)',
+    'SB(0.5,0.5,1)': 'Sestak-Berggren (0.5,0.5,1)',
+    'SB(0.5,1,1)': 'Sestak-Berggren (0.5,1,1)',
+    'SB(1,0.5,1)': 'Sestak-Berggren (1,0.5,1)',
+    'SB(1,1,0.5)': 'Sestak-Berggren (1,1,0.5)',
+    'SB(1,1,1)': 'Sestak-Berggren (1,1,1)',
+    'SB(1,1,2)': 'Sestak-Berggren (1,1,2)',
+}
+
+# Selection-dialog rows grouped by mechanism family, formatted once at module
+# load; the dialog inserts them with the model keys doubling as Treeview iids.
+def _model_family(key):
+    if key.startswith('R') or key == 'SC-RC':
+        return 'Geometrical Contraction (Rn / SC)'
+    if key.startswith('F'): return 'Reaction Order (Fn)'
+    if key.startswith('A') and not key.startswith('AC'): return 'Nucleation & Growth (An)'
+    if key.startswith('P') and not key.startswith('PT'): return 'Power Law (Pn)'
+    if key.startswith('D') or key.startswith('SC-'): return 'Diffusion (Dn / SC)'
+    if key.startswith('C'): return 'Chemical Reaction (Cn)'
+    return 'Autocatalytic (PT / AC / SB)'
+
+_MODEL_TREE_ROWS = tuple((_model_family(k), k, f"{k} — {v}")
+                         for k, v in IDEAL_MODEL_NAMES.items())
+
+# Each model is a function of a ModelEvalContext; powers of (1-α) with a 1/3
+# denominator reuse c.om_a13 (one multiply instead of a fractional pow).
+IDEAL_MODEL_FNS = {
+    # --- Reaction Order Models (Fn) ---
+    'F0': lambda c: np.ones_like(c.a),
+    'F0.5': lambda c: c.sqrt_1ma,
+    'F1': lambda c: c.one_minus_a,
+    'F1.5': lambda c: c.one_minus_a * c.sqrt_1ma,
+    'F2': lambda c: c.one_minus_a * c.one_minus_a,
+    'F2.5': lambda c: c.one_minus_a * c.one_minus_a * c.sqrt_1ma,
+    'F3': lambda c: c.one_minus_a * c.one_minus_a * c.one_minus_a,
+    'F4': lambda c: (c.one_minus_a * c.one_minus_a) * (c.one_minus_a * c.one_minus_a),
+
+    # --- Nucleation and Growth Models (Avrami-Erofeev, An) ---
+    'A1': lambda c: c.one_minus_a,
+    'A1.5': lambda c: 1.5 * c.one_minus_a * c.log1m**(1/3),
+    'A2': lambda c: 2 * c.one_minus_a * c.sqrt_log1m,
+    'A2.5': lambda c: 2.5 * c.one_minus_a * c.log1m**(3/5),
+    'A3': lambda c: 3 * c.one_minus_a * c.log1m**(2/3),
+    'A3.5': lambda c: 3.5 * c.one_minus_a * c.log1m**(2.5/3.5),
+    'A4': lambda c: 4 * c.one_minus_a * c.log1m**(3/4),
+    'A5': lambda c: 5 * c.one_minus_a * c.log1m**(4/5),
+
+    # --- Geometrical Contraction Models (Rn) & Shrinking Core (SC) ---
+    'R1': lambda c: np.ones_like(c.a),
+    'R2': lambda c: 2 * c.sqrt_1ma,
+    'R3': lambda c: 3 * c.om_a13_sq,
+    'SC-RC': lambda c: 3 * c.om_a13_sq,
+
+    # --- Power Law Models (Pn) ---
+    'P1/5': lambda c: 5 * c.a**(4/5),
+    'P1/4': lambda c: 4 * c.a**(3/4),
+    'P1/3': lambda c: 3 * c.a13 * c.a13,
+    'P3/5': lambda c: (5/3) * c.a**(2/5),
+    'P1/2': lambda c: 2 * c.sqrt_a,
+    'P2/3': lambda c: (3/2) * c.a13,
+    'P3/4': lambda c: (4/3) * c.a**(1/4),
+    'P4/5': lambda c: (5/4) * c.a**(1/5),
+    'P3/2': lambda c: (2/3) / c.sqrt_a,
+    'P2': lambda c: 0.5 / c.a,
+
+    # --- Diffusion Models (Dn) & Shrinking Core (SC) ---
+    'D1': lambda c: 0.5 / c.a,
+    'D2': lambda c: 1 / c.log1m,
+    'D3-J': lambda c: (3/2) * c.om_a13_sq / (1 - c.om_a13),
+    'D4-GB': lambda c: (3/2) / (1/c.om_a13 - 1),
+    'D5-ZL': lambda c: (3/2) / (np.cbrt(1 + c.a) - 1),
+    'D6': lambda c: (3/2) * c.om_a13 / (1 - c.om_a13),
+    'D7': lambda c: 6 * c.one_minus_a * c.sqrt_log1m / (1 - c.om_a13),
+    'D-AJ': lambda c: (3/2) / (1 - c.om_a13),
+    'D-AGB': lambda c: (3/2) / c.om_a13,
+    'D10-Ash': lambda c: (3/2) / (1/c.om_a13 - 1),
+    'SC-DA': lambda c: (3/2) / (1/c.om_a13 - 1),
+    'D11-Film': lambda c: np.ones_like(c.a),
+    'SC-FD': lambda c: np.ones_like(c.a),
+
+    # --- Chemical Reaction Models (Cn) ---
+    'C1': lambda c: (3/2) * c.om_a13,
+    'C2': lambda c: 4 * c.one_minus_a**(3/4),
+    'C4': lambda c: (1/2) / c.sqrt_1ma,
+    'C5': lambda c: (1/3) / c.om_a13_sq,
+    'C6': lambda c: (1/4) * c.one_minus_a**(-3/4),
+    'C7': lambda c: (1/2) / c.one_minus_a,
+    'C8': lambda c: (1/3) / c.one_minus_a,
+    'C9': lambda c: (1/5) * c.one_minus_a**(-4/5),
+    'C10': lambda c: (1/6) * c.one_minus_a**(-5/6),
+
     # --- Autocatalytic Models (For Shape Comparison) ---
-    'PT(1,1)': ('Prout-Tompkins (m=1, n=1)', lambda a: a * (1-a)),
-    'AC(0.5,1)': ('Autocatalytic (m=0.5, n=1)', lambda a: (a**0.5) * (1-a)),
-    'AC(1.5,1)': ('Autocatalytic (m=1.5, n=1)', lambda a: (a**1.5) * (1-a)),
-    'AC(2,1)': ('Autocatalytic (m=2, n=1)', lambda a: (a**2) * (1-a)),
-    'AC(1,0.5)': ('Autocatalytic (m=1, n=0.5)', lambda a: a * (1-a)**0.5),
-    'AC(1,1.5)': ('Autocatalytic (m=1, n=1.5)', lambda a: a * (1-a)**1.5),
-    'AC(1,2)': ('Autocatalytic (m=1, n=2)', lambda a: a * (1-a)**2),
-    'AC(0.5,2)': ('Autocatalytic (m=0.5, n=2)', lambda a: (a**0.5) * (1-a)**2),
-    'AC(2,0.5)': ('Autocatalytic (m=2, n=0.5)', lambda a: (a**2) * (1-a)**0.5),
-    'AC(2,2)': ('Autocatalytic (m=2, n=2)', lambda a: (a**2) * (1-a)**2),
-    'SB(0.5,0.5,1)': ('Sestak-Berggren (0.5,0.5,1)', lambda a: (a**0.5) * (1-a)**0.5 * (-np.log(1-a))),
-    'SB(0.5,1,1)': ('Sestak-Berggren (0.5,1,1)', lambda a: (a**0.5) * (1-a) * (-np.log(1-a))),
-    'SB(1,0.5,1)': ('Sestak-Berggren (1,0.5,1)', lambda a: a * (1-a)**0.5 * (-np.log(1-a))),
-    'SB(1,1,0.5)': ('Sestak-Berggren (1,1,0.5)', lambda a: a * (1-a) * (-np.log(1-a))**0.5),
-    'SB(1,1,1)': ('Sestak-Berggren (1,1,1)', lambda a: a * (1-a) * (-np.log(1-a))),
-    'SB(1,1,2)': ('Sestak-Berggren (1,1,2)', lambda a: a * (1-a) * (-np.log(1-a))**2),
+    'PT(1,1)': lambda c: c.a * c.one_minus_a,
+    'AC(0.5,1)': lambda c: c.sqrt_a * c.one_minus_a,
+    'AC(1.5,1)': lambda c: c.a * c.sqrt_a * c.one_minus_a,
+    'AC(2,1)': lambda c: c.a * c.a * c.one_minus_a,
+    'AC(1,0.5)': lambda c: c.a * c.sqrt_1ma,
+    'AC(1,1.5)': lambda c: c.a * c.one_minus_a * c.sqrt_1ma,
+    'AC(1,2)': lambda c: c.a * c.one_minus_a * c.one_minus_a,
+    'AC(0.5,2)': lambda c: c.sqrt_a * c.one_minus_a * c.one_minus_a,
+    'AC(2,0.5)': lambda c: c.a * c.a * c.sqrt_1ma,
+    'AC(2,2)': lambda c: (c.a * c.a) * (c.one_minus_a * c.one_minus_a),
+    'SB(0.5,0.5,1)': lambda c: c.sqrt_a * c.sqrt_1ma * c.log1m,
+    'SB(0.5,1,1)': lambda c: c.sqrt_a * c.one_minus_a * c.log1m,
+    'SB(1,0.5,1)': lambda c: c.a * c.sqrt_1ma * c.log1m,
+    'SB(1,1,0.5)': lambda c: c.a * c.one_minus_a * c.sqrt_log1m,
+    'SB(1,1,1)': lambda c: c.a * c.one_minus_a * c.log1m,
+    'SB(1,1,2)': lambda c: c.a * c.one_minus_a * c.log1m * c.log1m,
 }
+
+# Several library entries are the same function under different historical
+# names (e.g. the shrinking-core duplicates). They stay selectable in the UI,
+# but evaluation resolves them to one canonical kernel so a "select all"
+# comparison computes each distinct curve only once.
+MODEL_ALIASES = {
+    'A1': 'F1',
+    'R1': 'F0',
+    'D1': 'P2',
+    'SC-RC': 'R3',
+    'D10-Ash': 'D4-GB',
+    'SC-DA': 'D4-GB',
+    'D11-Film': 'F0',
+    'SC-FD': 'F0',
+}
+
+def eval_ideal_model(key, a_or_ctx):
+    """Evaluate f(α) for a single model; accepts an α array or a prebuilt context.
+
+    Aliased keys share one canonical kernel, and results are memoized on the
+    context so repeated evaluations over the same α grid are free.
+    """
+    ctx = a_or_ctx if isinstance(a_or_ctx, ModelEvalContext) else make_model_context(a_or_ctx)
+    canon = MODEL_ALIASES.get(key, key)
+    values = ctx.cache.get(canon)
+    if values is None:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = IDEAL_MODEL_FNS[canon](ctx)
+            # Branchless endpoint handling: grid points at α→0 / α→1 where the
+            # diffusion/power-law kernels are singular become NaN in one masked
+            # pass, so plotting breaks the line instead of chasing infs.
+            if ctx.endpoint_mask.any():
+                values = np.where(ctx.endpoint_mask, np.nan, values)
+        ctx.cache[canon] = values
+    return values
+
+# Optional Numba acceleration: when numba is installed, the whole model library
+# is also available as one compiled switch on integer IDs, fusing 1-a, log1p
+# and the fractional powers into a single loop instead of one ufunc call per
+# arithmetic op. Numba is NOT a hard dependency — without it eval_model falls
+# back to the vectorized IDEAL_MODEL_FNS path above.
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+MODEL_IDS = {key: i for i, key in enumerate(IDEAL_MODEL_NAMES)}
+
+if HAS_NUMBA:
+    # error_model='numpy': endpoint divisions yield inf/nan (masked by the
+    # wrapper) instead of raising ZeroDivisionError mid-kernel.
+    @njit(cache=True, fastmath=True, error_model='numpy')
+    def _eval_model(mid, a, out):
+        # Branch numbering follows MODEL_IDS (= insertion order of IDEAL_MODEL_NAMES).
+        for i in range(a.shape[0]):
+            v = a[i]
+            x = 1.0 - v
+            l = -math.log1p(-v)       # -ln(1-α), shared by A-, D- and SB-series
+            cx = x**(1.0/3.0)         # (1-α)^(1/3), shared by R/D/C-series
+            if mid == 0: out[i] = 1.0                                  # F0
+            elif mid == 1: out[i] = x**0.5                             # F0.5
+            elif mid == 2: out[i] = x                                  # F1
+            elif mid == 3: out[i] = x**1.5                             # F1.5
+            elif mid == 4: out[i] = x * x                              # F2
+            elif mid == 5: out[i] = x**2.5                             # F2.5
+            elif mid == 6: out[i] = x * x * x                          # F3
+            elif mid == 7: out[i] = x * x * x * x                      # F4
+            elif mid == 8: out[i] = x                                  # A1
+            elif mid == 9: out[i] = 1.5 * x * l**(1.0/3.0)             # A1.5
+            elif mid == 10: out[i] = 2.0 * x * math.sqrt(l)            # A2
+            elif mid == 11: out[i] = 2.5 * x * l**0.6                  # A2.5
+            elif mid == 12: out[i] = 3.0 * x * l**(2.0/3.0)            # A3
+            elif mid == 13: out[i] = 3.5 * x * l**(2.5/3.5)            # A3.5
+            elif mid == 14: out[i] = 4.0 * x * l**0.75                 # A4
+            elif mid == 15: out[i] = 5.0 * x * l**0.8                  # A5
+            elif mid == 16: out[i] = 1.0                               # R1
+            elif mid == 17: out[i] = 2.0 * x**0.5                      # R2
+            elif mid == 18: out[i] = 3.0 * cx * cx                     # R3
+            elif mid == 19: out[i] = 3.0 * cx * cx                     # SC-RC
+            elif mid == 20: out[i] = 5.0 * v**0.8                      # P1/5
+            elif mid == 21: out[i] = 4.0 * v**0.75                     # P1/4
+            elif mid == 22: out[i] = 3.0 * v**(2.0/3.0)                # P1/3
+            elif mid == 23: out[i] = (5.0/3.0) * v**0.4                # P3/5
+            elif mid == 24: out[i] = 2.0 * math.sqrt(v)                # P1/2
+            elif mid == 25: out[i] = 1.5 * v**(1.0/3.0)                # P2/3
+            elif mid == 26: out[i] = (4.0/3.0) * v**0.25               # P3/4
+            elif mid == 27: out[i] = 1.25 * v**0.2                     # P4/5
+            elif mid == 28: out[i] = (2.0/3.0) / math.sqrt(v)          # P3/2
+            elif mid == 29: out[i] = 0.5 / v                           # P2
+            elif mid == 30: out[i] = 0.5 / v                           # D1
+            elif mid == 31: out[i] = 1.0 / l                           # D2
+            elif mid == 32: out[i] = 1.5 * cx * cx / (1.0 - cx)        # D3-J
+            elif mid == 33: out[i] = 1.5 / (1.0/cx - 1.0)              # D4-GB
+            elif mid == 34: out[i] = 1.5 / ((1.0 + v)**(1.0/3.0) - 1.0) # D5-ZL
+            elif mid == 35: out[i] = 1.5 * cx / (1.0 - cx)             # D6
+            elif mid == 36: out[i] = 6.0 * x * math.sqrt(l) / (1.0 - cx) # D7
+            elif mid == 37: out[i] = 1.5 / (1.0 - cx)                  # D-AJ
+            elif mid == 38: out[i] = 1.5 / cx                          # D-AGB
+            elif mid == 39: out[i] = 1.5 / (1.0/cx - 1.0)              # D10-Ash
+            elif mid == 40: out[i] = 1.5 / (1.0/cx - 1.0)              # SC-DA
+            elif mid == 41: out[i] = 1.0                               # D11-Film
+            elif mid == 42: out[i] = 1.0                               # SC-FD
+            elif mid == 43: out[i] = 1.5 * cx                          # C1
+            elif mid == 44: out[i] = 4.0 * x**0.75                     # C2
+            elif mid == 45: out[i] = 0.5 / math.sqrt(x)                # C4
+            elif mid == 46: out[i] = (1.0/3.0) / (cx * cx)             # C5
+            elif mid == 47: out[i] = 0.25 * x**(-0.75)                 # C6
+            elif mid == 48: out[i] = 0.5 / x                           # C7
+            elif mid == 49: out[i] = (1.0/3.0) / x                     # C8
+            elif mid == 50: out[i] = 0.2 * x**(-0.8)                   # C9
+            elif mid == 51: out[i] = (1.0/6.0) * x**(-5.0/6.0)         # C10
+            elif mid == 52: out[i] = v * x                             # PT(1,1)
+            elif mid == 53: out[i] = math.sqrt(v) * x                  # AC(0.5,1)
+            elif mid == 54: out[i] = v**1.5 * x                        # AC(1.5,1)
+            elif mid == 55: out[i] = v * v * x                         # AC(2,1)
+            elif mid == 56: out[i] = v * x**0.5                        # AC(1,0.5)
+            elif mid == 57: out[i] = v * x**1.5                        # AC(1,1.5)
+            elif mid == 58: out[i] = v * x * x                         # AC(1,2)
+            elif mid == 59: out[i] = math.sqrt(v) * x * x              # AC(0.5,2)
+            elif mid == 60: out[i] = v * v * x**0.5                    # AC(2,0.5)
+            elif mid == 61: out[i] = v * v * x * x                     # AC(2,2)
+            elif mid == 62: out[i] = math.sqrt(v) * x**0.5 * l         # SB(0.5,0.5,1)
+            elif mid == 63: out[i] = math.sqrt(v) * x * l              # SB(0.5,1,1)
+            elif mid == 64: out[i] = v * x**0.5 * l                    # SB(1,0.5,1)
+            elif mid == 65: out[i] = v * x * math.sqrt(l)              # SB(1,1,0.5)
+            elif mid == 66: out[i] = v * x * l                         # SB(1,1,1)
+            elif mid == 67: out[i] = v * x * l * l                     # SB(1,1,2)
+            else: out[i] = np.nan
+
+def eval_model(key, a):
+    """Evaluate f(α) for one model key, using the compiled kernel when available."""
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    if HAS_NUMBA:
+        out = np.empty_like(a)
+        _eval_model(MODEL_IDS[MODEL_ALIASES.get(key, key)], a, out)
+        out[(a < EPS) | (a > 1.0 - EPS)] = np.nan
+        return out
+    return eval_ideal_model(key, a)
+
+def eval_models(keys, a):
+    """Evaluate several models into one packed (len(keys), N_alpha) matrix.
+
+    A single buffer holds every curve: with numba the compiled kernel writes
+    each row in place, otherwise rows come from the shared memoized context —
+    either way the mechanism comparison avoids one temporary per model.
+    """
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    out = np.empty((len(keys), a.size))
+    if HAS_NUMBA:
+        for i, key in enumerate(keys):
+            _eval_model(MODEL_IDS[MODEL_ALIASES.get(key, key)], a, out[i])
+        out[:, (a < EPS) | (a > 1.0 - EPS)] = np.nan
+    else:
+        ctx = make_model_context(a)
+        for i, key in enumerate(keys):
+            out[i] = eval_ideal_model(key, ctx)
+    return out
+
+_ALPHA_GRID_CACHE = {}
+
+def get_alpha_grid(a_min, a_max, a_step=0.01):
+    """Rounded α grid plus its shared model context, cached per (min, max, step).
+
+    Repeated runs with the same settings (re-imports, model fits, CV folds)
+    all reuse one grid and one precomputed context instead of rebuilding
+    1-α / -ln(1-α) / cube-root arrays every call.
+    """
+    key = (round(a_min, 6), round(a_max, 6), round(a_step, 6))
+    if key not in _ALPHA_GRID_CACHE:
+        alphas = np.round(np.arange(a_min, a_max + EPS, a_step), 4)
+        _ALPHA_GRID_CACHE[key] = (alphas, make_model_context(alphas))
+    return _ALPHA_GRID_CACHE[key]
 # --- END: Mechanism Plot Integration ---
 
+# Optional numbalsoda acceleration for the TG-curve ODE reconstruction:
+# solve_ivp re-enters the Python interpreter on every step, which dominates
+# runtime for the stiff Arrhenius right-hand sides swept per heating rate.
+# With numbalsoda installed the rhs runs as a compiled cfunc and lsoda never
+# touches Python; without it predict_tg_curve_from_model keeps using solve_ivp.
+try:
+    from numbalsoda import lsoda, lsoda_sig
+    from numba import cfunc
+    HAS_NUMBALSODA = True
+except ImportError:
+    HAS_NUMBALSODA = False
+
+if HAS_NUMBALSODA:
+    @cfunc(lsoda_sig)
+    def _lifetime_rhs(T, u, du, p):
+        # p = [family, beta_K_per_s, params...]; families match _lifetime_rhs_data.
+        a = u[0]
+        if a < EPS: a = EPS
+        if a > 1.0 - EPS: a = 1.0 - EPS
+        x = 1.0 - a
+        fam = int(p[0])
+        if fam == 0:    # CKA / SB / CKA (Fixed Ea): m, n, p, logA, Ea_J
+            f = a**p[2] * x**p[3] * (-math.log(x))**p[4]
+            r = math.exp(p[5]) * math.exp(-p[6] / (R * T)) * f
+        elif fam == 1:  # Kamal-Sourour: logA1, E1_J, logA2, E2_J, m, n
+            k1 = math.exp(p[2]) * math.exp(-p[3] / (R * T))
+            k2 = math.exp(p[4]) * math.exp(-p[5] / (R * T))
+            r = (k1 + k2 * a**p[6]) * x**p[7]
+        elif fam == 2:  # GAI: logA, E_J, n1, z0, n2
+            k = math.exp(p[2]) * math.exp(-p[3] / (R * T))
+            r = k * x**p[4] * (p[5] + a**p[6])
+        elif fam == 3:  # PAR: logA1, E1_J, n1, logA2, E2_J, n2
+            k1 = math.exp(p[2]) * math.exp(-p[3] / (R * T))
+            k2 = math.exp(p[5]) * math.exp(-p[6] / (R * T))
+            r = k1 * x**p[4] + k2 * x**p[7]
+        else:
+            r = 0.0
+        # d(alpha)/dT = (d(alpha)/dt in 1/s) / (dT/dt in K/s)
+        du[0] = (r / 60.0) / p[1]
+
+    _LIFETIME_RHS_PTR = _lifetime_rhs.address
+
+def _lifetime_rhs_data(model_name, raw_params, beta_K_per_s):
+    """Pack fitted parameters into the flat vector read by the compiled rhs.
+
+    Returns None for models the cfunc cannot represent (GlobalFit, whose Ea
+    varies with alpha through an interpolated isoconversional curve).
+    """
+    name = (model_name or '').upper()
+    if name in ("CKA", "SB", "CKA (FIXED EA)"):
+        m, n, p_, logA, Ea_J = raw_params
+        return np.array([0.0, beta_K_per_s, m, n, p_, logA, Ea_J, 0.0])
+    if name == "KAMAL-SOUROUR":
+        logA1, E1_J, logA2, E2_J, m, n = raw_params
+        return np.array([1.0, beta_K_per_s, logA1, E1_J, logA2, E2_J, m, n])
+    if name == "GAI":
+        logA, E_J, n1, z0, n2 = raw_params
+        return np.array([2.0, beta_K_per_s, logA, E_J, n1, z0, n2, 0.0])
+    if name == "PAR":
+        logA1, E1_J, n1, logA2, E2_J, n2 = raw_params
+        return np.array([3.0, beta_K_per_s, logA1, E1_J, n1, logA2, E2_J, n2])
+    return None
+
 
 # ───────── MODERNIZED DIALOG WINDOWS ─────────
 # --- START: Mechanism Plot Integration ---
@@ -173,12 +569,7 @@ class ModelSelectionDialog(tk.Toplevel):
         self.title("Select Ideal Models for Comparison")
         self.result = None
 
-        try:
-            # Assuming parent has a 'resource_path' method
-            icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            self.iconbitmap(icon_path)
-        except Exception:
-            pass 
+        parent._apply_icon(self)
 
         self.transient(parent)
         self.grab_set()
@@ -194,19 +585,26 @@ class ModelSelectionDialog(tk.Toplevel):
         list_frame = ttk.Frame(main_frame)
         list_frame.pack(fill="both", expand=True)
 
-        self.listbox = tk.Listbox(list_frame, selectmode=tk.EXTENDED, height=15, 
-                                 bg="#ffffff", fg="#212529", font=("Segoe UI", 10),
-                                 selectbackground="#6366f1", selectforeground="white")
-        self.listbox.pack(side="left", fill="both", expand=True)
+        # Treeview grouped by mechanism family: model keys double as item iids,
+        # so selection maps straight back to keys with no index bookkeeping.
+        self.tree = ttk.Treeview(list_frame, selectmode="extended", show="tree",
+                                 height=15, style="Modern.Treeview")
+        self.tree.pack(side="left", fill="both", expand=True)
 
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.listbox.yview)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.listbox.config(yscrollcommand=scrollbar.set)
-
-        self.model_keys = list(model_library.keys())
-        for key in self.model_keys:
-            full_name = model_library[key][0]
-            self.listbox.insert(tk.END, f"{key} ({full_name})")
+        self.tree.config(yscrollcommand=scrollbar.set)
+
+        self.model_keys = set(model_library.keys())
+        rows = _MODEL_TREE_ROWS if model_library is IDEAL_MODEL_NAMES else \
+            tuple((_model_family(key) if key in IDEAL_MODEL_NAMES else 'Other',
+                   key, f"{key} — {full_name}") for key, full_name in model_library.items())
+        families_seen = set()
+        for family, key, text in rows:
+            if family not in families_seen:
+                self.tree.insert("", "end", iid=family, text=family, open=True)
+                families_seen.add(family)
+            self.tree.insert(family, "end", iid=key, text=text)
 
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill="x", pady=(15, 0))
@@ -217,11 +615,12 @@ class ModelSelectionDialog(tk.Toplevel):
         cancel_btn.pack(side="right", padx=(0, 10))
 
     def on_ok(self):
-        selected_indices = self.listbox.curselection()
-        if not selected_indices:
+        # Family rows can land in the selection too; keep only model keys.
+        selected = [iid for iid in self.tree.selection() if iid in self.model_keys]
+        if not selected:
             messagebox.showwarning("No Selection", "Please select at least one model.", parent=self)
             return
-        self.result = [self.model_keys[i] for i in selected_indices]
+        self.result = selected
         self.destroy()
 # --- END: Mechanism Plot Integration ---
 
@@ -231,11 +630,7 @@ class SaveOptionsDialog(tk.Toplevel):
         super().__init__(parent)
         self.title("Save Plot Options")
         
-        try:
-            icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            self.iconbitmap(icon_path)
-        except Exception:
-            pass 
+        parent._apply_icon(self)
 
         self.fig = fig
         self.is_thermo_plot = is_thermo_plot
@@ -331,10 +726,9 @@ class SaveOptionsDialog(tk.Toplevel):
         self.update_transparency_option()
 
         # --- Automatic Sizing Logic ---
-        self.update_idletasks()
-        w = self.winfo_reqwidth()
-        h = self.winfo_reqheight()
-        self.geometry(f"{w+20}x{h+20}")
+        # Let Tk size the dialog on first map; update_idletasks() here forced
+        # a full geometry pass during construction just to read the size back.
+        self.geometry("")
         self.resizable(False, False)
 
     def update_size_entries(self, event=None):
@@ -382,6 +776,35 @@ class SaveOptionsDialog(tk.Toplevel):
         )
         if not p: return
 
+        # Deep-copy the figure via pickle so all export-only mutations (fonts,
+        # size, fills) happen on a private Agg-backed copy and savefig can run
+        # on a worker thread without freezing the UI at TIFF/600 dpi.
+        try:
+            fig_copy = pickle.loads(pickle.dumps(self.fig))
+        except Exception:
+            fig_copy = None
+
+        if fig_copy is not None:
+            for ax in fig_copy.axes:
+                if ax.get_legend():
+                    for text in ax.get_legend().get_texts():
+                        text.set_fontsize(7)
+            fig_copy.set_size_inches(w_cm/2.54, h_cm/2.54)
+            if self.is_thermo_plot and fill:
+                for ax in fig_copy.axes:
+                    for l in ax.get_lines():
+                        ax.fill_between(l.get_xdata(), l.get_ydata(), 0,
+                                        color=l.get_color(), alpha=0.1)
+            parent = self.master
+            threading.Thread(target=self._save_worker,
+                             args=(fig_copy, p, dpi,
+                                   transparent if fmt in ["TIFF", "PNG"] else False,
+                                   parent),
+                             daemon=True).start()
+            self.destroy()
+            return
+
+        # Fallback: figures with artists that do not pickle are saved in place.
         # --- MODIFICATION START: Legend Size Coordination ---
         original_legend_fontsizes = {}
         try:
@@ -405,7 +828,8 @@ class SaveOptionsDialog(tk.Toplevel):
                             transparent=transparent if fmt in ["TIFF", "PNG"] else False,
                             bbox_inches='tight', pad_inches=0.05)
 
-            [f.remove() for f in fills]
+            for f in fills:
+                f.remove()
             self.fig.set_size_inches(orig_size)
         
         finally:
@@ -416,19 +840,29 @@ class SaveOptionsDialog(tk.Toplevel):
                     for text in ax.get_legend().get_texts():
                         text.set_fontsize(original_legend_fontsizes[i])
             # --- MODIFICATION END: Legend Size Coordination ---
-        
+
         self.destroy()
 
+    def _save_worker(self, fig_copy, p, dpi, transparent, parent):
+        try:
+            fig_copy.savefig(p, dpi=dpi, transparent=transparent,
+                             bbox_inches='tight', pad_inches=0.05)
+            msg = f"Plot saved: {Path(p).name}"
+        except Exception as e:
+            msg = f"Plot save failed: {e}"
+        finally:
+            plt.close(fig_copy)
+        try:
+            parent.after(0, lambda: parent.status_var.set(msg))
+        except Exception:
+            pass
+
 class CalculationSettingsDialog(tk.Toplevel):
     def __init__(self, parent, temp_range_suggestion=(35.0, 800.0)):
         super().__init__(parent)
         self.title("Kinetic Analysis Settings")
 
-        try:
-            icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            self.iconbitmap(icon_path)
-        except Exception:
-            pass
+        parent._apply_icon(self)
             
         self.result = None
         self.transient(parent)
@@ -530,10 +964,7 @@ class CalculationSettingsDialog(tk.Toplevel):
         cancel_btn.pack(side="right", padx=(0, 15))
 
         self.toggle_preprocessing_options() # Set initial state
-        self.update_idletasks()
-        w = self.winfo_reqwidth()
-        h = self.winfo_reqheight()
-        self.geometry(f"{w+20}x{h+20}")
+        self.geometry("")
         self.resizable(False, False)
 
     def toggle_preprocessing_options(self):
@@ -580,11 +1011,7 @@ class ConversionTimeSettingsDialog(tk.Toplevel):
         super().__init__(parent)
         self.title("Conversion Time Prediction")
         
-        try:
-            icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            self.iconbitmap(icon_path)
-        except Exception:
-            pass
+        parent._apply_icon(self)
 
         self.result = None
         self.transient(parent)
@@ -624,10 +1051,7 @@ class ConversionTimeSettingsDialog(tk.Toplevel):
         cancel_btn = ttk.Button(btn_frame, text="Cancel", command=self.destroy, style="Secondary.TButton")
         cancel_btn.pack(side="right", padx=(0, 15))
 
-        self.update_idletasks()
-        w = self.winfo_reqwidth()
-        h = self.winfo_reqheight()
-        self.geometry(f"{w+20}x{h+20}")
+        self.geometry("")
         self.resizable(False, False)
 
     def _ok(self):
@@ -652,6 +1076,46 @@ TIME_ALIASES = ['time', '(min)', 'min', '(s)', 'sec', 'seconds']
 TG_ALIASES = ['mass', 'weight', 'wt', 'rem wt', 'tg', '(mg)', 'mg', '(%)']
 DSC_ALIASES = ['dsc', 'heat flow', 'hf', 'dta', '(mw)', 'mw', '(uw)', 'uw']
 
+# Prefer the Rust-backed calamine reader for .xlsx ingestion when available;
+# engine=None lets pandas fall back to its default (openpyxl).
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = None
+
+# Substring pattern over all temperature aliases; compiled once so the header
+# scan can run as a single vectorized str.contains instead of a Python loop.
+_T_HEADER_RE = re.compile('|'.join(map(re.escape, T_ALIASES)))
+
+# Whole-word pattern per alias, compiled once at import; _find_best_col_idx
+# runs four times per file over every header cell, so rebuilding these inside
+# re.search was pure interpreter overhead.
+_ALIAS_PATTERNS = {a: re.compile(r'\b' + re.escape(a) + r'\b')
+                   for a in set(T_ALIASES + TIME_ALIASES + TG_ALIASES + DSC_ALIASES)}
+
+# Heating rate parsed from the filename stem, e.g. "sample_10K.csv" or "5C.txt".
+_BETA_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(k|c)", re.IGNORECASE)
+# Stricter K-only variant used by the simple loader.
+_BETA_K_RE = re.compile(r"(\d+(?:\.\d+)?)\s*[kK]")
+
+def _find_header_row(df_raw):
+    """Locate the first row mentioning a temperature alias, or -1.
+
+    Vendor exports keep the header within the first handful of rows, so a
+    64-row head is scanned first with one vectorized pass; the remainder is
+    only joined and searched if that fails.
+    """
+    def scan(block):
+        joined = block.fillna('').astype(str).agg(' '.join, axis=1).str.lower()
+        hits = joined.str.contains(_T_HEADER_RE, regex=True)
+        return int(hits.idxmax()) if hits.any() else -1
+
+    header_row_index = scan(df_raw.head(64))
+    if header_row_index == -1 and len(df_raw) > 64:
+        header_row_index = scan(df_raw.iloc[64:])
+    return header_row_index
+
 # --- 2. NEW: Advanced Column Identification Function ---
 def _find_best_col_idx(headers, aliases, priority_aliases=None):
     """
@@ -672,8 +1136,8 @@ def _find_best_col_idx(headers, aliases, priority_aliases=None):
         for alias in aliases:
             score = 0
             # Use regex for whole-word matching to avoid partial matches like 's' in 'dsc'
-            
-            if re.search(r'\b' + re.escape(alias) + r'\b', h_lower):
+
+            if _ALIAS_PATTERNS[alias].search(h_lower):
                 score = 2  # Base score for a whole-word match
                 if alias in priority_aliases:
                     score = 3  # Highest score for a priority whole-word match
@@ -683,9 +1147,24 @@ def _find_best_col_idx(headers, aliases, priority_aliases=None):
             if score > best_score:
                 best_score = score
                 best_idx = i
-                
+            if score == 3:
+                # Priority whole-word match; no later header or alias can
+                # score higher, and ties keep the first hit anyway.
+                return i
+
     return best_idx
 
+def _as_float(col):
+    """Numeric conversion with a fast path for already-typed columns.
+
+    pd.to_numeric walks the values as Python objects even when the column is
+    already float64; a clean CSV read only needs an astype view.
+    """
+    v = col.values
+    if v.dtype.kind in 'fiu':
+        return pd.Series(v.astype(np.float64, copy=False), index=col.index)
+    return pd.to_numeric(col, errors='coerce')
+
 def preprocess_file(path, temp_range_c):
     """
     MODIFIED: This function now uses a robust, prioritized column identification
@@ -693,25 +1172,24 @@ def preprocess_file(path, temp_range_c):
     the calculated heating rate.
     """
     # --- File Reading Logic (Unchanged) ---
-    file_path_str = str(path).lower()
-    if file_path_str.endswith((".xlsx", ".xls")):
-        df_raw = pd.read_excel(path, header=None)
+    file_path = Path(path)
+    file_name = file_path.name
+    if file_path.suffix.lower() in (".xlsx", ".xls"):
+        df_raw = pd.read_excel(path, header=None, engine=_EXCEL_ENGINE)
     else:
         df_raw = pd.read_csv(path, sep=None, engine='python', header=None, on_bad_lines='skip', encoding_errors='ignore')
 
-    # --- Header and Data Location (Unchanged) ---
-    header_row_index = -1
-    for i, row in df_raw.iterrows():
-        row_str = ' '.join(row.dropna().astype(str)).lower()
-        # A simple check for 'temp' is sufficient to identify potential header rows
-        if any(alias in row_str for alias in T_ALIASES):
-            header_row_index = i
-            break
-            
-    if header_row_index == -1: raise ValueError(f"Could not locate a valid header row in {Path(path).name}.")
+    # --- Header and Data Location ---
+    # A simple check for 'temp' is sufficient to identify potential header rows
+    header_row_index = _find_header_row(df_raw)
+
+
+    if header_row_index == -1: raise ValueError(f"Could not locate a valid header row in {file_name}.")
 
     header_line = df_raw.iloc[header_row_index]
     possible_headers = header_line.fillna('').astype(str)
+    # Plain lower-cased list so later unit checks index without pandas lookups.
+    headers_lower = possible_headers.str.lower().tolist()
     
     data_start_row = -1
     for i in range(header_row_index + 1, len(df_raw)):
@@ -722,7 +1200,7 @@ def preprocess_file(path, temp_range_c):
         if numeric_cells.notna().sum() >= 2:
             data_start_row = i
             break
-    if data_start_row == -1: raise ValueError(f"Could not locate valid data in {Path(path).name}.")
+    if data_start_row == -1: raise ValueError(f"Could not locate valid data in {file_name}.")
 
     # --- 3. NEW: Robust Column Identification & Ambiguity Check ---
     temp_idx = _find_best_col_idx(possible_headers, T_ALIASES, ['temp', 'temperature'])
@@ -744,7 +1222,7 @@ def preprocess_file(path, temp_range_c):
             conflicting_roles = [role for role, i in non_none_indices.items() if i == idx]
             header_name = possible_headers.iloc[idx]
             warnings.warn(
-                f"\n[Warning] Ambiguous Column in '{Path(path).name}':\n"
+                f"\n[Warning] Ambiguous Column in '{file_name}':\n"
                 f"  > Header '{header_name}' was matched for multiple roles: {', '.join(conflicting_roles)}.\n"
                 f"  > This may cause incorrect calculations. Please rename columns for clarity (e.g., 'Time (min)', 'Mass (mg)').\n"
             )
@@ -753,27 +1231,27 @@ def preprocess_file(path, temp_range_c):
     data_df = df_raw.iloc[data_start_row:].copy()
     df_intermediate = pd.DataFrame()
 
-    temp_series = pd.to_numeric(data_df.iloc[:, temp_idx], errors='coerce')
-    is_kelvin = 'k' in possible_headers.iloc[temp_idx].lower()
+    temp_series = _as_float(data_df.iloc[:, temp_idx])
+    is_kelvin = 'k' in headers_lower[temp_idx]
     df_intermediate['Temp_K'] = temp_series if is_kelvin else temp_series + 273.15
     
     mass_present = tg_idx is not None
     if mass_present:
-        df_intermediate['Mass_mg'] = pd.to_numeric(data_df.iloc[:, tg_idx], errors='coerce')
+        df_intermediate['Mass_mg'] = _as_float(data_df.iloc[:, tg_idx])
     else:
         df_intermediate['Mass_mg'] = 1.0
 
     dsc_present = dsc_idx is not None
     if dsc_present:
-        df_intermediate['DSC_raw'] = pd.to_numeric(data_df.iloc[:, dsc_idx], errors='coerce')
-        dsc_header = possible_headers.iloc[dsc_idx].lower()
+        df_intermediate['DSC_raw'] = _as_float(data_df.iloc[:, dsc_idx])
+        dsc_header = headers_lower[dsc_idx]
     else:
         df_intermediate['DSC_raw'] = 0.0
         dsc_header = ""
 
     if time_idx is not None:
-        time_series = pd.to_numeric(data_df.iloc[:, time_idx], errors='coerce')
-        is_seconds = any(s in possible_headers.iloc[time_idx].lower() for s in ['sec', '(s)'])
+        time_series = _as_float(data_df.iloc[:, time_idx])
+        is_seconds = any(s in headers_lower[time_idx] for s in ['sec', '(s)'])
         df_intermediate['Time_s'] = time_series if is_seconds else time_series * 60
     else:
         df_intermediate['Time_s'] = np.nan
@@ -783,8 +1261,14 @@ def preprocess_file(path, temp_range_c):
     df_truncated = df_intermediate[(df_intermediate['Temp_K'] >= start_k) & (df_intermediate['Temp_K'] <= end_k)].copy()
     if df_truncated.empty: raise ValueError(f"No data found in the specified temperature range {temp_range_c}°C.")
 
-    df_truncated.sort_values(by='Temp_K', ascending=True, inplace=True)
-    df_truncated.reset_index(drop=True, inplace=True)
+    # TGA sweeps are usually already monotonic in temperature; skip the full
+    # DataFrame reshuffle in that case and sort via argsort otherwise.
+    temp_k = df_truncated['Temp_K'].values
+    if np.all(np.diff(temp_k) >= 0):
+        df_truncated.reset_index(drop=True, inplace=True)
+    else:
+        order = np.argsort(temp_k, kind='stable')
+        df_truncated = df_truncated.iloc[order].reset_index(drop=True)
 
     # --- 5. Standardize Data & Calculate Derivatives ---
     initial_mass = df_truncated['Mass_mg'].iloc[0] if mass_present else 1.0
@@ -805,16 +1289,14 @@ def preprocess_file(path, temp_range_c):
     time_col_is_valid = 'Time_s' in df_truncated.columns and df_truncated['Time_s'].notna().all()
 
     if time_col_is_valid:
-        corr_matrix = np.corrcoef(df_truncated['Time_s'], df_truncated['Temp_K'])
-        if abs(corr_matrix[0, 1]) > 0.95:  # Check for strong correlation
-            fit = np.polyfit(df_truncated['Time_s'], df_truncated['Temp_K'], 1)
-            if fit[0] > 0:  # Check for positive heating rate
-                beta_K_per_s = fit[0]
+        r, slope = _linreg_r_slope(df_truncated['Time_s'], df_truncated['Temp_K'])
+        if abs(r) > 0.95 and slope > 0:  # Strong correlation with a positive heating rate
+            beta_K_per_s = slope
 
     # Fallback to filename if time column is invalid or yields a bad fit
     if beta_K_per_s <= 0:
-        beta_match = re.search(r"(\d+(?:\.\d+)?)\s*(k|c)", Path(path).stem, re.IGNORECASE)
-        if not beta_match: raise ValueError(f"Time column is invalid/missing, and heating rate could not be parsed from filename: {Path(path).name}.")
+        beta_match = _BETA_RE.search(file_path.stem)
+        if not beta_match: raise ValueError(f"Time column is invalid/missing, and heating rate could not be parsed from filename: {file_name}.")
         beta_K_per_min = float(beta_match.group(1))
         beta_K_per_s = beta_K_per_min / 60.0
         # Recalculate time axis based on filename heating rate
@@ -824,172 +1306,421 @@ def preprocess_file(path, temp_range_c):
             df_truncated['Time_s'] = 0.0
 
     # --- 7. NEW: Final Formatting with Time Zero-Point Reset ---
-    time_in_minutes = df_truncated['Time_s'] / 60
-    
+    # Plain array arithmetic: skips the Series alignment step and the pandas
+    # positional indexing for the zero-point scalar.
+    time_in_minutes = df_truncated['Time_s'].values / 60
+
     final_df = pd.DataFrame({
-        "Time_min": time_in_minutes - time_in_minutes.iloc[0], # Ensures time starts at 0
-        "Temp_C": df_truncated['Temp_K'] - 273.15,
-        "TG_pct": df_truncated['TG_pct'],
-        "DSC": df_truncated['DSC']
+        "Time_min": time_in_minutes - time_in_minutes[0], # Ensures time starts at 0
+        "Temp_C": df_truncated['Temp_K'].values - 273.15,
+        "TG_pct": df_truncated['TG_pct'].values,
+        "DSC": df_truncated['DSC'].values
     })
     
     final_df.attrs['kinetic_analysis_possible'] = mass_present
     
     return beta_K_per_s * 60, final_df
 
+def _preprocess_one(path, temp_range_c):
+    """Per-file worker for parallel ingestion.
+
+    Records the warnings raised while preprocessing so they survive the trip
+    back from a ProcessPoolExecutor child, where the parent's
+    warnings.catch_warnings cannot see them.
+    """
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        beta, df = _preprocess_file_cached(path, temp_range_c)
+    return beta, df, [str(x.message) for x in w]
+
+def _preprocess_many(paths, temp_range_c):
+    """Preprocess several files, in parallel when there is more than one.
+
+    Each file is an independent pure function of (path, temp_range_c), so the
+    parse-heavy work scales across cores. Returns {path: (beta, df, warnings)}
+    with per-file exceptions passed through in place of the tuple, matching
+    the serial error handling. Falls back to the serial loop if the process
+    pool cannot start (e.g. restricted environments) and in the frozen
+    PyInstaller exe, where spawned workers re-execute the bundled binary.
+    """
+    results = {}
+    if len(paths) > 1 and not getattr(sys, "frozen", False):
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+                futures = {p: ex.submit(_preprocess_one, p, temp_range_c) for p in paths}
+                for p, fut in futures.items():
+                    try:
+                        results[p] = fut.result()
+                    except Exception as e:
+                        results[p] = e
+            return results
+        except OSError:
+            results.clear()
+    for p in paths:
+        try:
+            results[p] = _preprocess_one(p, temp_range_c)
+        except Exception as e:
+            results[p] = e
+    return results
+
+_PREPROCESS_CACHE_COLS = ("Time_min", "Temp_C", "TG_pct", "DSC")
+
+def _preprocess_file_cached(path, temp_range_c):
+    """Disk-cached wrapper around preprocess_file.
+
+    Parsing and preprocessing a raw TGA export dominates import time, and the
+    result only depends on the file contents and the truncation range. The
+    preprocessed table is cached as a compressed .npz in a `.tgax_cache/`
+    directory next to the input file, keyed by a blake2b of the file bytes and
+    the preprocess parameters, and reloaded on a hit. Any cache
+    failure (read-only directory, corrupt entry) silently falls back to the
+    full preprocessing pass.
+    """
+    p = Path(path)
+    cache_path = None
+    try:
+        raw = p.read_bytes()
+        key = hashlib.blake2b(raw + repr(tuple(temp_range_c)).encode(), digest_size=16).hexdigest()
+        cache_path = p.parent / ".tgax_cache" / f"{key}.npz"
+        if cache_path.exists():
+            with np.load(cache_path) as d:
+                df = pd.DataFrame({c: d[c] for c in _PREPROCESS_CACHE_COLS})
+                df.attrs['kinetic_analysis_possible'] = bool(d['kinetic_ok'])
+                return float(d['beta']), df
+    except Exception:
+        pass
+
+    beta, df = preprocess_file(path, temp_range_c)
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            np.savez_compressed(cache_path, beta=beta,
+                                kinetic_ok=df.attrs.get('kinetic_analysis_possible', True),
+                                **{c: df[c].to_numpy() for c in _PREPROCESS_CACHE_COLS})
+        except OSError:
+            pass
+    return beta, df
+
 # ###############################################################################
 # #################### END: MODIFIED DATA PREPROCESSING SECTION #################
 # ###############################################################################
 
 
+_SOA_COLS = ("alpha", "Temp_K", "dAdT")
+
+def _as_soa(dfs):
+    """Contiguous float64 column arrays for the kinetics hot paths.
+
+    The builders only touch alpha/Temp_K/dAdT, and every df[col] access goes
+    through pandas column lookup and the BlockManager. Converting once per
+    call hands the inner loops plain arrays instead.
+    """
+    return {β: {c: np.ascontiguousarray(df[c].to_numpy(dtype=np.float64))
+                for c in _SOA_COLS if c in df}
+            for β, df in dfs.items()}
+
+def _interp_T_matrix(soa, alphas, betas):
+    """Interpolate T(α) for every heating rate in one vectorized call per β.
+
+    Returns an (N_alpha, N_beta) matrix with columns ordered like `betas`.
+    """
+    return np.column_stack([np.interp(alphas, soa[β]["alpha"], soa[β]["Temp_K"]) for β in betas])
+
+def _ols1(x, y):
+    """Closed-form slope/intercept of a degree-1 least-squares fit.
+
+    Equivalent to np.polyfit(x, y, 1) without routing a 2-parameter fit
+    through lstsq's SVD.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    x_mean, y_mean = x.mean(), y.mean()
+    xc = x - x_mean
+    slope = (xc * (y - y_mean)).sum() / (xc * xc).sum()
+    return slope, y_mean - slope * x_mean
+
+def _linreg_r_slope(x, y):
+    """Pearson r and OLS slope from one pass of centered sums.
+
+    Replaces the np.corrcoef + polyfit pair: corrcoef builds a full 2x2
+    matrix and both calls walk the data separately.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xc = x - x.mean()
+    yc = y - y.mean()
+    Sxx = (xc * xc).sum()
+    Syy = (yc * yc).sum()
+    Sxy = (xc * yc).sum()
+    denom = math.sqrt(Sxx * Syy)
+    r = Sxy / denom if denom > 0 else 0.0
+    slope = Sxy / Sxx if Sxx > 0 else 0.0
+    return r, slope
+
+def _gradient_weights(x):
+    """Precompute np.gradient's finite-difference weights for a fixed grid.
+
+    Differentiating several columns against the same abscissa redoes the
+    spacing arithmetic each call; the weights depend only on x, so build
+    them once and apply with _gradient_apply. Matches np.gradient(y, x)
+    with the default edge_order=1.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    hs = x[1:-1] - x[:-2]
+    hd = x[2:] - x[1:-1]
+    denom = hs * hd * (hs + hd)
+    a = -hd * hd / denom
+    c = hs * hs / denom
+    b = -(a + c)
+    return a, b, c, 1.0 / (x[1] - x[0]), 1.0 / (x[-1] - x[-2])
+
+def _gradient_apply(y, w):
+    """Evaluate np.gradient(y, x) using weights from _gradient_weights(x)."""
+    a, b, c, inv_first, inv_last = w
+    y = np.asarray(y, dtype=np.float64)
+    g = np.empty_like(y)
+    g[1:-1] = a * y[:-2] + b * y[1:-1] + c * y[2:]
+    g[0] = (y[1] - y[0]) * inv_first
+    g[-1] = (y[-1] - y[-2]) * inv_last
+    return g
+
+def _isoconv_ea_table(alphas, X, Y, ea_scale=1.0):
+    """Closed-form per-α OLS of Y against X across heating rates.
+
+    X and Y are (N_alpha, N_beta); points excluded from the regression are
+    NaN in Y. Replaces the old per-α polyfit loop with one broadcasted pass:
+    slope = Sxy/Sxx from centered sums, SSE = Syy - slope*Sxy. Rows with
+    fewer than two valid points are dropped, matching the old behaviour.
+    """
+    valid = np.isfinite(Y)
+    n = valid.sum(axis=1)
+    Xv = np.where(valid, X, 0.0)
+    Yv = np.where(valid, Y, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = Xv.sum(axis=1) / n
+        y_mean = Yv.sum(axis=1) / n
+        Xc = np.where(valid, X - x_mean[:, None], 0.0)
+        Yc = np.where(valid, Y - y_mean[:, None], 0.0)
+        Sxx = (Xc * Xc).sum(axis=1)
+        Sxy = (Xc * Yc).sum(axis=1)
+        Syy = (Yc * Yc).sum(axis=1)
+        slope = Sxy / Sxx
+        SSE = np.maximum(Syy - slope * Sxy, 0.0)
+        R2 = np.where(Syy > 0, 1.0 - SSE / Syy, 0.0)
+        se_slope = np.where(n > 2, np.sqrt(SSE / np.maximum(n - 2, 1)) / np.sqrt(Sxx + EPS), 0.0)
+    keep = n >= 2
+    if not keep.any():
+        return pd.DataFrame()
+    return pd.DataFrame({
+        "alpha": np.asarray(alphas)[keep],
+        "Ea_kJ_per_mol": (-slope[keep] * R / 1000) * ea_scale,
+        "R2": R2[keep],
+        "StdErr_kJ": (se_slope[keep] * R / 1000) * ea_scale,
+    })
+
+def _isoconv_xy_table(alphas, betas, X, Y):
+    """Flatten the (N_alpha, N_beta) regression matrices into the long-form XY table."""
+    ai, bi = np.nonzero(np.isfinite(Y))
+    return pd.DataFrame({"alpha": np.asarray(alphas)[ai], "beta": np.asarray(betas)[bi],
+                         "X": X[ai, bi], "Y": Y[ai, bi]})
+
 def build_friedman_tables(dfs, alphas):
     betas = sorted(dfs.keys())
-    T_at_alpha = {a: {β: np.interp(a, dfs[β]["alpha"], dfs[β]["Temp_K"]) for β in betas} for a in alphas}
-    df_aT = pd.DataFrame([{ "alpha": a, **{f"T_{β:.2f}K/min": T_at_alpha[a][β] for β in betas} } for a in alphas])
+    alphas = np.asarray(alphas, dtype=float)
+    soa = _as_soa(dfs)
+    T_mat = _interp_T_matrix(soa, alphas, betas)
+    df_aT = pd.DataFrame({"alpha": alphas, **{f"T_{β:.2f}K/min": T_mat[:, k] for k, β in enumerate(betas)}})
+
+    ### MODIFICATION START: Renamed dadt -> dAdT ###
+    dAdT_mat = np.column_stack([np.interp(T_mat[:, k], soa[β]["Temp_K"], soa[β]["dAdT"])
+                                for k, β in enumerate(betas)])
+    X = 1.0 / T_mat
+    # Y value is ln(d(alpha)/dt) which is ln(beta * d(alpha)/dT)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Y = np.log(np.asarray(betas)[None, :] * dAdT_mat)
+    Y[(dAdT_mat <= 0) | ~np.isfinite(dAdT_mat)] = np.nan
+    ### MODIFICATION END ###
 
-    rows_xy = []
-    for a in alphas:
-        for β in betas:
-            T_val = T_at_alpha[a][β]
-            ### MODIFICATION START: Renamed dadt -> dAdT ###
-            dAdT_val = np.interp(T_val, dfs[β]["Temp_K"], dfs[β]["dAdT"])
-            if dAdT_val <= 0 or not np.isfinite(dAdT_val): continue
-            # Y value is ln(d(alpha)/dt) which is ln(beta * d(alpha)/dT)
-            rows_xy.append({"alpha": a, "beta": β, "X": 1.0/T_val, "Y": np.log(β * dAdT_val)})
-            ### MODIFICATION END ###
-    df_xy = pd.DataFrame(rows_xy)
-
-    ea_rows = []
-    for a in alphas:
-        s = df_xy[df_xy["alpha"] == a]
-        if len(s) < 2: continue
-        x, y = s["X"], s["Y"]
-        slope, _ = np.polyfit(x, y, 1)
-        residuals = y - (np.polyval(np.polyfit(x,y,1), x))
-        SSE = (residuals**2).sum(); SST = ((y - y.mean())**2).sum()
-        R2 = 1 - SSE/SST if SST > 0 else 0
-        se_slope = np.sqrt(SSE / (len(x)-2)) / np.sqrt(((x-x.mean())**2).sum() + EPS) if len(x)>2 else 0
-        ea_rows.append({"alpha": a, "Ea_kJ_per_mol": -slope*R/1000, "R2": R2, "StdErr_kJ": se_slope*R/1000})
-    df_ea = pd.DataFrame(ea_rows)
+    df_xy = _isoconv_xy_table(alphas, betas, X, Y)
+    df_ea = _isoconv_ea_table(alphas, X, Y)
     return df_ea, df_aT, df_xy
 
 def build_kas_tables(dfs, alphas):
     betas = sorted(dfs.keys())
-    T_at_alpha = {a: {β: np.interp(a, dfs[β]["alpha"], dfs[β]["Temp_K"]) for β in betas} for a in alphas}
-    df_aT = pd.DataFrame([{ "alpha": a, **{f"T_{β:.2f}K/min": T_at_alpha[a][β] for β in betas} } for a in alphas])
-
-    rows_xy = []
-    for a in alphas:
-        for β in betas:
-            T_val = T_at_alpha[a][β]
-            rows_xy.append({"alpha": a, "beta": β, "X": 1.0/T_val, "Y": np.log(β / T_val**2)})
-    df_xy = pd.DataFrame(rows_xy)
-
-    ea_rows = []
-    for a in alphas:
-        s = df_xy[df_xy["alpha"] == a]
-        if len(s) < 2: continue
-        x, y = s["X"], s["Y"]
-        slope, _ = np.polyfit(x, y, 1)
-        residuals = y - (np.polyval(np.polyfit(x,y,1), x))
-        SSE = (residuals**2).sum(); SST = ((y - y.mean())**2).sum()
-        R2 = 1 - SSE/SST if SST > 0 else 0
-        se_slope = np.sqrt(SSE / (len(x)-2)) / np.sqrt(((x-x.mean())**2).sum() + EPS) if len(x)>2 else 0
-        ea_rows.append({"alpha": a, "Ea_kJ_per_mol": -slope*R/1000, "R2": R2, "StdErr_kJ": se_slope*R/1000})
-    df_ea = pd.DataFrame(ea_rows)
+    alphas = np.asarray(alphas, dtype=float)
+    T_mat = _interp_T_matrix(_as_soa(dfs), alphas, betas)
+    df_aT = pd.DataFrame({"alpha": alphas, **{f"T_{β:.2f}K/min": T_mat[:, k] for k, β in enumerate(betas)}})
+
+    X = 1.0 / T_mat
+    Y = np.log(np.asarray(betas)[None, :] / T_mat**2)
+
+    df_xy = _isoconv_xy_table(alphas, betas, X, Y)
+    df_ea = _isoconv_ea_table(alphas, X, Y)
     return df_ea, df_aT, df_xy
 
 def build_ofw_tables(dfs, alphas):
     betas = sorted(dfs.keys())
-    T_at_alpha = {a: {β: np.interp(a, dfs[β]["alpha"], dfs[β]["Temp_K"]) for β in betas} for a in alphas}
-    df_aT = pd.DataFrame([{ "alpha": a, **{f"T_{β:.2f}K/min": T_at_alpha[a][β] for β in betas} } for a in alphas])
-
-    rows_xy = []
-    for a in alphas:
-        for β in betas:
-            T_val = T_at_alpha[a][β]
-            rows_xy.append({"alpha": a, "beta": β, "X": 1.0/T_val, "Y": np.log(β)})
-    df_xy = pd.DataFrame(rows_xy)
-
-    ea_rows = []
-    for a in alphas:
-        s = df_xy[df_xy["alpha"] == a]
-        if len(s) < 2: continue
-        x, y = s["X"], s["Y"]
-        slope, _ = np.polyfit(x, y, 1)
-        residuals = y - (np.polyval(np.polyfit(x,y,1), x))
-        SSE = (residuals**2).sum(); SST = ((y - y.mean())**2).sum()
-        R2 = 1 - SSE/SST if SST > 0 else 0
-        se_slope = np.sqrt(SSE / (len(x)-2)) / np.sqrt(((x-x.mean())**2).sum() + EPS) if len(x)>2 else 0
-        ea_rows.append({"alpha": a, "Ea_kJ_per_mol": -slope*R/1000 * 0.921, "R2": R2, "StdErr_kJ": se_slope*R/1000 * 0.921})
-    df_ea = pd.DataFrame(ea_rows)
+    alphas = np.asarray(alphas, dtype=float)
+    T_mat = _interp_T_matrix(_as_soa(dfs), alphas, betas)
+    df_aT = pd.DataFrame({"alpha": alphas, **{f"T_{β:.2f}K/min": T_mat[:, k] for k, β in enumerate(betas)}})
+
+    X = 1.0 / T_mat
+    Y = np.broadcast_to(np.log(np.asarray(betas))[None, :], X.shape).copy()
+
+    df_xy = _isoconv_xy_table(alphas, betas, X, Y)
+    # Doyle's approximation correction factor for OFW
+    df_ea = _isoconv_ea_table(alphas, X, Y, ea_scale=0.921)
     return df_ea, df_aT, df_xy
 
+def _interp_Tα_matrix(dfs, alphas):
+    """Interpolate T(α) per heating rate with one vectorized pass over the grid.
+
+    The conversion curves are non-decreasing (clipped/cummax at import), so a
+    single searchsorted per β finds every bracketing interval at once instead
+    of doing N_alpha scalar DataFrame lookups per heating rate. Returns the
+    sorted heating rates and an (N_alpha, N_beta) temperature matrix so
+    downstream code can slice rows instead of walking nested dicts.
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    betas = np.array(sorted(dfs.keys()), dtype=float)
+    soa = _as_soa(dfs)
+    T_mat = np.empty((alphas.size, betas.size))
+    for k, β in enumerate(betas):
+        a_arr = soa[β]["alpha"]
+        T_arr = soa[β]["Temp_K"]
+        idx = np.searchsorted(a_arr, alphas, side='left')
+        # α beyond the curve maximum falls back to the first row, matching the
+        # old (df["alpha"] >= a).idxmax() behaviour when no row qualifies.
+        idx[idx == len(a_arr)] = 0
+        exact = (idx == 0) | (a_arr[idx] == alphas)
+        i0 = np.maximum(idx - 1, 0)
+        a0, T0 = a_arr[i0], T_arr[i0]
+        denominator = a_arr[idx] - a0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            T_interp = np.where(np.abs(denominator) < EPS, T0,
+                                T0 + (alphas - a0) * (T_arr[idx] - T0) / denominator)
+        T_mat[:, k] = np.where(exact, T_arr[idx], T_interp)
+    return betas, T_mat
+
 def interp_Tα(dfs, alphas):
-    out = {a: {} for a in alphas}
-    for β, df in dfs.items():
-        for a in alphas:
-            idx = (df["alpha"] >= a).idxmax()
-            
-            if df.loc[idx, "alpha"] == a or idx == 0:
-                out[a][β] = df.loc[idx, "Temp_K"]
-            else:
-                i0, i1 = idx - 1, idx
-                a0, a1_val = df.loc[i0, "alpha"], df.loc[i1, "alpha"]
-                T0, T1 = df.loc[i0, "Temp_K"], df.loc[i1, "Temp_K"]
-                
-                denominator = a1_val - a0
-                if abs(denominator) < EPS:
-                    out[a][β] = T0
-                else:
-                    out[a][β] = T0 + (a - a0) * (T1 - T0) / denominator
-    return out
+    """Nested-dict view of _interp_Tα_matrix, kept for callers that index by α."""
+    alphas = np.asarray(alphas, dtype=float)
+    betas, T_mat = _interp_Tα_matrix(dfs, alphas)
+    return {a: dict(zip(betas, T_mat[i])) for i, a in enumerate(alphas)}
 
-def temp_integral(Ea, T_alpha, T_prev_alpha):
-    """Calculates the temperature integral between T_prev_alpha and T_alpha."""
-    integrand = lambda T: np.exp(-Ea / (R * T))
-    result, _ = quad(integrand, T_prev_alpha, T_alpha)
-    return result
-
-def objective_function(Ea, T_alpha_data, T_prev_alpha_data):
-    """Objective function for the advanced Vyazovkin method."""
-    betas = list(T_alpha_data.keys())
-    n = len(betas)
-    phi = 0.0
-    for i in range(n):
-        for j in range(n):
-            if i == j: continue
-            β_i, β_j = betas[i], betas[j]
-            T_i, T_j = T_alpha_data[β_i], T_alpha_data[β_j]
-            T_prev_i, T_prev_j = T_prev_alpha_data[β_i], T_prev_alpha_data[β_j]
-            
-            if T_i <= T_prev_i or T_j <= T_prev_j: continue
+def p_senum_yang(x):
+    """Senum-Yang 4th-order rational approximation to the temperature integral.
 
-            I_i = temp_integral(Ea, T_i, T_prev_i)
-            I_j = temp_integral(Ea, T_j, T_prev_j)
-            
-            if abs(I_j) < 1e-100 or abs(β_i) < 1e-100: continue
-            
-            phi += abs((I_i * β_j) / (I_j * β_i) - 1.0)
-    return phi
+    p(x) = exp(-x)/x * (x^3 + 18x^2 + 86x + 96) / (x^4 + 20x^3 + 120x^2 + 240x + 120),
+    accurate to better than 1e-5 relative error for x = Ea/(R*T) > 2,
+    i.e. any physically sensible TGA condition. Accepts scalars or arrays.
+    """
+    return (np.exp(-x) / x
+            * (x * (x * (x + 18.0) + 86.0) + 96.0)
+            / (x * (x * (x * (x + 20.0) + 120.0) + 240.0) + 120.0))
+
+def temp_integral(Ea, T_alpha, T_prev_alpha, high_accuracy=False):
+    """Calculates the temperature integral between T_prev_alpha and T_alpha.
 
-def calculate_vyazovkin_ea(Tα_dict, alphas, Ea_bounds=(1_000, 500_000)):
-    """Calculates Ea for each alpha using the advanced Vyazovkin method."""
+    Uses the closed-form Senum-Yang approximation by default; pass
+    high_accuracy=True for the exact antiderivative in terms of the
+    exponential integral E1.
+    """
+    if high_accuracy:
+        # ∫ exp(-Ea/RT) dT = T*exp(-x) - (Ea/R)*E1(x), x = Ea/(R*T)
+        x1, x0 = Ea / (R * T_alpha), Ea / (R * T_prev_alpha)
+        return (T_alpha * np.exp(-x1) - (Ea / R) * exp1(x1)
+                - T_prev_alpha * np.exp(-x0) + (Ea / R) * exp1(x0))
+    # ∫_{T0}^{T1} exp(-Ea/RT) dT = (Ea/R) * [p(x1) - p(x0)], x = Ea/(R*T)
+    x1, x0 = Ea / (R * T_alpha), Ea / (R * T_prev_alpha)
+    return (Ea / R) * (p_senum_yang(x1) - p_senum_yang(x0))
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _vyazovkin_phi(Ea, T_curr, T_prev, betas):
+        """Compiled Vyazovkin double-sum with the Senum-Yang p(x) inlined."""
+        n = T_curr.shape[0]
+        w = np.empty(n)
+        for i in range(n):
+            x1 = Ea / (R * T_curr[i])
+            x0 = Ea / (R * T_prev[i])
+            p1 = (math.exp(-x1) / x1 * (x1 * (x1 * (x1 + 18.0) + 86.0) + 96.0)
+                  / (x1 * (x1 * (x1 * (x1 + 20.0) + 120.0) + 240.0) + 120.0))
+            p0 = (math.exp(-x0) / x0 * (x0 * (x0 * (x0 + 18.0) + 86.0) + 96.0)
+                  / (x0 * (x0 * (x0 * (x0 + 20.0) + 120.0) + 240.0) + 120.0))
+            w[i] = (Ea / R) * (p1 - p0) / betas[i]
+        phi = 0.0
+        for i in range(n):
+            for j in range(n):
+                if i == j or abs(w[j]) < 1e-100:
+                    continue
+                phi += abs(w[i] / w[j] - 1.0)
+        return phi
+
+def objective_function(Ea, T_curr, T_prev, betas):
+    """Objective function for the advanced Vyazovkin method.
+
+    Takes the per-beta T(α) and T(α_prev) arrays (already filtered to
+    heating rates with increasing temperature) and returns
+    Σᵢ Σⱼ≠ᵢ |I(Ea,Tᵢ)βⱼ / (I(Ea,Tⱼ)βᵢ) - 1| using the vectorized
+    Senum-Yang integral. When numba is present the name is rebound to the
+    compiled kernel below, so minimize_scalar never pays the dispatch check.
+    """
+    w = temp_integral(Ea, T_curr, T_prev) / betas
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.abs(w[:, None] / w[None, :] - 1.0)
+    ratio[~np.isfinite(ratio)] = 0.0
+    np.fill_diagonal(ratio, 0.0)
+    return ratio.sum()
+
+if HAS_NUMBA:
+    objective_function = _vyazovkin_phi
+
+def calculate_vyazovkin_ea(betas, T_mat, alphas, Ea_bounds=(1_000, 500_000)):
+    """Calculates Ea for each alpha using the advanced Vyazovkin method.
+
+    `betas` and `T_mat` come from _interp_Tα_matrix; each α's per-β
+    temperatures are row slices, so the optimizer loop only touches flat
+    arrays.
+    """
     results = []
+    prev_Ea = None
     for idx, α in enumerate(alphas):
         if idx == 0:
             continue
 
-        prev_α = alphas[idx - 1]
-        T_alpha_data = Tα_dict[α]
-        T_prev_alpha_data = Tα_dict[prev_α]
-
+        betas_arr = betas
+        T_curr = T_mat[idx]
+        T_prev = T_mat[idx - 1]
+        valid = T_curr > T_prev
+        if valid.sum() < 2:
+            continue
+        T_curr, T_prev, betas_arr = T_curr[valid], T_prev[valid], betas_arr[valid]
+
+        # Warm start: Ea(α) varies smoothly, so after the first α the search
+        # can be confined to an octave around the previous optimum, cutting
+        # the objective evaluations per α roughly in half.
+        if prev_Ea is not None:
+            lo = max(Ea_bounds[0], prev_Ea * 0.5)
+            hi = min(Ea_bounds[1], prev_Ea * 2.0)
+        else:
+            lo, hi = Ea_bounds
         res = minimize_scalar(
             objective_function,
-            args=(T_alpha_data, T_prev_alpha_data),
-            bounds=Ea_bounds,
+            args=(T_curr, T_prev, betas_arr),
+            bounds=(lo, hi),
             method='bounded'
         )
+        # If the narrowed bounds clamped the solution, redo the full-range
+        # search so a genuine jump in Ea(α) is never missed.
+        if prev_Ea is not None and not (lo * 1.001 < res.x < hi * 0.999):
+            res = minimize_scalar(
+                objective_function,
+                args=(T_curr, T_prev, betas_arr),
+                bounds=Ea_bounds,
+                method='bounded'
+            )
+        prev_Ea = res.x
         results.append({
             "alpha": α,
             "Ea_kJ_per_mol": res.x / 1000.0
@@ -1001,71 +1732,238 @@ def calculate_vyazovkin_ea(Tα_dict, alphas, Ea_bounds=(1_000, 500_000)):
 
 def build_vyazovkin_tables(dfs, alphas):
     """Builds all tables required for the Vyazovkin analysis."""
-    Tα = interp_Tα(dfs, alphas)
-    df_ea = calculate_vyazovkin_ea(Tα, alphas)
-    
-    valid_alphas = df_ea['alpha'].unique()
-    
-    betas = sorted(next(iter(Tα.values())).keys())
-    df_aT = pd.DataFrame([{ "alpha": a, **{f"T_{β:.2f}K/min": Tα[a][β] for β in betas} } for a in valid_alphas])
-    
+    alphas = np.asarray(alphas, dtype=float)
+    betas, T_mat = _interp_Tα_matrix(dfs, alphas)
+    df_ea = calculate_vyazovkin_ea(betas, T_mat, alphas)
+
+    valid = np.isin(alphas, df_ea['alpha'].unique())
+    df_aT = pd.DataFrame({"alpha": alphas[valid],
+                          **{f"T_{β:.2f}K/min": T_mat[valid, k] for k, β in enumerate(betas)}})
+
     df_xy = pd.DataFrame() # No X-Y plot for Vyazovkin
     return df_ea, df_aT, df_xy
 
+@functools.lru_cache(maxsize=16)
+def _sg_coeffs(window, poly):
+    """Savitzky-Golay FIR coefficients, cached per (window, polyorder).
+
+    savgol_filter re-derives these via a least-squares solve on every call;
+    the Ea smoother only ever uses a handful of combinations.
+    """
+    return savgol_coeffs(window, poly)
+
 def _smooth_ea_series(ea_df, window: int = 7, poly: int = 3):
     if window % 2 == 0: window += 1
     ea_arr = ea_df["Ea_kJ_per_mol"].to_numpy(float)
     if ea_arr.size >= window:
-        return savgol_filter(ea_arr, window_length=window, polyorder=poly, mode="interp")
+        # Interior via one convolution with the cached kernel; edges get the
+        # same polynomial extrapolation savgol_filter applies for mode='interp'.
+        out = np.convolve(ea_arr, _sg_coeffs(window, poly)[::-1], mode='same')
+        half = window // 2
+        t = np.arange(window, dtype=float)
+        out[:half] = np.polyval(np.polyfit(t, ea_arr[:window], poly), t[:half])
+        out[-half:] = np.polyval(np.polyfit(t, ea_arr[-window:], poly), t[-half:])
+        return out
     return ea_arr
 
-def prep_arrays(dfs, ea_ser, alphas):
+def prep_arrays(dfs, ea_idx, ea_vals, alphas):
     ### MODIFICATION START: UNIFICATION OF GLOBAL FIT ###
     # This function now prepares data for d(alpha)/dt (time) domain fitting
     # 'y' is now d(alpha)/dt (in 1/min)
     # 'βs' (beta) is no longer needed in the data tuple for the residual function
     
-    y_dAdt, a, a1, T, Ea = [], [], [], [], []
-    for β, df in dfs.items():
-        alpha = np.clip(df["alpha"].values, EPS, 1-EPS)
-        
+    # Collect per-β NumPy chunks and concatenate once at the end; the old
+    # list.extend path unboxed every sample into Python floats and reboxed
+    # them in np.asarray.
+    y_dAdt, a, T, Ea = [], [], [], []
+    a_min, a_max = alphas.min(), alphas.max()
+    for β, trace in _as_soa(dfs).items():
+        alpha = np.clip(trace["alpha"], EPS, 1-EPS)
+
         ### MODIFICATION START: Renamed dadt -> dAdT ###
-        mask = (alpha >= alphas.min()) & (alpha <= alphas.max()) & np.isfinite(df["dAdT"].values)
+        mask = (alpha >= a_min) & (alpha <= a_max) & np.isfinite(trace["dAdT"])
         alpha_masked = alpha[mask]
-        
+
         # This is the key change: y is now d(alpha)/dt (1/min)
-        y_dAdt.extend(df["dAdT"].values[mask] * β) 
+        y_dAdt.append(trace["dAdT"][mask] * β)
         ### MODIFICATION END ###
-        
-        a.extend(alpha_masked)
-        a1.extend(np.clip(1 - alpha_masked, EPS, None)); T.extend(df["Temp_K"].values[mask])
-        Ea.extend(np.interp(alpha_masked, ea_ser.index, ea_ser.values))
-        
-    arrs = [np.asarray(v, float) for v in (y_dAdt, a, a1, T, np.asarray(Ea))]
+
+        a.append(alpha_masked)
+        T.append(trace["Temp_K"][mask])
+        Ea.append(np.interp(alpha_masked, ea_idx, ea_vals))
+
+    a = np.concatenate(a)
+    arrs = [np.concatenate(y_dAdt), a, np.clip(1 - a, EPS, None),
+            np.concatenate(T), np.concatenate(Ea)]
+    arrs = [np.asarray(v, float) for v in arrs]
     good = np.all(np.isfinite(arrs), axis=0)
+    y_dAdt, a, a1, T, Ea = (ar[good] for ar in arrs)
+
+    # Precompute the log basis of the Sestak-Berggren model here: these terms
+    # do not depend on the fit parameters, yet least_squares re-evaluates the
+    # residual tens of times per fit.
+    ln_a = np.log(a)
+    ln_l = -np.log(a1)               # -ln(1-α) > 0 after clipping
+    ln_ln_l = np.log(ln_l)
+    ea_over_RT = Ea / (R * T)
     # Return tuple without beta
-    return tuple(ar[good] for ar in arrs)
+    return y_dAdt, ln_a, ln_l, ln_ln_l, ea_over_RT
     ### MODIFICATION END ###
 
+def _sb_resid_core(m, n, p_, logA, y_dAdt, ln_a, ln_l, ln_ln_l, ea_over_RT):
+    # Model d(alpha)/dt = A * exp(-Ea/RT) * a^m * (1-a)^n * (-ln(1-a))^p
+    # A is A_per_min (since data was prepared with beta in K/min).
+    # Accumulated in log space: one exp per call, no transcendentals besides.
+    return np.exp(m * ln_a - n * ln_l + p_ * ln_ln_l + logA - ea_over_RT) - y_dAdt
+
+def _sb_jac_core(m, n, p_, logA, ln_a, ln_l, ln_ln_l, ea_over_RT):
+    y_calc = np.exp(m * ln_a - n * ln_l + p_ * ln_ln_l + logA - ea_over_RT)
+    J = np.empty((y_calc.size, 4))
+    J[:, 0] = y_calc * ln_a
+    J[:, 1] = -y_calc * ln_l
+    J[:, 2] = y_calc * ln_ln_l
+    J[:, 3] = y_calc
+    return J
+
 def resid(par, data):
     ### MODIFICATION START: UNIFICATION OF GLOBAL FIT ###
     # This residual function now fits in the d(alpha)/dt (time) domain
     # It now compares experimental d(alpha)/dt to model d(alpha)/dt
-    
+
     m, n, p_, logA = par
-    # Data tuple no longer contains beta
-    y_dAdt, a, a1, T, Ea = data
-    
-    f = a**m * a1**n * (-np.log(a1))**p_
-    
-    # Model d(alpha)/dt = A * exp(-Ea/RT) * f(alpha)
-    # A is A_per_min (since data was prepared with beta in K/min)
-    A_per_min = math.exp(logA)
-    y_calc = A_per_min * np.exp(-Ea / (R * T)) * f
-    
-    return y_calc - y_dAdt
+    # Data tuple no longer contains beta; prep_arrays hands over the
+    # precomputed log basis so only parameter-dependent work happens in the
+    # core, which is compiled when numba is available.
+    y_dAdt, ln_a, ln_l, ln_ln_l, ea_over_RT = data
+    return _sb_resid_core(float(m), float(n), float(p_), float(logA),
+                          y_dAdt, ln_a, ln_l, ln_ln_l, ea_over_RT)
+
+def resid_jac(par, data):
+    """Analytic Jacobian of resid w.r.t. (m, n, p, logA).
+
+    Since the model rate is R = exp(m·ln α − n·ln λ + p·ln ln λ + logA − Ea/RT),
+    each column is just R times the corresponding log basis, so supplying it
+    saves least_squares five residual evaluations per finite-difference step.
+    """
+    m, n, p_, logA = par
+    y_dAdt, ln_a, ln_l, ln_ln_l, ea_over_RT = data
+    return _sb_jac_core(float(m), float(n), float(p_), float(logA),
+                        ln_a, ln_l, ln_ln_l, ea_over_RT)
     ### MODIFICATION END ###
 
+# Rate-law kernels backing _predict_rate_from_fit. Written as plain NumPy so
+# they stay correct without numba; when numba is present they are compiled
+# below (same rebinding pattern as objective_function), which fuses the
+# exp/pow chains into one loop without intermediate arrays.
+def _rate_sb(T_K, alpha, a1, m, n, p_, logA, Ea_J):
+    return np.exp(logA - Ea_J / (R * T_K)) * (alpha**m) * (a1**n) * ((-np.log(a1))**p_)
+
+def _rate_global(T_K, alpha, a1, Ea_J, m, n, p_, logA):
+    return np.exp(logA - Ea_J / (R * T_K)) * (alpha**m) * (a1**n) * ((-np.log(a1))**p_)
+
+def _rate_ks(T_K, alpha, a1, logA1, E1_J, logA2, E2_J, m, n):
+    k1 = np.exp(logA1 - E1_J / (R * T_K))
+    k2 = np.exp(logA2 - E2_J / (R * T_K))
+    return (k1 + k2 * (alpha**m)) * (a1**n)
+
+def _rate_gai(T_K, alpha, a1, logA, E_J, n1, z0, n2):
+    return np.exp(logA - E_J / (R * T_K)) * (a1**n1) * (z0 + alpha**n2)
+
+def _rate_par(T_K, a1, logA1, E1_J, n1, logA2, E2_J, n2):
+    k1 = np.exp(logA1 - E1_J / (R * T_K))
+    k2 = np.exp(logA2 - E2_J / (R * T_K))
+    return k1 * (a1**n1) + k2 * (a1**n2)
+
+# Residual building blocks for the autocatalytic fits. They return the
+# per-term factor arrays (not just the summed rate) because the analytic
+# Jacobians reuse exactly those factors via the per-thread stash. The fit
+# prep hands over 1/(R·T), ln α and ln(1-α) so each factor costs a single
+# exp of fused multiply-adds — no per-iteration log, power or division.
+def _ks_parts(inv_RT, ln_a, ln_a1, logA1, E1_J, logA2, E2_J, m, n):
+    n_ln_a1 = n * ln_a1
+    k1f = np.exp(logA1 - E1_J * inv_RT + n_ln_a1)
+    k2f = np.exp(logA2 - E2_J * inv_RT + m * ln_a + n_ln_a1)
+    return k1f, k2f
+
+def _gai_parts(inv_RT, ln_a, ln_a1, logA, E_J, n1, n2):
+    kf = np.exp(logA - E_J * inv_RT + n1 * ln_a1)
+    return kf, np.exp(n2 * ln_a)
+
+def _par_parts(inv_RT, ln_a1, logA1, E1_J, n1, logA2, E2_J, n2):
+    k1f = np.exp(logA1 - E1_J * inv_RT + n1 * ln_a1)
+    k2f = np.exp(logA2 - E2_J * inv_RT + n2 * ln_a1)
+    return k1f, k2f
+
+if HAS_NUMBA:
+    _sb_resid_core = njit(cache=True, fastmath=True, error_model='numpy')(_sb_resid_core)
+    _sb_jac_core = njit(cache=True, fastmath=True, error_model='numpy')(_sb_jac_core)
+    _rate_sb = njit(cache=True, fastmath=True, error_model='numpy')(_rate_sb)
+    _rate_global = njit(cache=True, fastmath=True, error_model='numpy')(_rate_global)
+    _rate_ks = njit(cache=True, fastmath=True, error_model='numpy')(_rate_ks)
+    _rate_gai = njit(cache=True, fastmath=True, error_model='numpy')(_rate_gai)
+    _rate_par = njit(cache=True, fastmath=True, error_model='numpy')(_rate_par)
+    _ks_parts = njit(cache=True, fastmath=True, error_model='numpy')(_ks_parts)
+    _gai_parts = njit(cache=True, fastmath=True, error_model='numpy')(_gai_parts)
+    _par_parts = njit(cache=True, fastmath=True, error_model='numpy')(_par_parts)
+
+def _warm_numba_kernels():
+    """Warm every @njit kernel so real work never pays first-call JIT latency.
+
+    Started as a daemon thread in App.__init__: with cache=True a warm call
+    either compiles once (first launch) or loads the on-disk cache (~100 ms),
+    and doing it in the background keeps startup and the UI responsive.
+    """
+    if not HAS_NUMBA:
+        return
+    t = np.full(1, 500.0); a = np.full(1, 0.5)
+    _eval_model(0, a, np.empty(1))
+    _sb_resid_core(1.0, 1.0, 0.5, 30.0, a, a, a, a, a)
+    _sb_jac_core(1.0, 1.0, 0.5, 30.0, a, a, a, a)
+    _vyazovkin_phi(150_000.0, np.full(2, 600.0), np.full(2, 590.0), np.full(2, 10.0))
+    _rate_sb(t, a, a, 1.0, 1.0, 0.5, 10.0, 1e5)
+    _rate_global(t, a, a, t * 200.0, 1.0, 1.0, 0.5, 10.0)
+    _rate_ks(t, a, a, 10.0, 1e5, 10.0, 1e5, 1.0, 1.0)
+    _rate_gai(t, a, a, 10.0, 1e5, 1.0, 0.1, 1.0)
+    _rate_par(t, a, 10.0, 1e5, 1.0, 10.0, 1e5, 1.0)
+    _ks_parts(a, a, a, 10.0, 1e5, 10.0, 1e5, 1.0, 1.0)
+    _gai_parts(a, a, a, 10.0, 1e5, 1.0, 1.0)
+    _par_parts(a, a, 10.0, 1e5, 1.0, 10.0, 1e5, 1.0)
+
+def _cov_from_jac(jac, cost, n_samples, n_params):
+    """Parameter covariance and standard errors from a final TRF Jacobian.
+
+    Works on the SVD of J directly instead of pinv(J.T @ J): forming the
+    normal-equation matrix squares the condition number and costs an extra
+    O(m·p²) product. Returns (cov, se) filled with NaN when the fit is
+    underdetermined or the factorization fails.
+    """
+    try:
+        if n_samples <= n_params:
+            raise np.linalg.LinAlgError("not enough samples")
+        _, S, Vt = np.linalg.svd(np.asarray(jac), full_matrices=False)
+        # Same small-singular-value cutoff pinv applies.
+        S = np.where(S > np.finfo(float).eps * max(jac.shape) * S[0], S, np.inf)
+        cov = (Vt.T * (1.0 / S**2)) @ Vt * (2 * cost / (n_samples - n_params))
+        return cov, np.sqrt(np.diag(cov))
+    except Exception:
+        return np.full((n_params, n_params), np.nan), np.full(n_params, np.nan)
+
+def _rate_inputs(df):
+    """Return (T_K, clipped alpha, clipped 1-alpha, dAdT) for a processed trace.
+
+    These arrays never change after import, but rate prediction recomputes
+    them per call — O(folds × models) times during CV. Cache them on the
+    frame's attrs so each trace pays the extraction and clipping cost once.
+    """
+    cache = df.attrs.get('_rate_inputs')
+    if cache is None:
+        T_K = df['Temp_K'].to_numpy()
+        alpha = np.clip(df['alpha'].to_numpy(), EPS, 1 - EPS)
+        a1 = np.clip(1 - alpha, EPS, None)
+        cache = (T_K, alpha, a1, df['dAdT'].to_numpy())
+        df.attrs['_rate_inputs'] = cache
+    return cache
+
 def _df_to_latex_table(df, caption, label):
     lines = []
     col_format = "c" * len(df.columns)
@@ -1087,6 +1985,22 @@ def _df_to_latex_table(df, caption, label):
     lines.append("\\end{table}")
     return "\n".join(lines)
 
+@functools.lru_cache(maxsize=64)
+def _derive_accent(accent):
+    """Lightened companion shade for an accent hex color (pure, memoized)."""
+    hex_color = accent.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    light_rgb = tuple(min(255, c + 40) for c in rgb)
+    return f"#{light_rgb[0]:02x}{light_rgb[1]:02x}{light_rgb[2]:02x}"
+
+@functools.lru_cache(maxsize=8)
+def _derive_palette(bg):
+    """(FG, BG_SECONDARY, FG_SECONDARY) for a background color (memoized)."""
+    if bg == "#2E3440": # Dark mode
+        return "#ECEFF4", "#3B4252", "#D8DEE9"
+    # Light modes
+    return "#212529", "#FFFFFF", "#6c757d"
+
 class App(tk.Tk):
     BG = "#f8f9fa"
     BG_SECONDARY = "#ffffff"
@@ -1095,6 +2009,10 @@ class App(tk.Tk):
     BRAND = "#6366f1"
     BRAND_ACCENT = "#8b5cf6"
 
+    _METHOD_MAP = {"Friedman": build_friedman_tables, "KAS": build_kas_tables,
+                   "OFW": build_ofw_tables, "Vyazovkin": build_vyazovkin_tables}
+    _MAX_PLOT_WINDOWS = 12
+
     def resource_path(self, relative_path):
         try:
             base_path = sys._MEIPASS
@@ -1102,16 +2020,20 @@ class App(tk.Tk):
             base_path = os.path.abspath(".")
         return os.path.join(base_path, relative_path)
 
+    def _apply_icon(self, win):
+        """Set the cached window icon; harmless if the .ico is unavailable."""
+        try:
+            win.iconbitmap(self._icon_path)
+        except Exception:
+            pass
+
     def __init__(self):
         super().__init__()
         self.title("TGAX Kinetics v1.0 Advanced Thermal Analysis")
         self.configure(bg=self.BG)
 
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            self.iconbitmap(icon_path)
-        except tk.TclError:
-            pass
+        self._icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
+        self._apply_icon(self)
 
         self.config_path = Path(__file__).parent / "tgax_config.json"
         self._load_and_set_dpi()
@@ -1121,12 +2043,18 @@ class App(tk.Tk):
         except tk.TclError:
             self.attributes('-zoomed', True)
         
-        self.task_queue = Queue()
+        # Single producer (worker thread) / single consumer (Tk thread):
+        # deque append/popleft are atomic, no lock needed.
+        self.task_queue = deque()
         self.is_task_running = False
-        self.menu_states = {}
+        self._redraw_pending = False
+        # Workers signal completion with a virtual event instead of the UI
+        # polling the queue on a timer; event_generate is thread-safe on Tk.
+        self.bind("<<TaskDone>>", self._drain_queue)
 
         ### MODIFICATION START: Added storage for all analysis types ###
         self.dfs, self.plots = {}, {}
+        self._kinetics_ok = True
         
         # HISTORY STORAGE: Stores every fit result dictionary in a list
         self.fit_history = [] 
@@ -1144,8 +2072,14 @@ class App(tk.Tk):
         self.dsc_results = None
         
         self.preprocessed_files, self.sample_masses = {}, {}
-        self.mass_loss_parameters = {} 
+        self.mass_loss_parameters = {}
         self.last_fitted_model = None
+        # Isoconversional results keyed by (settings, data) hash — identical
+        # "Start Calculation" re-runs are answered from here.
+        self._calc_cache = {}
+        # Per-thread stash of residual intermediates for the analytic
+        # Jacobians (thread-local because CV folds fit concurrently).
+        self._jac_cache = threading.local()
         ### MODIFICATION END ###
         
         # --- MODIFICATION START: New attribute for storing the last fitted model ---
@@ -1160,6 +2094,8 @@ class App(tk.Tk):
         }
         self.alphas = np.arange(0.15, 0.86, 0.05).round(2)
         self.ea = self.aT = self.xy = self.conversion_time_df = None
+        self._ea_alpha = self._ea_J = None
+        self._thermo_merged = self._t_alpha_merged = None
         self.current_method = "Vyazovkin"
         
         self._setup_headers()
@@ -1168,6 +2104,8 @@ class App(tk.Tk):
         self._setup_status_bar()
         self._setup_main_interface()
 
+        threading.Thread(target=_warm_numba_kernels, daemon=True).start()
+
     def _load_and_set_dpi(self):
         dpi = 100
         try:
@@ -1290,6 +2228,14 @@ class App(tk.Tk):
         self.mH.add_separator()
         self.mH.add_command(label="📧 Contact the Author", command=self.show_contact)
 
+        # Cascade indices on the menubar, captured once so busy/idle toggles
+        # touch only these entries instead of re-walking the bar.
+        self._cascade_indices = tuple(range(self.menubar.index('end') + 1))
+        # Analysis-menu command entries, captured once so state changes skip
+        # the per-entry type() probing.
+        self._mP_command_indices = tuple(
+            i for i in range(self.mP.index('end') + 1) if self.mP.type(i) == "command")
+
     def _setup_status_bar(self):
         self.status_var = tk.StringVar(value="Ready. Import data to begin.")
         self.status_frame = tk.Frame(self, bg="#343a40")
@@ -1317,22 +2263,20 @@ class App(tk.Tk):
     def update_theme(self, bg=None, accent=None):
         if bg:
             self.BG = bg
-            if bg == "#2E3440": # Dark mode
-                self.FG = "#ECEFF4"
-                self.BG_SECONDARY = "#3B4252"
-                self.FG_SECONDARY = "#D8DEE9"
-            else: # Light modes
-                self.FG = "#212529"
-                self.BG_SECONDARY = "#FFFFFF"
-                self.FG_SECONDARY = "#6c757d"
+            self.FG, self.BG_SECONDARY, self.FG_SECONDARY = _derive_palette(bg)
 
         if accent:
             self.BRAND = accent
-            hex_color = accent.lstrip('#')
-            rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            light_rgb = tuple(min(255, c + 40) for c in rgb)
-            self.BRAND_ACCENT = f"#{light_rgb[0]:02x}{light_rgb[1]:02x}{light_rgb[2]:02x}"
+            self.BRAND_ACCENT = _derive_accent(accent)
 
+        # Coalesce the expensive redraw: rapid consecutive theme clicks
+        # collapse into a single idle-time pass.
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_theme_redraw)
+
+    def _do_theme_redraw(self):
+        self._redraw_pending = False
         self.configure(bg=self.BG)
         self._setup_modern_style()
         self.menubar.configure(bg=self.BG_SECONDARY, fg=self.FG, activebackground=self.BRAND, activeforeground="white")
@@ -1340,7 +2284,11 @@ class App(tk.Tk):
              self.menubar.entryconfig(i, background=self.BG_SECONDARY, foreground=self.FG, activebackground=self.BRAND, activeforeground='white')
 
         self.status_label.config(bg="#343a40" if self.BG != "#2E3440" else "#4C566A")
-        self.show_welcome_screen() # Redraw main screen with new colors
+        if not self.dfs:
+            # Only the welcome screen needs a rebuild for its hard-coded
+            # colors; loaded sessions keep their view and pick up the new
+            # ttk styles without the destroy/recreate churn.
+            self.show_welcome_screen()
         self.update_idletasks()
 
     def _start_task(self, worker_func, *args, on_success=None, on_error=None, **kwargs):
@@ -1352,24 +2300,33 @@ class App(tk.Tk):
         self._disable_ui()
         self.status_var.set("Processing... please wait.")
 
-        thread = threading.Thread(target=self._worker_wrapper, 
+        thread = threading.Thread(target=self._worker_wrapper,
                                   args=(worker_func, args, kwargs, on_success, on_error))
         thread.daemon = True
         thread.start()
-        self._check_queue()
+        # Safety net in case the virtual event is lost (e.g. window teardown
+        # racing the worker); normally <<TaskDone>> fires first.
+        self.after(500, self._check_queue)
 
     def _worker_wrapper(self, worker_func, args, kwargs, on_success, on_error):
         try:
             result = worker_func(*args, **kwargs)
-            self.task_queue.put(('success', result, on_success))
+            self.task_queue.append(('success', result, on_success))
         except Exception as e:
             error_info = (e, traceback.format_exc())
-            self.task_queue.put(('error', error_info, on_error))
-
-    def _check_queue(self):
+            self.task_queue.append(('error', error_info, on_error))
         try:
-            status, data, callback = self.task_queue.get_nowait()
-            
+            self.event_generate("<<TaskDone>>", when="tail")
+        except tk.TclError:
+            pass  # Main window already destroyed; the poll fallback handles it.
+
+    def _drain_queue(self, event=None):
+        while True:
+            try:
+                status, data, callback = self.task_queue.popleft()
+            except IndexError:
+                return
+
             self.is_task_running = False
             self._enable_ui()
 
@@ -1381,9 +2338,12 @@ class App(tk.Tk):
                     callback(data)
                 else:
                     self._on_task_error(data)
-        except Empty:
-            self.after(100, self._check_queue)
-    
+
+    def _check_queue(self):
+        self._drain_queue()
+        if self.is_task_running:
+            self.after(500, self._check_queue)
+
     def _on_task_error(self, error_info):
         exception, tb_str = error_info
         self.status_var.set("An error occurred.")
@@ -1391,25 +2351,19 @@ class App(tk.Tk):
         print(tb_str)
 
     def _disable_ui(self):
-        self.menu_states.clear()
-        for i in range(self.menubar.index('end') + 1):
-            state = self.menubar.entrycget(i, "state")
-            self.menu_states[i] = state
+        # Disabling the cascades greys out their whole submenus; no need to
+        # read each state back first (the bar is always 'normal' when idle).
+        for i in self._cascade_indices:
             self.menubar.entryconfig(i, state="disabled")
-    
+
     def _enable_ui(self):
-        for i in range(self.menubar.index('end') + 1):
-            original_state = self.menu_states.get(i, "normal")
-            self.menubar.entryconfig(i, state=original_state)
+        for i in self._cascade_indices:
+            self.menubar.entryconfig(i, state="normal")
 
     def show_requirements(self):
         win = tk.Toplevel(self)
         win.title("Environment Requirements")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception:
-            pass
+        self._apply_icon(win)
         win.configure(bg=self.BG_SECONDARY)
         frame = ttk.Frame(win, padding=20)
         frame.pack(fill="both", expand=True)
@@ -1425,13 +2379,15 @@ class App(tk.Tk):
                 - scipy: For scientific computing and optimization.
                 - openpyxl: To read .xlsx files.
                 - python-docx: To export reports to .docx format.
+                - python-calamine (optional): Much faster .xlsx reading.
 
             Example installation command for all libraries:
             pip install pandas numpy matplotlib scipy openpyxl python-docx
             """)
-        text_widget = tk.Text(frame, wrap=tk.WORD, bg=self.BG_SECONDARY, fg=self.FG, relief=tk.FLAT, padx=10, pady=10, font=("Segoe UI", 10), highlightthickness=0, borderwidth=0)
-        text_widget.insert(tk.END, text_content); text_widget.config(state=tk.DISABLED)
-        text_widget.pack(expand=True, fill=tk.BOTH)
+        # Static help text: a plain label is far lighter than a disabled
+        # tk.Text (no tag/mark/undo machinery).
+        ttk.Label(frame, text=text_content, justify="left", wraplength=600,
+                  font=("Segoe UI", 10)).pack(expand=True, fill=tk.BOTH)
         
         win.update_idletasks()
         win.geometry(f"{win.winfo_reqwidth()+20}x{win.winfo_reqheight()+20}")
@@ -1440,11 +2396,7 @@ class App(tk.Tk):
     def show_instructions(self):
         win = tk.Toplevel(self)
         win.title("Instructions")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception:
-            pass
+        self._apply_icon(win)
         win.configure(bg=self.BG_SECONDARY)
         frame = ttk.Frame(win, padding=20)
         frame.pack(fill="both", expand=True)
@@ -1473,9 +2425,8 @@ class App(tk.Tk):
                 - The "Export" menu provides multiple options to save reports, tables, and plots.
                 - All plot windows now have a navigation toolbar and a right-click context menu to save the image.
             """)
-        text_widget = tk.Text(frame, wrap=tk.WORD, bg=self.BG_SECONDARY, fg=self.FG, relief=tk.FLAT, padx=10, pady=10, font=("Segoe UI", 10), highlightthickness=0, borderwidth=0)
-        text_widget.insert(tk.END, text_content); text_widget.config(state=tk.DISABLED)
-        text_widget.pack(expand=True, fill=tk.BOTH)
+        ttk.Label(frame, text=text_content, justify="left", wraplength=700,
+                  font=("Segoe UI", 10)).pack(expand=True, fill=tk.BOTH)
         
         win.update_idletasks()
         win.geometry(f"{win.winfo_reqwidth()+40}x{win.winfo_reqheight()+20}")
@@ -1485,11 +2436,7 @@ class App(tk.Tk):
     def show_contact(self):
         win = tk.Toplevel(self)
         win.title("Contact the Author")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception:
-            pass
+        self._apply_icon(win)
         win.configure(bg=self.BG_SECONDARY)
         frame = ttk.Frame(win, padding="20"); frame.pack(expand=True, fill=tk.BOTH)
         ttk.Label(frame, text="Author: Xing Xiaohui", font=("Segoe UI", 11)).pack(pady=4)
@@ -1502,7 +2449,7 @@ class App(tk.Tk):
         win.resizable(False, False)
 
     def simple_load_one(self, path):
-        beta_match = re.search(r"(\d+(?:\.\d+)?)\s*[kK]", Path(path).stem)
+        beta_match = _BETA_K_RE.search(Path(path).stem)
         if not beta_match:
             raise ValueError(f"Could not extract heating rate (β) from filename: {Path(path).name}.\nEnable advanced preprocessing if format is non-standard.")
         beta = float(beta_match.group(1))
@@ -1510,17 +2457,33 @@ class App(tk.Tk):
         names = ["Time_min", "Temp_C", "TG_pct", "DSC"]
         try:
             if str(path).lower().endswith(".xlsx"):
-                df = pd.read_excel(path, skiprows=1, names=names)
+                # calamine when installed, pandas' default reader otherwise.
+                df = pd.read_excel(path, skiprows=1, names=names, engine=_EXCEL_ENGINE)
             else:
-                df = pd.read_csv(path, skiprows=1, sep=None, engine="python", names=names)
+                # Sniff the delimiter from the header line ourselves so the
+                # fast C engine can be used; sep=None forces the slow Python
+                # engine. Unusual delimiters still get the old sniffing path.
+                with open(path, encoding="utf-8", errors="ignore") as fh:
+                    first_line = fh.readline()
+                sep = "\t" if "\t" in first_line else (";" if ";" in first_line else ",")
+                if sep in first_line:
+                    try:
+                        df = pd.read_csv(path, skiprows=1, sep=sep, engine="c",
+                                         names=names, dtype=np.float64)
+                    except Exception:
+                        df = pd.read_csv(path, skiprows=1, sep=None, engine="python", names=names)
+                else:
+                    df = pd.read_csv(path, skiprows=1, sep=None, engine="python", names=names)
         except Exception as e:
             raise ValueError(f"Simple loading failed for {Path(path).name}. Enable advanced preprocessing. Error: {e}")
 
+        # Cast column-by-column so already-float64 data (the C-engine path)
+        # is not copied wholesale by a frame-wide astype.
         for col in names:
             if col not in df.columns:
-                df[col] = 0.0
-        
-        df = df.astype(float)
+                df[col] = np.zeros(len(df), dtype=np.float64)
+            elif df[col].dtype != np.float64:
+                df[col] = df[col].astype(np.float64)
         return beta, df
 
     def import_data(self):
@@ -1529,27 +2492,45 @@ class App(tk.Tk):
         if not paths: return
 
         def pre_scan_for_temp(path):
+            # Only a spinbox suggestion comes out of this, so cap every read
+            # at 200 rows instead of parsing whole files before the dialog.
+            def scan(df_raw):
+                head = df_raw.head(100).apply(pd.to_numeric, errors='coerce').to_numpy()
+                plausible = np.where((head > 20) & (head < 1500), head, np.nan)
+                if np.isfinite(plausible).any():
+                    return float(np.nanmax(plausible))
+                return None
+
+            usecols = lambda x: isinstance(x, int) and x < 5 or x is None
             try:
-                df_raw = pd.read_csv(path, sep=None, engine='python', header=None, on_bad_lines='skip', usecols=lambda x: isinstance(x, int) and x < 5 or x is None, encoding_errors='ignore')
+                with open(path, encoding='utf-8', errors='ignore') as fh:
+                    first_line = fh.readline()
+                sep = '\t' if '\t' in first_line else (';' if ';' in first_line else ',')
+                best = scan(pd.read_csv(path, sep=sep, engine='c', header=None, nrows=200,
+                                        on_bad_lines='skip', usecols=usecols,
+                                        encoding_errors='ignore'))
+                if best is not None:
+                    return best
+            except Exception:
+                pass
+            try:
+                best = scan(pd.read_csv(path, sep=None, engine='python', header=None, nrows=200,
+                                        on_bad_lines='skip', usecols=usecols, encoding_errors='ignore'))
             except Exception:
                 try:
-                    df_raw = pd.read_excel(path, header=None, usecols=lambda x: isinstance(x, int) and x < 5 or x is None)
+                    best = scan(pd.read_excel(path, header=None, nrows=200, usecols=usecols))
                 except Exception:
                     return 35.0
-            max_val = 0
-            for _, row in df_raw.head(100).iterrows():
-                for item in row:
-                    try:
-                        val = float(item)
-                        if 20 < val < 1500:
-                            max_val = max(max_val, val)
-                    except (ValueError, TypeError):
-                        continue
-            return max_val if max_val > 0 else 800.0
+            return best if best is not None else 800.0
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            max_temps = [pre_scan_for_temp(p) for p in paths]
+            if len(paths) > 1:
+                # I/O-bound sniffing; threads overlap the file reads.
+                with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+                    max_temps = list(ex.map(pre_scan_for_temp, paths))
+            else:
+                max_temps = [pre_scan_for_temp(p) for p in paths]
         end_temp_suggestion = max(max_temps) - 10 if max_temps else 800
         temp_suggestion = (35.0, end_temp_suggestion)
 
@@ -1568,15 +2549,40 @@ class App(tk.Tk):
         local_dfs, local_preprocessed, local_mass_params = {}, {}, {}
         processed_count, errors = 0, []
         
+        # Parse-heavy preprocessing runs across cores; per-file results (or
+        # exceptions) come back keyed by path and feed the serial loop below.
+        pre = _preprocess_many(paths, settings["temp_range_c"]) if settings["preprocess_enabled"] else None
+        # Simple loading is pure pandas I/O, so threads suffice there; results
+        # (or exceptions) are collected per path and re-raised in order below.
+        simple = None
+        if pre is None and len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+                futures = {p: ex.submit(self.simple_load_one, p) for p in paths}
+            simple = {}
+            for p, fut in futures.items():
+                try:
+                    simple[p] = fut.result()
+                except Exception as e:
+                    simple[p] = e
+        collected_warnings = []
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
             for p in paths:
                 try:
-                    if settings["preprocess_enabled"]:
-                        beta, df_processed = preprocess_file(p, settings["temp_range_c"])
+                    if pre is not None:
+                        res = pre[p]
+                        if isinstance(res, Exception):
+                            raise res
+                        beta, df_processed, file_warnings = res
+                        collected_warnings.extend(file_warnings)
+                    elif simple is not None:
+                        res = simple[p]
+                        if isinstance(res, Exception):
+                            raise res
+                        beta, df_processed = res
                     else:
                         beta, df_processed = self.simple_load_one(p)
-                    
+
                     df_processed["Temp_K"] = df_processed["Temp_C"] + 273.15
                     m0, m_inf = df_processed["TG_pct"].iloc[0], df_processed["TG_pct"].min()
                     
@@ -1588,18 +2594,34 @@ class App(tk.Tk):
                         if df_processed.attrs.get('kinetic_analysis_possible', False):
                             errors.append(f"- {Path(p).name}: No significant mass loss.")
                     
-                    df_processed["alpha"] = (m0 - df_processed["TG_pct"]) / (m0 - m_inf) if abs(m0 - m_inf) > EPS else 0
-                    df_processed.sort_values("Temp_K", inplace=True)
-                    df_processed['alpha'] = df_processed['alpha'].clip(0, 1).cummax()
+                    temp_k = df_processed["Temp_K"].values
+                    if not np.all(np.diff(temp_k) >= 0):
+                        order = np.argsort(temp_k, kind="stable")
+                        df_processed = df_processed.iloc[order].reset_index(drop=True)
+                    # Fused alpha pass: one allocation, in-place clip and
+                    # running max instead of three pandas intermediates.
+                    denom = m0 - m_inf
+                    if abs(denom) > EPS:
+                        a = (m0 - df_processed["TG_pct"].values) * (1.0 / denom)
+                        np.clip(a, 0.0, 1.0, out=a)
+                        np.maximum.accumulate(a, out=a)
+                    else:
+                        a = np.zeros(len(df_processed))
+                    df_processed["alpha"] = a
+
+                    # Four derivatives over two shared abscissae: build the
+                    # difference weights once per grid instead of per column.
+                    w_t = _gradient_weights(df_processed["Time_min"].values)
+                    w_T = _gradient_weights(df_processed["Temp_K"].values)
+                    tg = df_processed["TG_pct"].values
+                    df_processed["DTG_min"] = _gradient_apply(tg, w_t)
+                    df_processed["DTG"]  = _gradient_apply(tg, w_T)
 
-                    df_processed["DTG_min"] = np.gradient(df_processed["TG_pct"], df_processed["Time_min"])
-                    df_processed["DTG"]  = np.gradient(df_processed["TG_pct"], df_processed["Temp_K"])
-                    
                     ### MODIFICATION START: Renamed dadt -> dAdT ###
-                    df_processed["dAdT"] = np.gradient(df_processed["alpha"], df_processed["Temp_K"])
+                    df_processed["dAdT"] = _gradient_apply(df_processed["alpha"].values, w_T)
                     ### MODIFICATION END ###
-                    
-                    df_processed["DTA"]  = np.gradient(df_processed["DSC"], df_processed["Temp_K"])
+
+                    df_processed["DTA"]  = _gradient_apply(df_processed["DSC"].values, w_T)
                     
                     if not df_processed["DSC"].empty:
                         df_processed["DSC"] -= df_processed["DSC"].iloc[0]
@@ -1612,7 +2634,7 @@ class App(tk.Tk):
                 except Exception as e:
                     errors.append(f"- {Path(p).name}: {e}")
             
-            warning_messages = "\n".join(str(warn.message) for warn in w)
+            warning_messages = "\n".join(collected_warnings + [str(warn.message) for warn in w])
 
         if not local_dfs:
             raise ValueError("No files were successfully processed.")
@@ -1620,15 +2642,31 @@ class App(tk.Tk):
         kinetic_analysis_possible = all(df.attrs.get('kinetic_analysis_possible', True) for df in local_dfs.values())
         
         ea, aT, xy = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        a_min, a_max, a_step = settings["alpha_range"]
+        alphas, _ = get_alpha_grid(a_min, a_max, a_step)
         if kinetic_analysis_possible:
-            a_min, a_max, a_step = settings["alpha_range"]
-            alphas = np.round(np.arange(a_min, a_max + EPS, a_step), 4)
-            method_map = {"Friedman": build_friedman_tables, "KAS": build_kas_tables, "OFW": build_ofw_tables, "Vyazovkin": build_vyazovkin_tables}
-            calculation_func = method_map[settings["method"]]
-            ea, aT, xy = calculation_func(local_dfs, alphas)
+            # Fingerprint the settings plus the preprocessed curves; a repeated
+            # run over the same files with the same settings skips the whole
+            # isoconversional computation.
+            fp = hashlib.blake2b(digest_size=16)
+            fp.update(repr((settings["method"], a_min, a_max, a_step)).encode())
+            for β in sorted(local_dfs):
+                df_b = local_dfs[β]
+                fp.update(np.float64(β).tobytes())
+                for col in ("alpha", "Temp_K", "dAdT"):
+                    fp.update(df_b[col].to_numpy().tobytes())
+            cache_key = fp.digest()
+            cached = self._calc_cache.get(cache_key)
+            if cached is not None:
+                ea, aT, xy = cached
+            else:
+                calculation_func = self._METHOD_MAP[settings["method"]]
+                ea, aT, xy = calculation_func(local_dfs, alphas)
+                self._calc_cache[cache_key] = (ea, aT, xy)
             
         return {
             "dfs": local_dfs, "preprocessed_files": local_preprocessed, "ea": ea, "aT": aT, "xy": xy,
+            "alphas": alphas,
             "settings": settings, "errors": errors, "warnings": warning_messages, "processed_count": processed_count,
             "kinetic_analysis_possible": kinetic_analysis_possible,
             "mass_loss_parameters": local_mass_params
@@ -1637,18 +2675,23 @@ class App(tk.Tk):
     def _on_import_data_success(self, data):
         self.dfs.clear(); self.preprocessed_files.clear(); self.sample_masses.clear()
         self.dfs.clear(); self.preprocessed_files.clear(); self.sample_masses.clear(); self.mass_loss_parameters.clear()
-        self.ea = self.aT = self.xy = self.conversion_time_df = self.fit_results = self.cka_results = None
+        self.aT = self.xy = self.conversion_time_df = self.fit_results = self.cka_results = None
+        self._set_ea(None)
+        self._thermo_merged = self._t_alpha_merged = None
 
         self.dfs = data['dfs']
         self.preprocessed_files = data['preprocessed_files']
-        self.ea, self.aT, self.xy = data['ea'], data['aT'], data['xy']
+        self._set_ea(data['ea'])
+        self.aT, self.xy = data['aT'], data['xy']
         self.current_method = data['settings']['method']
-        a_min, a_max, a_step = data['settings']["alpha_range"]
-        self.alphas = np.round(np.arange(a_min, a_max + EPS, a_step), 4)
+        # Same array object the worker used, so downstream lookups keyed on
+        # the grid values match exactly.
+        self.alphas = data['alphas']
         
         ### MODIFICATION START: Store m0/m_inf ###
         self.mass_loss_parameters = data['mass_loss_parameters']
         ### MODIFICATION END ###
+        self._kinetics_ok = data['kinetic_analysis_possible']
 
         if data['warnings']:
             messagebox.showwarning("Preprocessing Warnings", data['warnings'], parent=self)
@@ -1661,37 +2704,25 @@ class App(tk.Tk):
             messagebox.showwarning("Kinetic Analysis Disabled",
                                    "One or more files were missing a Mass/Weight column. All TGA-based kinetic analyses have been disabled.")
             self.mF.entryconfig(2, state="disabled")
-            # --- MODIFICATION START: Check for item type before changing state ---
-            for i in range(self.mP.index('end') + 1):
-                try:
-                    item_type = self.mP.type(i)
-                    if item_type == "command":
-                        self.mP.entryconfig(i, state="disabled")
-                except tk.TclError:
-                    pass
-            # --- MODIFICATION END ---
+            for i in self._mP_command_indices:
+                self.mP.entryconfig(i, state="disabled")
             self.mV.entryconfig(8, state="disabled")
         else:
             self.mF.entryconfig(2, state="normal")
-            # --- MODIFICATION START: Check for item type before changing state ---
-            for i in range(self.mP.index('end') + 1):
-                try:
-                    item_type = self.mP.type(i)
-                    if item_type == "command":
-                        self.mP.entryconfig(i, state="normal")
-                except tk.TclError:
-                    pass
-            # --- MODIFICATION END ---
+            for i in self._mP_command_indices:
+                self.mP.entryconfig(i, state="normal")
             self.mV.entryconfig(8, state="normal")
         
         self.status_var.set(f"{data['processed_count']} files processed. View thermograms or run analysis.")
-        
+
+        # Defer the heavy result rendering one event-loop tick so the status
+        # bar and menus update before the tables/plots are built.
         if data['kinetic_analysis_possible']:
-            self._on_recalculate_success({
+            self.after_idle(lambda: self._on_recalculate_success({
                 "ea": self.ea, "aT": self.aT, "xy": self.xy, "method": self.current_method
-            })
+            }))
         else:
-            self.show_thermograms()
+            self.after_idle(self.show_thermograms)
     def export_preprocessed_data(self):
         if not self.preprocessed_files:
             return messagebox.showwarning("No Data", "No preprocessed data available to export. Please import and process files first.")
@@ -1706,11 +2737,17 @@ class App(tk.Tk):
         p = Path(file_path)
         try:
             if p.suffix == '.xlsx':
-                with pd.ExcelWriter(p, engine='openpyxl') as writer:
-                    for basename, df in self.preprocessed_files.items():
-                        export_df = df[['Time_min', 'Temp_C', 'TG_pct', 'DSC']].copy()
-                        export_df['Heating Rate (K/min)'] = float(basename.split('K')[0])
-                        export_df.to_excel(writer, sheet_name=basename, index=False)
+                # Write-only workbook streams rows out instead of building
+                # per-cell objects for the whole book in memory.
+                wb = Workbook(write_only=True)
+                for basename, df in self.preprocessed_files.items():
+                    export_df = df[['Time_min', 'Temp_C', 'TG_pct', 'DSC']].copy()
+                    export_df['Heating Rate (K/min)'] = float(basename.split('K')[0])
+                    ws = wb.create_sheet(title=basename)
+                    ws.append(list(export_df.columns))
+                    for row in export_df.itertuples(index=False, name=None):
+                        ws.append(row)
+                wb.save(p)
                 messagebox.showinfo("Success", f"All preprocessed data saved to:\n{p}")
             else:
                 directory, stem, suffix = p.parent, p.stem, p.suffix
@@ -1728,20 +2765,36 @@ class App(tk.Tk):
         if self.is_task_running: return messagebox.showwarning("Busy", "Please wait for the current task to finish.")
         if not self.dfs: return messagebox.showwarning("No Data", "Please import data before running an analysis.")
         
-        kinetic_analysis_possible = all(df.attrs.get('kinetic_analysis_possible', True) for df in self.dfs.values())
-        if not kinetic_analysis_possible:
+        # Flag computed once by the import worker; no need to re-walk attrs.
+        if not self._kinetics_ok:
             return messagebox.showwarning("Analysis Disabled", "Cannot run kinetic analysis because one or more files are missing mass data.")
 
         self._start_task(self._recalculate_worker, on_success=self._on_recalculate_success)
 
     def _recalculate_worker(self):
-        method_map = {"Friedman": build_friedman_tables, "KAS": build_kas_tables, "OFW": build_ofw_tables, "Vyazovkin": build_vyazovkin_tables}
-        calculation_func = method_map[self.current_method]
+        calculation_func = self._METHOD_MAP[self.current_method]
         ea, aT, xy = calculation_func(self.dfs, self.alphas)
         return {"ea": ea, "aT": aT, "xy": xy, "method": self.current_method}
 
+    def _set_ea(self, ea_df):
+        """Store the isoconversional Ea table and cache its lookup arrays.
+
+        Several hot paths (global fit, rate prediction, CV) interpolate Ea(α)
+        in J/mol; caching the arrays here avoids rebuilding an indexed Series
+        on every call.
+        """
+        self.ea = ea_df
+        if ea_df is None or ea_df.empty:
+            # Imports without a mass column hand over an empty frame with
+            # kinetic analysis disabled; there is no Ea(α) curve to cache.
+            self._ea_alpha = self._ea_J = None
+        else:
+            self._ea_alpha = ea_df['alpha'].to_numpy()
+            self._ea_J = ea_df['Ea_kJ_per_mol'].to_numpy() * 1000.0
+
     def _on_recalculate_success(self, data):
-        self.ea, self.aT, self.xy = data["ea"], data["aT"], data["xy"]
+        self._set_ea(data["ea"])
+        self.aT, self.xy = data["aT"], data["xy"]
         if data["method"] == "Vyazovkin":
             self.mV.entryconfig("📉 Linear Regression (X-Y)", state="disabled")
         else:
@@ -1757,10 +2810,7 @@ class App(tk.Tk):
             return messagebox.showinfo("Not Applicable", f"The {self.current_method} method does not have an X-Y plot.")
 
         win = tk.Toplevel(self); win.configure(bg=self.BG); win.title(f"{title} Table & Plot")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("900x600")
 
         header_map = self.display_header_map.copy()
@@ -1782,7 +2832,22 @@ class App(tk.Tk):
 
         tv = ttk.Treeview(frame, columns=cols, show="headings", style="Modern.Treeview")
         for c in cols: tv.heading(c, text=c); tv.column(c, width=110, anchor="e")
-        for _, r in display_df.iterrows(): tv.insert("", "end", values=[f"{v:.6g}" if isinstance(v, (int, float)) else v for v in r])
+
+        # Format every cell up front (itertuples, no iterrows overhead), then
+        # feed the Treeview in chunks from the event loop so the window maps
+        # immediately even for large tables.
+        rows = [tuple(f"{v:.6g}" if isinstance(v, (int, float)) else v for v in r)
+                for r in display_df.itertuples(index=False, name=None)]
+
+        def _fill(start=0, chunk=500):
+            if not tv.winfo_exists():
+                return
+            for row in rows[start:start + chunk]:
+                tv.insert("", "end", values=row)
+            if start + chunk < len(rows):
+                win.after_idle(_fill, start + chunk)
+
+        _fill()
 
         ysb = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tv.yview)
         xsb = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=tv.xview)
@@ -1839,18 +2904,27 @@ class App(tk.Tk):
         if hasattr(ax, 'twinx_ax'):
             lines.extend(ax.twinx_ax.get_lines())
 
-        for line in lines:
-            xdata, ydata = line.get_xdata(), line.get_ydata()
-            for x, y in zip(xdata, ydata):
-                if x > x_mid and y > y_mid:
-                    quadrants['upper right'] += 1
-                elif x <= x_mid and y > y_mid:
-                    quadrants['upper left'] += 1
-                elif x <= x_mid and y <= y_mid:
-                    quadrants['lower left'] += 1
-                elif x > x_mid and y <= y_mid:
-                    quadrants['lower right'] += 1
-        
+        xs = [np.asarray(line.get_xdata(), dtype=float) for line in lines]
+        ys = [np.asarray(line.get_ydata(), dtype=float) for line in lines]
+        # Batched curves (LineCollection) carry their data as segments.
+        for coll in ax.collections:
+            if hasattr(coll, 'get_segments'):
+                for seg in coll.get_segments():
+                    xs.append(seg[:, 0]); ys.append(seg[:, 1])
+
+        if xs:
+            # Whole-array masks instead of four branchy comparisons per point.
+            X = np.concatenate(xs)
+            Y = np.concatenate(ys)
+            valid = np.isfinite(X) & np.isfinite(Y)
+            rx = X > x_mid
+            ty = Y > y_mid
+            quadrants['upper right'] = int((rx & ty & valid).sum())
+            quadrants['upper left'] = int((~rx & ty & valid).sum())
+            quadrants['lower left'] = int((~rx & ~ty & valid).sum())
+            quadrants['lower right'] = int((rx & ~ty & valid).sum())
+
+
         best_loc = min(quadrants, key=quadrants.get)
         
         # --- MODIFICATION START: Legend Size Coordination ---
@@ -1865,11 +2939,7 @@ class App(tk.Tk):
 
         win = tk.Toplevel(self)
         win.title(title)
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception:
-            pass
+        self._apply_icon(win)
 
         # --- MODIFICATION START: Hide Edge Ticks ---
         # Loop through all axes in the figure and apply the hiding function
@@ -1882,24 +2952,64 @@ class App(tk.Tk):
         canvas_frame.pack(fill="both", expand=True)
         
         canvas = FigureCanvasTkAgg(fig, master=canvas_frame)
-        canvas.draw()
+        canvas.draw_idle()
         
         toolbar = NavigationToolbar2Tk(canvas, canvas_frame)
         toolbar.update()
         canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
         canvas.mpl_connect("button_press_event", lambda ev: self.show_save_dialog(ev, fig, is_thermo_plot))
+        win._fig = fig
+        win.protocol("WM_DELETE_WINDOW", lambda: self._on_plot_close(title, fig, win))
+
+        # Prune closed windows, then cap the number of live plot windows so a
+        # long session of CV/fit plots does not accumulate Agg buffers.
+        self.plots = {t: w for t, w in self.plots.items() if w.winfo_exists()}
+        while len(self.plots) >= self._MAX_PLOT_WINDOWS:
+            oldest = next(iter(self.plots))
+            self._on_plot_close(oldest, self.plots[oldest]._fig, self.plots[oldest])
+
         self.plots[title] = win
         plt.close(fig)
 
+    def _on_plot_close(self, title, fig, win):
+        """Release the figure's render buffers when its window goes away."""
+        fig.clf()
+        plt.close(fig)
+        self.plots.pop(title, None)
+        win.destroy()
+
+    def _equation_label(self, frame, eq_text, figsize, fontsize):
+        """Render a mathtext equation once and show it as a static label.
+
+        A live FigureCanvasTkAgg is overkill for an equation that never
+        changes: it re-runs the full transform pipeline on every redraw.
+        Rasterize offscreen with Agg instead and hand Tk a plain image.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize, dpi=100, facecolor=self.BG)
+        fig.text(0.5, 0.5, eq_text, va='center', ha='center', fontsize=fontsize,
+                 color=self.FG, multialignment='center')
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        rgb = np.asarray(canvas.buffer_rgba())[:, :, :3]
+        h, w, _ = rgb.shape
+        img = tk.PhotoImage(data=b"P6 %d %d 255 " % (w, h) + rgb.tobytes())
+        lbl = ttk.Label(frame, image=img)
+        lbl.image = img  # keep a reference or Tk garbage-collects the bitmap
+        return lbl
+
     def _hide_edge_tick_labels(self, ax):
         """Hides the first and last tick labels on both x and y axes."""
         for axis in [ax.xaxis, ax.yaxis]:
-            ticks = axis.get_major_ticks()
+            # get_majorticklabels returns the lightweight Text artists without
+            # materializing full Tick objects for every gridline.
+            labels = axis.get_majorticklabels()
             # Ensure there are enough ticks to hide the edges
-            if len(ticks) > 1:
-                ticks[0].label1.set_visible(False)
-                ticks[-1].label1.set_visible(False)
+            if len(labels) > 1:
+                labels[0].set_visible(False)
+                labels[-1].set_visible(False)
 
     def plot_data(self, title):
         fig, ax = plt.subplots(figsize=(6, 4.5))
@@ -1927,23 +3037,24 @@ class App(tk.Tk):
             ax.set_ylabel(y_labels.get(self.current_method, "Y-Value"))
             
             alphas_with_data = self.xy['alpha'].unique()
-            
-            for a in alphas_with_data:
-                s = self.xy[self.xy["alpha"] == a]
+
+            for a, s in self.xy.groupby("alpha", sort=False):
                 if s.empty: continue
-                slope, inter = np.polyfit(s["X"], s["Y"], 1)
+                slope, inter = _ols1(s["X"], s["Y"])
                 p = ax.scatter(s["X"], s["Y"], s=15, label=f"$\\alpha$ = {a:.2f}")
                 ax.plot(s["X"], slope * s["X"] + inter, color=p.get_facecolor()[0], lw=1.0)
             ax.set_xlabel(r"1/T (K$^{-1}$)")
             self.add_smart_legend(fig, ax, len(alphas_with_data))
         elif title == "t-α":
-            for β, df in self.dfs.items(): ax.plot(df["Time_min"], df["alpha"], label=f"$\\beta$ = {β:.2f} K/min")
+            proxies = [ax.plot([], [], label=f"$\\beta$ = {β:.2f} K/min")[0] for β in self.dfs]
+            segs = [np.column_stack((df["Time_min"].to_numpy(), df["alpha"].to_numpy())) for df in self.dfs.values()]
+            ax.add_collection(LineCollection(segs, colors=[p.get_color() for p in proxies],
+                                             linewidths=plt.rcParams['lines.linewidth']))
+            ax.autoscale_view()
             ax.set_xlabel("Time (min)"); ax.set_ylabel(r"Conversion, $\alpha$")
             self.add_smart_legend(fig, ax, len(self.dfs))
         
         ax.margins(x=0)
-        fig.tight_layout()
-             
         self._create_plot_window(fig, f"{title} Plot")
 
     def show_save_dialog(self, event, fig, is_thermo_plot=False):
@@ -1953,7 +3064,19 @@ class App(tk.Tk):
         tag = f"{label} Plot"
         fig, ax = plt.subplots(figsize=(5.5, 4.5))
         num_curves = len(self.dfs)
-        for i, (β, df) in enumerate(self.dfs.items()): ax.plot(df["Temp_K"], df[kind], label=f"$\\beta$ = {β:.2f} K/min")
+        if kind == "TG_pct":
+            # Plain line curves with no fill-under export: batch every β into
+            # one LineCollection so the canvas draws a single artist. Empty
+            # proxy lines supply the per-β legend entries (and colors).
+            proxies = [ax.plot([], [], label=f"$\\beta$ = {β:.2f} K/min")[0] for β in self.dfs]
+            segs = [np.column_stack((df["Temp_K"].to_numpy(), df[kind].to_numpy())) for df in self.dfs.values()]
+            ax.add_collection(LineCollection(segs, colors=[p.get_color() for p in proxies],
+                                             linewidths=plt.rcParams['lines.linewidth']))
+            ax.autoscale_view()
+        else:
+            # DSC/DTA/DTG stay as individual Line2D artists: the save dialog's
+            # fill-under export walks ax.get_lines().
+            for β, df in self.dfs.items(): ax.plot(df["Temp_K"], df[kind], label=f"$\\beta$ = {β:.2f} K/min")
         ax.set_xlabel("T (K)"); ax.margins(x=0.0)
 
         if kind == "TG_pct": 
@@ -1966,7 +3089,6 @@ class App(tk.Tk):
             ax.set_yticks([])
         
         self.add_smart_legend(fig, ax, num_curves)
-        fig.tight_layout()
 
         is_fillable = kind in ["DSC", "DTA", "DTG"]
         self._create_plot_window(fig, tag, is_thermo_plot=is_fillable)
@@ -1975,12 +3097,13 @@ class App(tk.Tk):
         if not self.dfs: return messagebox.showwarning("No Data", "Please import data first.")
         win = tk.Toplevel(self); win.title("Thermograms")
         win.geometry("800x600")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         
-        merge = pd.concat(self.dfs.values(), keys=self.dfs.keys(), names=["beta", "idx"]).reset_index(level=0)
+        # Amortize the concat across window opens: the frames only change on
+        # re-import, which resets this cache.
+        if self._thermo_merged is None:
+            self._thermo_merged = pd.concat(self.dfs.values(), keys=self.dfs.keys(), names=["beta", "idx"]).reset_index(level=0)
+        merge = self._thermo_merged
 
         display_df = merge.rename(columns=self.display_header_map)
         cols = list(display_df.columns.intersection(["β (K/min)", "T (K)", "TG (%)", "DSC (mW/mg)", "DTG", "DTA"]))
@@ -1995,7 +3118,8 @@ class App(tk.Tk):
 
         tv = ttk.Treeview(frame, columns=cols, show="headings", height=18, style="Modern.Treeview")
         for c in cols: tv.heading(c, text=c); tv.column(c, width=110, anchor="e")
-        for _, r in display_df[cols].head(1000).iterrows(): tv.insert("", "end", values=[f"{val:.6g}" for val in r])
+        for r in display_df[cols].head(1000).to_numpy():
+            tv.insert("", "end", values=[f"{val:.6g}" for val in r])
         tv.pack(fill="both", expand=True, pady=(5,0))
 
 
@@ -2003,12 +3127,11 @@ class App(tk.Tk):
         if not self.dfs: return messagebox.showwarning("No Data", "Please import data first.")
         win = tk.Toplevel(self); win.title("Time-Conversion (t-α) Table & Plot")
         win.geometry("800x600")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
 
-        all_dfs = pd.concat(self.dfs.values(), keys=self.dfs.keys(), names=["beta", "idx"]).reset_index()
+        if self._t_alpha_merged is None:
+            self._t_alpha_merged = pd.concat(self.dfs.values(), keys=self.dfs.keys(), names=["beta", "idx"]).reset_index()
+        all_dfs = self._t_alpha_merged
 
         display_df = all_dfs.rename(columns=self.display_header_map)
         cols = ["β (K/min)", "Time (min)", "α", "T (K)"]
@@ -2022,7 +3145,20 @@ class App(tk.Tk):
 
         tv = ttk.Treeview(frame, columns=cols, show="headings", style="Modern.Treeview")
         for c in cols: tv.heading(c, text=c); tv.column(c, anchor="e", width=130)
-        for _, r in display_df[cols].iterrows(): tv.insert("", "end", values=[f"{v:.4g}" for v in r])
+
+        # This table is uncapped (all betas, all rows): format from the raw
+        # array and stream the inserts in chunks like show_table.
+        rows = [tuple(f"{v:.4g}" for v in r) for r in display_df[cols].to_numpy()]
+
+        def _fill(start=0, chunk=500):
+            if not tv.winfo_exists():
+                return
+            for row in rows[start:start + chunk]:
+                tv.insert("", "end", values=row)
+            if start + chunk < len(rows):
+                win.after_idle(_fill, start + chunk)
+
+        _fill()
         tv.pack(fill="both", expand=True, pady=(5,0))
 
     def global_fit(self):
@@ -2035,7 +3171,7 @@ class App(tk.Tk):
         try:
             a_min, a_max = map(float, rng.split(','))
             if not (0 < a_min < a_max < 1): raise ValueError
-            fit_alphas = np.round(np.arange(a_min, a_max + EPS, 0.01), 4)
+            fit_alphas, _ = get_alpha_grid(a_min, a_max)
         except (ValueError, IndexError): return messagebox.showerror("Error", "Invalid α range format.")
         
         # We pass self.dfs to the worker, which will then call the refactored logic function
@@ -2046,24 +3182,24 @@ class App(tk.Tk):
         Refactored logic for global fitting that can be called by any workflow.
         ### MODIFICATION: This function now fits in the d(alpha)/dt (time) domain ###
         """
-        ea_ser = self.ea.set_index("alpha")["Ea_kJ_per_mol"] * 1000
-        data = prep_arrays(dfs, ea_ser, alphas) # prep_arrays now returns data for d(alpha)/dt
+        data = prep_arrays(dfs, self._ea_alpha, self._ea_J, alphas) # prep_arrays now returns data for d(alpha)/dt
         if len(data[0]) < 10: 
             raise ValueError("Too few data points for a reliable fit in the selected range.")
 
         # resid function now expects d(alpha)/dt, so initial guess for logA is adjusted (e.g., 30 for 1/min)
-        res = least_squares(resid, [1, 1, 0, 30], args=(data,), bounds=([0, 0, 0, 10], [5, 5, 5, 50]), loss="soft_l1", x_scale='jac', method='trf')
+        # With rates of O(1e-2)/min the default f_scale=1.0 leaves soft_l1
+        # indistinguishable from plain L2; scale it to the starting residuals
+        # so the robust transition actually engages. x_scale reflects the
+        # parameter magnitudes (m, n, p are O(1), logA is O(10)).
+        x0 = [1, 1, 0, 30]
+        f_scale = max(1e-6, float(np.median(np.abs(resid(x0, data)))))
+        res = least_squares(resid, x0, jac=resid_jac, args=(data,), bounds=([0, 0, 0, 10], [5, 5, 5, 50]),
+                            loss="soft_l1", f_scale=f_scale, x_scale=[1.0, 1.0, 1.0, 5.0], method='trf')
         if not res.success: 
             raise RuntimeError("The optimization did not converge.")
 
         m, n, p_, logA = res.x
-        try:
-            n_samples, n_params = len(data[0]), len(res.x)
-            cov = np.linalg.pinv(res.jac.T @ res.jac) * res.cost * 2 / (n_samples - n_params)
-            se = np.sqrt(np.diag(cov))
-        except: 
-            se = np.full(4, np.nan)
-            cov = np.full((4, 4), np.nan)
+        cov, se = _cov_from_jac(res.jac, res.cost, len(data[0]), len(res.x))
 
         return {
             "model_name": "GlobalFit",
@@ -2089,10 +3225,7 @@ class App(tk.Tk):
         self.status_var.set("✓ Global Fit complete. Showing results.")
         
         win = tk.Toplevel(self, bg=self.BG); win.title("Global Fit Results")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("800x550")
         
         frame = ttk.Frame(win, padding="20"); frame.pack(fill="both", expand=True)
@@ -2116,10 +3249,7 @@ class App(tk.Tk):
         
         p = self.fit_results['params']
         eq_text = f"$f(\\alpha) = \\alpha^{{{p['m']:.2f}}} (1-\\alpha)^{{{p['n']:.2f}}} [-\\ln(1-\\alpha)]^{{{p['p']:.2f}}}$"
-        fig_eq = plt.figure(figsize=(6, 1.5), facecolor=self.BG)
-        fig_eq.text(0.5, 0.5, eq_text, va='center', ha='center', fontsize=12, color=self.FG)
-        canvas = FigureCanvasTkAgg(fig_eq, master=frame); canvas.draw()
-        canvas.get_tk_widget().pack(fill='x', expand=False, pady=(10,15)); plt.close(fig_eq)
+        self._equation_label(frame, eq_text, (6, 1.5), 12).pack(fill='x', expand=False, pady=(10,15))
 
         tv_cols = ("Parameter", "Value", "Std. Error")
         tv = ttk.Treeview(frame, columns=tv_cols, show="headings", height=5, style="Modern.Treeview"); tv.pack(fill="x", expand=True)
@@ -2148,13 +3278,14 @@ class App(tk.Tk):
         
         # Get A_per_min from logA in raw_params
         logA = self.fit_results['raw_params'][self.fit_results['param_order'].index('logA')]
-        A_min = math.exp(logA)
-        
-        ea_ser = self.ea.set_index("alpha")["Ea_kJ_per_mol"] * 1000
+
+        # The isoconversional Ea curve is the same for every β: use the cached
+        # arrays instead of indexing a pandas Series per iteration.
+        ea_x, ea_y = self._ea_alpha, self._ea_J
 
         num_curves = 0
         for i, (beta_k_min, df) in enumerate(self.dfs.items()):
-            
+
             ### MODIFICATION START: Renamed dadt -> dAdT ###
             # Experimental rate is d(alpha)/dt = dAdT * beta
             dAdt_exp_per_min = df['dAdT'] * beta_k_min
@@ -2162,14 +3293,12 @@ class App(tk.Tk):
             ### MODIFICATION END ###
             num_curves += 1
 
-            alpha = np.clip(df["alpha"].values, EPS, 1 - EPS)
-            Ea_interp = np.interp(alpha, ea_ser.index, ea_ser.values)
+            T_K, alpha, a1, _ = _rate_inputs(df)
+            Ea_interp = np.interp(alpha, ea_x, ea_y)
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore", RuntimeWarning)
-                f_alpha = alpha**m * (1-alpha)**n * (-np.log(1-alpha))**p_
-            
-            # Model rate is d(alpha)/dt = A_min * exp(-Ea/RT) * f(alpha)
-            dAdt_model = A_min * np.exp(-Ea_interp / (R * df['Temp_K'])) * f_alpha
+                # Model rate is d(alpha)/dt = A_min * exp(-Ea/RT) * f(alpha)
+                dAdt_model = _rate_global(T_K, alpha, a1, Ea_interp, m, n, p_, logA)
             ax.plot(df['Temp_K'], dAdt_model, '-', label=f"β={beta_k_min:.1f} (Fit)")
             num_curves += 1
 
@@ -2177,7 +3306,6 @@ class App(tk.Tk):
         ax.set_ylabel(r"Reaction Rate, d$\alpha$/dt (min$^{-1}$)")
         ax.margins(x=0)
         self.add_smart_legend(fig, ax, num_curves)
-        fig.tight_layout()
         self._create_plot_window(fig, "Global Fit vs. Experimental Data")
         ### MODIFICATION END ###
 
@@ -2204,7 +3332,7 @@ class App(tk.Tk):
         try:
             a_min, a_max = map(float, rng.split(','))
             if not (0 < a_min < a_max < 1): raise ValueError
-            fit_alphas = np.round(np.arange(a_min, a_max + EPS, 0.01), 4)
+            fit_alphas, _ = get_alpha_grid(a_min, a_max)
         except (ValueError, IndexError): return messagebox.showerror("Error", "Invalid α range format.")
         
         # --- NEW: Branching logic for Cross-Validation ---
@@ -2233,85 +3361,149 @@ class App(tk.Tk):
             raise ValueError(f"Unknown model key for cross-validation: {model_key}")
         
         fit_function = model_logic_map[model_key]
+
+        # The autocatalytic folds share one residual/Jacobian family, so all
+        # of them (with their multistart blocks) can be solved as a single
+        # block-diagonal problem instead of one fit per fold.
+        if model_key in ("KS", "GAI", "PAR"):
+            try:
+                return self._run_cv_batched(model_key, fit_function, all_betas, fit_alphas)
+            except ValueError:
+                # Expected data problems (e.g. a fold with too few points in
+                # the α range) fall back to the per-fold path, which reports
+                # them fold by fold; anything else should surface.
+                pass
+
+        # Each fold is independent, so run them concurrently. The fit logic
+        # needs instance state (e.g. self.ea for GlobalFit), so threads are
+        # used rather than processes; least_squares spends most of its time
+        # in compiled code, which releases the GIL.
+        done_count = [0]
+
+        def run_fold(beta_to_validate):
+            result = self._cv_fold(fit_function, beta_to_validate, fit_alphas)
+            done_count[0] += 1
+            self.status_var.set(f"CV Iteration {done_count[0]}/{len(all_betas)}: Validated β = {beta_to_validate:.1f} K/min")
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(len(all_betas), os.cpu_count() or 1)) as ex:
+            cv_results = list(ex.map(run_fold, all_betas))
+
+        return {"model_name": model_key, "cv_results": cv_results}
+
+    def _run_cv_batched(self, model_key, fit_function, all_betas, fit_alphas, n_starts=8):
+        """Leave-one-out CV for the autocatalytic fits as one stacked solve.
+
+        Every fold is an independent subproblem with the same parameter
+        layout, so all folds x multistart blocks go through a single
+        block-diagonal TRF call; each fold's best block then warm-starts the
+        ordinary fit logic, which converges in a few iterations and
+        assembles the usual per-fold result.
+        """
+        resid, jac, initial_guess, bounds = self._autocat_fit_setup(model_key)
+        lb, ub = (np.asarray(b, float) for b in bounds)
+        starts = self._lhs_starts(initial_guess, lb, ub, n_starts)
+
+        fold_datas = []
+        for beta in all_betas:
+            training_dfs = {b: df for b, df in self.dfs.items() if b != beta}
+            fold_datas.append(self.prep_arrays_for_model_fit(training_dfs, fit_alphas))
+
+        stacked_starts = np.tile(starts, (len(all_betas), 1))
+        datas = [d for d in fold_datas for _ in range(n_starts)]
+        P = self._block_least_squares(resid, jac, stacked_starts, lb, ub, datas)
+
         cv_results = []
+        for i, beta in enumerate(all_betas):
+            blocks = P[i * n_starts:(i + 1) * n_starts]
+            costs = [self._soft_l1_cost(resid(p, fold_datas[i])) for p in blocks]
+            best = blocks[int(np.nanargmin(costs))]
+            cv_results.append(self._cv_fold(fit_function, beta, fit_alphas, x0=best))
+            self.status_var.set(f"CV Iteration {i + 1}/{len(all_betas)}: Validated β = {beta:.1f} K/min")
+        return {"model_name": model_key, "cv_results": cv_results}
 
-        for i, beta_to_validate in enumerate(all_betas):
-            self.status_var.set(f"CV Iteration {i+1}/{len(all_betas)}: Validating β = {beta_to_validate:.1f} K/min")
-            
-            # 1. Data Partition
-            training_dfs = {b: df for b, df in self.dfs.items() if b != beta_to_validate}
-            validation_df = self.dfs[beta_to_validate]
+    def _cv_fold(self, fit_function, beta_to_validate, fit_alphas, x0=None):
+        """Run one leave-one-out fold: fit without one β, score on it."""
+        # 1. Data Partition
+        training_dfs = {b: df for b, df in self.dfs.items() if b != beta_to_validate}
+        validation_df = self.dfs[beta_to_validate]
 
-            # 2. Model Fitting on Training Set
-            try:
+        # 2. Model Fitting on Training Set
+        try:
+            if x0 is None:
                 fit_result = fit_function(training_dfs, fit_alphas)
-            except Exception as e:
-                cv_results.append({"beta_validated": beta_to_validate, "SSE": np.nan, "params": {}, "error": str(e)})
-                continue
+            else:
+                fit_result = fit_function(training_dfs, fit_alphas, x0=x0)
+        except Exception as e:
+            return {"beta_validated": beta_to_validate, "SSE": np.nan, "params": {}, "error": str(e)}
 
-            # 3. Prediction on Validation Set
-            ### MODIFICATION START: Renamed dadt -> dAdT ###
-            dAdt_exp_per_min = validation_df['dAdT'] * beta_to_validate
-            ### MODIFICATION END ###
-            
-            dAdt_pred_per_min = self._predict_rate_from_fit(fit_result, validation_df)
-            
-            # Ensure arrays are aligned and finite for SSE calculation
-            valid_indices = np.isfinite(dAdt_exp_per_min) & np.isfinite(dAdt_pred_per_min)
-            dAdt_exp_valid = dAdt_exp_per_min[valid_indices]
-            dAdt_pred_valid = dAdt_pred_per_min[valid_indices]
-
-            # 4. Comparison (SSE)
-            sse = np.sum((dAdt_pred_valid - dAdt_exp_valid)**2)
-            cv_results.append({"beta_validated": beta_to_validate, "SSE": sse, "params": fit_result['params'], "raw_params": fit_result['raw_params'], "error": None})
-            
-        return {"model_name": model_key, "cv_results": cv_results}
+        # 3. Prediction on Validation Set
+        ### MODIFICATION START: Renamed dadt -> dAdT ###
+        dAdt_exp_per_min = _rate_inputs(validation_df)[3] * beta_to_validate
+        ### MODIFICATION END ###
+
+        dAdt_pred_per_min = self._predict_rate_from_fit(fit_result, validation_df)
+
+        # Ensure arrays are aligned and finite for SSE calculation
+        valid_indices = np.isfinite(dAdt_exp_per_min) & np.isfinite(dAdt_pred_per_min)
+
+        # 4. Comparison (SSE) — dot instead of sum(x**2) skips the squared
+        # temporary and runs through BLAS.
+        diff = dAdt_pred_per_min[valid_indices] - dAdt_exp_per_min[valid_indices]
+        sse = float(diff @ diff)
+        return {"beta_validated": beta_to_validate, "SSE": sse, "params": fit_result['params'], "raw_params": fit_result['raw_params'], "error": None}
 
     def _predict_rate_from_fit(self, fit_result, df_to_predict):
         """NEW: Helper to predict reaction rate for a given dataframe and fitted model."""
+        if fit_result.get('raw_params') is None:
+            return np.full(len(df_to_predict), np.nan)
+        T_K, alpha, a1, _ = _rate_inputs(df_to_predict)
+        return self._predict_rate_from_arrays(fit_result, T_K, alpha, a1)
+
+    def _predict_rate_from_fit_batch(self, fit_result, dfs_to_predict):
+        """Predict rates for several traces with one kernel sweep.
+
+        Concatenates the cached per-trace arrays, evaluates the fitted rate
+        law once over the long array (one exp pass instead of one per β) and
+        splits the result back into per-trace views.
+        """
+        frames = list(dfs_to_predict)
+        if not frames or fit_result.get('raw_params') is None:
+            return [np.full(len(df), np.nan) for df in frames]
+        parts = [_rate_inputs(df)[:3] for df in frames]
+        T_K, alpha, a1 = (np.concatenate(cols) for cols in zip(*parts))
+        pred = self._predict_rate_from_arrays(fit_result, T_K, alpha, a1)
+        offsets = np.cumsum([p[0].size for p in parts])[:-1]
+        return np.split(pred, offsets)
+
+    def _predict_rate_from_arrays(self, fit_result, T_K, alpha, a1):
         model_name = fit_result.get('model_name', '').upper()
         raw_params = fit_result.get('raw_params')
-        if raw_params is None: return np.full_like(df_to_predict['Temp_K'].values, np.nan)
-        
-        T_K = df_to_predict['Temp_K'].values
-        alpha = np.clip(df_to_predict["alpha"].values, EPS, 1 - EPS)
-        a1 = np.clip(1 - alpha, EPS, None)
         dAdt_model_per_min = np.zeros_like(T_K)
 
         with np.errstate(all='ignore'):
             if model_name in ["CKA", "SB", "CKA (FIXED EA)"]:
                 m, n, p_, logA, Ea_J = raw_params
-                A_min = np.exp(logA)
-                f_alpha = (alpha**m) * (a1**n) * ((-np.log(a1))**p_)
-                dAdt_model_per_min = A_min * np.exp(-Ea_J / (R * T_K)) * f_alpha
-            
+                dAdt_model_per_min = _rate_sb(T_K, alpha, a1, m, n, p_, logA, Ea_J)
+
             ### MODIFICATION START: GlobalFit Prediction ###
             elif model_name == "GLOBALFIT":
                 m, n, p_, logA = raw_params
-                A_min = np.exp(logA)
-                f_alpha = (alpha**m) * (a1**n) * ((-np.log(a1))**p_)
-                # Get Ea from iso-conversional
-                ea_ser = self.ea.set_index("alpha")["Ea_kJ_per_mol"] * 1000
-                Ea_interp = np.interp(alpha, ea_ser.index, ea_ser.values)
-                dAdt_model_per_min = A_min * np.exp(-Ea_interp / (R * T_K)) * f_alpha
+                # Get Ea from iso-conversional (cached arrays, no set_index copy)
+                Ea_interp = np.interp(alpha, self._ea_alpha, self._ea_J)
+                dAdt_model_per_min = _rate_global(T_K, alpha, a1, Ea_interp, m, n, p_, logA)
             ### MODIFICATION END ###
-            
+
             elif model_name == "KAMAL-SOUROUR":
                 logA1, E1_J, logA2, E2_J, m, n = raw_params
-                k1 = np.exp(logA1) * np.exp(-E1_J / (R * T_K))
-                k2 = np.exp(logA2) * np.exp(-E2_J / (R * T_K))
-                dAdt_model_per_min = (k1 + k2 * (alpha**m)) * (a1**n)
+                dAdt_model_per_min = _rate_ks(T_K, alpha, a1, logA1, E1_J, logA2, E2_J, m, n)
             elif model_name == "GAI":
                 logA, E_J, n1, z0, n2 = raw_params
-                k = np.exp(logA) * np.exp(-E_J / (R * T_K))
-                f_alpha = (a1**n1) * (z0 + alpha**n2)
-                dAdt_model_per_min = k * f_alpha
+                dAdt_model_per_min = _rate_gai(T_K, alpha, a1, logA, E_J, n1, z0, n2)
             elif model_name == "PAR":
                 logA1, E1_J, n1, logA2, E2_J, n2 = raw_params
-                k1 = np.exp(logA1) * np.exp(-E1_J / (R * T_K))
-                k2 = np.exp(logA2) * np.exp(-E2_J / (R * T_K))
-                dAdt_model_per_min = k1 * (a1**n1) + k2 * (a1**n2)
-                
+                dAdt_model_per_min = _rate_par(T_K, a1, logA1, E1_J, n1, logA2, E2_J, n2)
+
         return dAdt_model_per_min
 
     def _on_cross_validation_success(self, data):
@@ -2323,9 +3515,7 @@ class App(tk.Tk):
         """NEW: Creates the Toplevel window to display all CV results."""
         model_name = data['model_name']
         win = tk.Toplevel(self); win.title(f"Cross-Validation Results ({model_name})")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico"); win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("1000x800")
         main_frame = ttk.Frame(win, padding=15); main_frame.pack(fill="both", expand=True)
 
@@ -2341,9 +3531,9 @@ class App(tk.Tk):
 
         tv_summary = ttk.Treeview(summary_frame, columns=('Held-out β (K/min)', 'Prediction SSE', 'Status'), show="headings", height=len(summary_df), style="Modern.Treeview")
         for col in tv_summary['columns']: tv_summary.heading(col, text=col); tv_summary.column(col, width=150, anchor='center')
-        for _, r in summary_df.iterrows():
-            status = "Success" if r['error'] is None else "Fit Failed"
-            tv_summary.insert("", "end", values=(f"{r['beta_validated']:.2f}", f"{r['SSE']:.3e}" if pd.notna(r['SSE']) else "N/A", status))
+        for beta_v, sse, err in summary_df.itertuples(index=False, name=None):
+            status = "Success" if err is None else "Fit Failed"
+            tv_summary.insert("", "end", values=(f"{beta_v:.2f}", f"{sse:.3e}" if pd.notna(sse) else "N/A", status))
         tv_summary.pack(fill="x", expand=True, pady=5)
 
         # --- Parameter Stability Table ---
@@ -2361,7 +3551,7 @@ class App(tk.Tk):
         param_cols = list(params_df.columns)
         tv_params = ttk.Treeview(params_frame, columns=param_cols, show="headings", style="Modern.Treeview")
         for c in param_cols: tv_params.heading(c, text=c); tv_params.column(c, width=100, anchor='e')
-        for _, r in params_df.iterrows():
+        for r in params_df.itertuples(index=False, name=None):
             vals = [f"{v:.4g}" if isinstance(v, (float, int)) else v for v in r]
             tv_params.insert("", "end", values=vals)
         
@@ -2420,7 +3610,7 @@ class App(tk.Tk):
             temp_df['Heating_Rate_Validated (K/min)'] = beta_val
             
             ### MODIFICATION START: Renamed dadt -> dAdT ###
-            temp_df['Experimental_Rate (min^-1)'] = validation_df['dAdT'] * beta_val
+            temp_df['Experimental_Rate (min^-1)'] = _rate_inputs(validation_df)[3] * beta_val
             ### MODIFICATION END ###
 
             if result['error'] is None and 'raw_params' in result:
@@ -2442,88 +3632,219 @@ class App(tk.Tk):
     # --- Refactored Fitting Logic Functions ---
     def resid_kamal_sourour(self, params, data):
         logA1, E1_J, logA2, E2_J, m, n = params
-        y_dadt_per_min, alpha, a1, T_K = data
+        y_dadt_per_min, inv_RT, ln_a, ln_a1 = data
+        with np.errstate(all='ignore'):
+            k1f, k2f = _ks_parts(inv_RT, ln_a, ln_a1, float(logA1), float(E1_J),
+                                 float(logA2), float(E2_J), float(m), float(n))
+            # TRF evaluates the Jacobian at the same point right after the
+            # residual: stash the transcendental factors for jac_kamal_sourour.
+            # Keyed on the data tuple as well as the params: the block solves
+            # evaluate several subproblems with identical start vectors but
+            # different data, and a params-only hit would leak another
+            # block's factor arrays.
+            self._jac_cache.ks = (tuple(params), id(data), k1f, k2f)
+            # One fresh output per call (the stashed factors must stay
+            # untouched and callers may hold several returned residuals);
+            # the chained out= avoids the intermediate temporaries.
+            r = k1f + k2f
+            np.subtract(r, y_dadt_per_min, out=r)
+            return r
+
+    def jac_kamal_sourour(self, params, data):
+        """Analytic Jacobian of resid_kamal_sourour w.r.t. (logA1,E1,logA2,E2,m,n)."""
         logA1, E1_J, logA2, E2_J, m, n = params
-        y_dAdt_per_min, alpha, a1, T_K = data
+        y_dAdt_per_min, inv_RT, ln_a, ln_a1 = data
         with np.errstate(all='ignore'):
-            k1 = np.exp(logA1) * np.exp(-E1_J / (R * T_K))
-            k2 = np.exp(logA2) * np.exp(-E2_J / (R * T_K))
-            y_calc = (k1 + k2 * (alpha**m)) * (a1**n)
-            return y_calc - y_dadt_per_min
-            return y_calc - y_dAdt_per_min
-            
+            cached = getattr(self._jac_cache, 'ks', None)
+            if cached is not None and cached[0] == tuple(params) and cached[1] == id(data):
+                k1f, k2f = cached[2], cached[3]
+            else:
+                k1f, k2f = _ks_parts(inv_RT, ln_a, ln_a1, float(logA1), float(E1_J),
+                                     float(logA2), float(E2_J), float(m), float(n))
+            J = np.empty((len(inv_RT), 6))
+            J[:, 0] = k1f
+            J[:, 1] = -k1f * inv_RT
+            J[:, 2] = k2f
+            J[:, 3] = -k2f * inv_RT
+            J[:, 4] = k2f * ln_a
+            J[:, 5] = (k1f + k2f) * ln_a1
+        return J
+
     def resid_gai(self, params, data):
         logA, E_J, n1, z0, n2 = params
-        y_dadt_per_min, alpha, a1, T_K = data
-        y_dAdt_per_min, alpha, a1, T_K = data
+        y_dadt_per_min, inv_RT, ln_a, ln_a1 = data
         with np.errstate(all='ignore'):
-            k = np.exp(logA) * np.exp(-E_J / (R * T_K))
-            f_alpha = (a1**n1) * (z0 + alpha**n2)
-            y_calc = k * f_alpha
-            return y_calc - y_dadt_per_min
-            return y_calc - y_dAdt_per_min
+            kf, alpha_n2 = _gai_parts(inv_RT, ln_a, ln_a1, float(logA), float(E_J),
+                                      float(n1), float(n2))
+            self._jac_cache.gai = (tuple(params), id(data), kf, alpha_n2)
+            r = alpha_n2 + z0
+            np.multiply(kf, r, out=r)
+            np.subtract(r, y_dadt_per_min, out=r)
+            return r
+
+    def jac_gai(self, params, data):
+        """Analytic Jacobian of resid_gai w.r.t. (logA, E, n1, z0, n2)."""
+        logA, E_J, n1, z0, n2 = params
+        y_dAdt_per_min, inv_RT, ln_a, ln_a1 = data
+        with np.errstate(all='ignore'):
+            cached = getattr(self._jac_cache, 'gai', None)
+            if cached is not None and cached[0] == tuple(params) and cached[1] == id(data):
+                kf, alpha_n2 = cached[2], cached[3]
+            else:
+                kf, alpha_n2 = _gai_parts(inv_RT, ln_a, ln_a1, float(logA), float(E_J),
+                                          float(n1), float(n2))
+            y_calc = kf * (z0 + alpha_n2)
+            J = np.empty((len(inv_RT), 5))
+            J[:, 0] = y_calc
+            J[:, 1] = -y_calc * inv_RT
+            J[:, 2] = y_calc * ln_a1
+            J[:, 3] = kf
+            J[:, 4] = kf * alpha_n2 * ln_a
+        return J
 
     def resid_par(self, params, data):
         logA1, E1_J, n1, logA2, E2_J, n2 = params
-        y_dadt_per_min, alpha, a1, T_K = data
-        y_dAdt_per_min, alpha, a1, T_K = data
+        y_dadt_per_min, inv_RT, ln_a, ln_a1 = data
         with np.errstate(all='ignore'):
-            k1 = np.exp(logA1) * np.exp(-E1_J / (R * T_K))
-            k2 = np.exp(logA2) * np.exp(-E2_J / (R * T_K))
-            y_calc = k1 * (a1**n1) + k2 * (a1**n2)
-            return y_calc - y_dadt_per_min
-            return y_calc - y_dAdt_per_min
-
-    def _fit_gai_logic(self, dfs, alphas):
+            k1f, k2f = _par_parts(inv_RT, ln_a1, float(logA1), float(E1_J), float(n1),
+                                  float(logA2), float(E2_J), float(n2))
+            self._jac_cache.par = (tuple(params), id(data), k1f, k2f)
+            r = k1f + k2f
+            np.subtract(r, y_dadt_per_min, out=r)
+            return r
+
+    def jac_par(self, params, data):
+        """Analytic Jacobian of resid_par w.r.t. (logA1, E1, n1, logA2, E2, n2)."""
+        logA1, E1_J, n1, logA2, E2_J, n2 = params
+        y_dAdt_per_min, inv_RT, ln_a, ln_a1 = data
+        with np.errstate(all='ignore'):
+            cached = getattr(self._jac_cache, 'par', None)
+            if cached is not None and cached[0] == tuple(params) and cached[1] == id(data):
+                k1f, k2f = cached[2], cached[3]
+            else:
+                k1f, k2f = _par_parts(inv_RT, ln_a1, float(logA1), float(E1_J), float(n1),
+                                      float(logA2), float(E2_J), float(n2))
+            J = np.empty((len(inv_RT), 6))
+            J[:, 0] = k1f
+            J[:, 1] = -k1f * inv_RT
+            J[:, 2] = k1f * ln_a1
+            J[:, 3] = k2f
+            J[:, 4] = -k2f * inv_RT
+            J[:, 5] = k2f * ln_a1
+        return J
+
+    def _block_least_squares(self, resid, jac, starts, lb, ub, datas):
+        """Solve independent (params_i, data_i) TRF subproblems as one call.
+
+        The blocks are stacked into a single least-squares problem with a
+        sparse block-diagonal Jacobian; the soft_l1 cost is separable across
+        blocks, so every block still converges to its own local minimum while
+        SciPy dispatch and the exp/power sweeps are amortized over one run.
+        Returns the converged parameters as an (n_blocks, n_params) array.
+        """
+        n_b, n_p = starts.shape
+
+        def resid_block(p_stacked):
+            P = p_stacked.reshape(n_b, n_p)
+            return np.concatenate([resid(P[i], datas[i]) for i in range(n_b)])
+
+        def jac_block(p_stacked):
+            P = p_stacked.reshape(n_b, n_p)
+            return sparse_block_diag([jac(P[i], datas[i]) for i in range(n_b)],
+                                     format='csr')
+
+        # Cap iterations at the single-problem default (100 * n_params):
+        # TRF's own default scales with the stacked size, letting one
+        # stubborn block drag out the whole run. Blocks that have not fully
+        # converged are finished by the caller's polish/warm-start step.
+        res = least_squares(resid_block, starts.ravel(),
+                            jac=jac_block,
+                            bounds=(np.tile(lb, n_b), np.tile(ub, n_b)),
+                            loss="soft_l1", x_scale='jac', method='trf',
+                            tr_solver='lsmr', max_nfev=100 * n_p)
+        return res.x.reshape(n_b, n_p)
+
+    def _lhs_starts(self, initial_guess, lb, ub, n_starts):
+        """The caller's guess plus Latin-hypercube starts across the bounds."""
+        sample = qmc.LatinHypercube(d=len(initial_guess), seed=0).random(n_starts - 1)
+        return np.vstack([initial_guess, lb + sample * (ub - lb)])
+
+    @staticmethod
+    def _soft_l1_cost(r):
+        """0.5 * sum(rho(r^2)) with the soft_l1 rho, as least_squares scores it."""
+        return float(np.sum(np.sqrt(1 + r**2) - 1))
+
+    def _multistart_least_squares(self, resid, jac, initial_guess, bounds, data, n_starts=8):
+        """Robust TRF fit from several starting points solved in one call.
+
+        The single-start fits are sensitive to the initial guess. The starts
+        are solved jointly via _block_least_squares and the best block is
+        then polished with a standard call so callers get an ordinary result
+        object with a dense final Jacobian for the covariance estimate.
+        """
+        lb, ub = (np.asarray(b, float) for b in bounds)
+        starts = self._lhs_starts(initial_guess, lb, ub, n_starts)
+        P = self._block_least_squares(resid, jac, starts, lb, ub, [data] * n_starts)
+        costs = [self._soft_l1_cost(resid(P[i], data)) for i in range(n_starts)]
+        best = P[int(np.nanargmin(costs))]
+        return least_squares(resid, best, jac=jac, args=(data,), bounds=bounds,
+                             loss="soft_l1", x_scale='jac', method='trf')
+
+    def _autocat_fit_setup(self, model_key):
+        """Residual/Jacobian pair, initial guess and bounds for one model."""
+        Ea_mean_J = self.ea['Ea_kJ_per_mol'].mean() * 1000
+        if model_key == "KS":
+            return (self.resid_kamal_sourour, self.jac_kamal_sourour,
+                    [15, Ea_mean_J * 0.8, 15, Ea_mean_J * 1.2, 0.5, 1.5],
+                    ([0, 10000, 0, 10000, 0, 0], [70, 400000, 70, 400000, 5, 5]))
+        if model_key == "GAI":
+            return (self.resid_gai, self.jac_gai,
+                    [15, Ea_mean_J, 1.0, 1e-4, 1.0],
+                    ([0, 10000, 0, 0, 0], [70, 400000, 5, 1, 5]))
+        if model_key == "PAR":
+            return (self.resid_par, self.jac_par,
+                    [15, Ea_mean_J * 0.9, 1.0, 15, Ea_mean_J * 1.1, 1.0],
+                    ([0, 10000, 0, 0, 10000, 0], [70, 400000, 5, 70, 400000, 5]))
+        raise ValueError(f"No autocatalytic fit setup for model: {model_key}")
+
+    def _autocat_solve(self, model_key, data, x0):
+        """Multistart solve, or a single warm-started run when x0 is given
+        (the batched CV hands over an already-converged block)."""
+        resid, jac, initial_guess, bounds = self._autocat_fit_setup(model_key)
+        if x0 is None:
+            return self._multistart_least_squares(resid, jac, initial_guess, bounds, data)
+        return least_squares(resid, x0, jac=jac, args=(data,), bounds=bounds,
+                             loss="soft_l1", x_scale='jac', method='trf')
+
+    def _fit_gai_logic(self, dfs, alphas, x0=None):
         data = self.prep_arrays_for_model_fit(dfs, alphas)
         if len(data[0]) < 20: raise ValueError("Too few data points for a reliable GAI fit.")
-        Ea_mean_J = self.ea['Ea_kJ_per_mol'].mean() * 1000
-        initial_guess = [15, Ea_mean_J, 1.0, 1e-4, 1.0]
-        bounds = ([0, 10000, 0, 0, 0], [70, 400000, 5, 1, 5])
-        res = least_squares(self.resid_gai, initial_guess, args=(data,), bounds=bounds, loss="soft_l1", x_scale='jac', method='trf')
+        res = self._autocat_solve("GAI", data, x0)
         if not res.success: raise RuntimeError("GAI optimization did not converge.")
         logA, E_J, n1, z0, n2 = res.x
-        try:
-            n_samples, n_params = len(data[0]), len(res.x)
-            cov = np.linalg.pinv(res.jac.T @ res.jac) * res.cost * 2 / (n_samples - n_params)
-            se = np.sqrt(np.diag(cov))
-        except: se = np.full(5, np.nan); cov = np.full((5, 5), np.nan)
+        cov, se = _cov_from_jac(res.jac, res.cost, len(data[0]), len(res.x))
         return {"model_name": "GAI", "params": {"Ea_kJ_per_mol": E_J / 1000, "A_per_s": np.exp(logA) / 60, "n1": n1, "z0": z0, "n2": n2},
                 "errors": {"Ea_kJ_per_mol": se[1] / 1000, "A_per_s": se[0] * np.exp(logA) / 60, "n1": se[2], "z0": se[3], "n2": se[4]},
                 "cov": cov, "raw_params": res.x, "param_order": ['logA', 'E_J', 'n1', 'z0', 'n2']}
 
-    def _fit_par_logic(self, dfs, alphas):
+    def _fit_par_logic(self, dfs, alphas, x0=None):
         data = self.prep_arrays_for_model_fit(dfs, alphas)
         if len(data[0]) < 20: raise ValueError("Too few data points for a reliable PAR fit.")
-        Ea_mean_J = self.ea['Ea_kJ_per_mol'].mean() * 1000
-        initial_guess = [15, Ea_mean_J * 0.9, 1.0, 15, Ea_mean_J * 1.1, 1.0]
-        bounds = ([0, 10000, 0, 0, 10000, 0], [70, 400000, 5, 70, 400000, 5])
-        res = least_squares(self.resid_par, initial_guess, args=(data,), bounds=bounds, loss="soft_l1", x_scale='jac', method='trf')
+        res = self._autocat_solve("PAR", data, x0)
         if not res.success: raise RuntimeError("PAR optimization did not converge.")
         logA1, E1_J, n1, logA2, E2_J, n2 = res.x
-        try:
-            n_samples, n_params = len(data[0]), len(res.x)
-            cov = np.linalg.pinv(res.jac.T @ res.jac) * res.cost * 2 / (n_samples - n_params)
-            se = np.sqrt(np.diag(cov))
-        except: se = np.full(6, np.nan); cov = np.full((6, 6), np.nan)
+        cov, se = _cov_from_jac(res.jac, res.cost, len(data[0]), len(res.x))
         return {"model_name": "PAR", "params": {"E1_kJ_per_mol": E1_J / 1000, "A1_per_s": np.exp(logA1) / 60, "n1": n1, "E2_kJ_per_mol": E2_J / 1000, "A2_per_s": np.exp(logA2) / 60, "n2": n2},
                 "errors": {"E1_kJ_per_mol": se[1] / 1000, "A1_per_s": se[0] * np.exp(logA1) / 60, "n1": se[2], "E2_kJ_per_mol": se[4] / 1000, "A2_per_s": se[3] * np.exp(logA2) / 60, "n2": se[5]},
                 "cov": cov, "raw_params": res.x, "param_order": ['logA1', 'E1_J', 'n1', 'logA2', 'E2_J', 'n2']}
 
-    def _fit_kamal_sourour_logic(self, dfs, alphas):
+    def _fit_kamal_sourour_logic(self, dfs, alphas, x0=None):
         data = self.prep_arrays_for_model_fit(dfs, alphas)
         if len(data[0]) < 20: raise ValueError("Too few data points for a reliable Kamal-Sourour fit.")
-        Ea_mean_J = self.ea['Ea_kJ_per_mol'].mean() * 1000
-        initial_guess = [15, Ea_mean_J * 0.8, 15, Ea_mean_J * 1.2, 0.5, 1.5]
-        bounds = ([0, 10000, 0, 10000, 0, 0], [70, 400000, 70, 400000, 5, 5])
-        res = least_squares(self.resid_kamal_sourour, initial_guess, args=(data,), bounds=bounds, loss="soft_l1", x_scale='jac', method='trf')
+        res = self._autocat_solve("KS", data, x0)
         if not res.success: raise RuntimeError("Kamal-Sourour optimization did not converge.")
         logA1, E1_J, logA2, E2_J, m, n = res.x
-        try:
-            n_samples, n_params = len(data[0]), len(res.x)
-            cov = np.linalg.pinv(res.jac.T @ res.jac) * res.cost * 2 / (n_samples - n_params)
-            se = np.sqrt(np.diag(cov))
-        except: se = np.full(6, np.nan); cov = np.full((6, 6), np.nan)
+        cov, se = _cov_from_jac(res.jac, res.cost, len(data[0]), len(res.x))
         return {"model_name": "Kamal-Sourour", "params": {"E1_kJ_per_mol": E1_J / 1000, "A1_per_s": np.exp(logA1) / 60, "E2_kJ_per_mol": E2_J / 1000, "A2_per_s": np.exp(logA2) / 60, "m": m, "n": n},
                 "errors": {"E1_kJ_per_mol": se[1] / 1000, "A1_per_s": se[0] * np.exp(logA1) / 60, "E2_kJ_per_mol": se[3] / 1000, "A2_per_s": se[2] * np.exp(logA2) / 60, "m": se[4], "n": se[5]},
                 "cov": cov, "raw_params": res.x, "param_order": ['logA1', 'E1_J', 'logA2', 'E2_J', 'm', 'n']}
@@ -2542,9 +3863,7 @@ class App(tk.Tk):
         if not hasattr(self, 'autocatalytic_results') or not self.autocatalytic_results: return
         results, model_name = self.autocatalytic_results, self.autocatalytic_results['model_name']
         win = tk.Toplevel(self, bg=self.BG); win.title(f"{model_name} Fit Results")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico"); win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("800x600")
 
         frame = ttk.Frame(win, padding="20"); frame.pack(fill="both", expand=True)
@@ -2585,10 +3904,7 @@ class App(tk.Tk):
             eq_text = (f"$d\\alpha/dt = A_1 e^{{-E_1/RT}}(1-\\alpha)^{{n_1}} + A_2 e^{{-E_2/RT}}(1-\\alpha)^{{n_2}}$\n"
                        f"$E_1={p_vals.get('E1_kJ_per_mol', 0):.1f}$, $A_1={p_vals.get('A1_per_s', 0):.2e}$, $n_1={p_vals.get('n1', 0):.2f}$\n"
                        f"$E_2={p_vals.get('E2_kJ_per_mol', 0):.1f}$, $A_2={p_vals.get('A2_per_s', 0):.2e}$, $n_2={p_vals.get('n2', 0):.2f}$")
-        fig_eq = plt.figure(figsize=(8, 3), facecolor=self.BG)
-        fig_eq.text(0.5, 0.5, eq_text, va='center', ha='center', fontsize=11, color=self.FG, multialignment='center')
-        canvas = FigureCanvasTkAgg(fig_eq, master=frame); canvas.draw()
-        canvas.get_tk_widget().pack(fill='x', expand=False, pady=(10, 15)); plt.close(fig_eq)
+        self._equation_label(frame, eq_text, (8, 3), 11).pack(fill='x', expand=False, pady=(10, 15))
         tv_cols = ("Parameter", "Value", "Std. Error")
         tv = ttk.Treeview(frame, columns=tv_cols, show="headings", height=len(p)+1, style="Modern.Treeview"); tv.pack(fill="x", expand=True)
         for col_id in tv_cols: tv.heading(col_id, text=col_id); tv.column(col_id, anchor="center")
@@ -2601,20 +3917,21 @@ class App(tk.Tk):
         if not hasattr(self, 'autocatalytic_results') or not self.autocatalytic_results: return
         fig, ax = plt.subplots(figsize=(7, 5.5))
         num_curves = 0
-        for beta_k_min, df in self.dfs.items():
-            
+        fit_rates = self._predict_rate_from_fit_batch(self.autocatalytic_results, self.dfs.values())
+        for (beta_k_min, df), dAdt_model_per_min in zip(self.dfs.items(), fit_rates):
+            T_K = _rate_inputs(df)[0]
+
             ### MODIFICATION START: Renamed dadt -> dAdT ###
-            dAdt_exp_per_min = df['dAdT'] * beta_k_min 
+            dAdt_exp_per_min = _rate_inputs(df)[3] * beta_k_min
             ### MODIFICATION END ###
-            
-            p = ax.plot(df['Temp_K'], dAdt_exp_per_min, 'o', ms=4, alpha=0.6, label=f"β={beta_k_min:.1f} (Exp.)")
+
+            p = ax.plot(T_K, dAdt_exp_per_min, 'o', ms=4, alpha=0.6, label=f"β={beta_k_min:.1f} (Exp.)")
             exp_color = p[0].get_color()
             num_curves += 1
-            dAdt_model_per_min = self._predict_rate_from_fit(self.autocatalytic_results, df)
-            ax.plot(df['Temp_K'], dAdt_model_per_min, '-', color=exp_color, lw=2.0, label=f"β={beta_k_min:.1f} (Fit)")
+            ax.plot(T_K, dAdt_model_per_min, '-', color=exp_color, lw=2.0, label=f"β={beta_k_min:.1f} (Fit)")
             num_curves += 1
         ax.set_xlabel("Temperature (K)"); ax.set_ylabel(r"Reaction Rate, d$\alpha$/dt (min$^{-1}$)")
-        ax.margins(x=0); self.add_smart_legend(fig, ax, num_curves); fig.tight_layout()
+        ax.margins(x=0); self.add_smart_legend(fig, ax, num_curves)
         self._create_plot_window(fig, f"{self.autocatalytic_results['model_name']} Fit Plot")
         
     def run_cka_analysis(self):
@@ -2626,44 +3943,70 @@ class App(tk.Tk):
         try:
             a_min, a_max = map(float, rng.split(','))
             if not (0 < a_min < a_max < 1): raise ValueError
-            fit_alphas = np.round(np.arange(a_min, a_max + EPS, 0.01), 4)
+            fit_alphas, _ = get_alpha_grid(a_min, a_max)
         except (ValueError, IndexError): return messagebox.showerror("Error", "Invalid α range format.")
         self._start_task(self._calculate_cka_logic, self.dfs, fit_alphas, on_success=self._on_cka_success)
 
     def prep_arrays_for_model_fit(self, dfs, alphas):
-        y_dadt_per_min, a, a1, T = [], [], [], []
+        # Collect per-β masked arrays and concatenate once at the end instead
+        # of growing Python lists element by element.
         y_dAdt_per_min, a, a1, T = [], [], [], []
         for β, df in dfs.items():
-            alpha_vals = np.clip(df["alpha"].values, EPS, 1 - EPS)
-            
+            temp_vals, alpha_vals, a1_vals, dAdT_vals = _rate_inputs(df)
+
             ### MODIFICATION START: Renamed dadt -> dAdT ###
-            mask = (alpha_vals >= alphas.min()) & (alpha_vals <= alphas.max()) & np.isfinite(df["dAdT"].values)
+            mask = ((alpha_vals >= alphas.min()) & (alpha_vals <= alphas.max())
+                    & np.isfinite(dAdT_vals) & np.isfinite(temp_vals))
             ### MODIFICATION END ###
-            
+
             alpha_masked = alpha_vals[mask]
             if len(alpha_masked) == 0: continue
-            
+
             ### MODIFICATION START: Renamed dadt -> dAdT ###
-            y_dAdt_per_min.extend(df["dAdT"].values[mask] * β) # Convert to rate per minute
+            y_dAdt_per_min.append(dAdT_vals[mask] * β) # Convert to rate per minute
             ### MODIFICATION END ###
-            
-            a.extend(alpha_masked); a1.extend(np.clip(1 - alpha_masked, EPS, None)); T.extend(df["Temp_K"].values[mask])
-        arrs = [np.asarray(v, float) for v in (y_dadt_per_min, a, a1, T)]
-        arrs = [np.asarray(v, float) for v in (y_dAdt_per_min, a, a1, T)]
-        good = np.all(np.isfinite(arrs), axis=0)
-        return tuple(ar[good] for ar in arrs)
+
+            a.append(alpha_masked); a1.append(a1_vals[mask]); T.append(temp_vals[mask])
+        if not a:
+            return tuple(np.empty(0) for _ in range(4))
+        y, a, a1, T = (np.concatenate(parts).astype(float, copy=False)
+                       for parts in (y_dAdt_per_min, a, a1, T))
+        # T, α and 1-α never change during the fit: hand the residuals the
+        # precomputed 1/(R·T) and log basis so each TRF iteration is pure
+        # multiply-add work (see _ks_parts/_gai_parts/_par_parts).
+        return y, 1.0 / (R * T), np.log(a), np.log(a1)
 
     def resid_cka(self, par, data):
-        # --- MODIFICATION: Ea is now fixed and passed in data ---
+        # --- MODIFICATION: Ea is now fixed and folded into ea_over_RT ---
+        # Same log-basis data tuple as the global SB fit, so the compiled
+        # _sb_resid_core/_sb_jac_core kernels are shared.
         m, n, p_, logA = par
-        y_dAdt_per_min, a, a1, T, Ea_J = data # Ea_J is now fixed
+        y_dAdt_per_min, ln_a, ln_l, ln_ln_l, ea_over_RT = data
         # --- END MODIFICATION ---
-        
+
+        with np.errstate(all='ignore'):
+            r = _sb_resid_core(float(m), float(n), float(p_), float(logA),
+                               y_dAdt_per_min, ln_a, ln_l, ln_ln_l, ea_over_RT)
+        self._jac_cache.cka = (tuple(par), id(data), r + y_dAdt_per_min)
+        return r
+
+    def jac_cka(self, par, data):
+        """Analytic Jacobian of resid_cka w.r.t. (m, n, p, logA); Ea is fixed."""
+        m, n, p_, logA = par
+        y_dAdt_per_min, ln_a, ln_l, ln_ln_l, ea_over_RT = data
         with np.errstate(all='ignore'):
-            f_alpha = (a**m) * (a1**n) * ((-np.log(a1))**p_)
-        A_per_min = math.exp(logA)
-        y_calc = A_per_min * np.exp(-Ea_J / (R * T)) * f_alpha
-        return y_calc - y_dAdt_per_min
+            cached = getattr(self._jac_cache, 'cka', None)
+            if cached is not None and cached[0] == tuple(par) and cached[1] == id(data):
+                y_calc = cached[2]
+                J = np.empty((len(y_calc), 4))
+                J[:, 0] = y_calc * ln_a
+                J[:, 1] = -y_calc * ln_l
+                J[:, 2] = y_calc * ln_ln_l
+                J[:, 3] = y_calc
+            else:
+                J = _sb_jac_core(float(m), float(n), float(p_), float(logA),
+                                 ln_a, ln_l, ln_ln_l, ea_over_RT)
+        return J
 
     def _calculate_cka_logic(self, dfs, alphas):
         """
@@ -2704,38 +4047,36 @@ class App(tk.Tk):
         # --- 5. Prepare data arrays, now passing Ea_fixed_J ---
         y_dAdt_per_min, a, a1, T = [], [], [], []
         for β, df in dfs.items():
-            alpha_vals = np.clip(df["alpha"].values, EPS, 1 - EPS)
-            mask = (alpha_vals >= alphas.min()) & (alpha_vals <= alphas.max()) & np.isfinite(df["dAdT"].values)
+            temp_vals, alpha_vals, a1_vals, dAdT_vals = _rate_inputs(df)
+            mask = (alpha_vals >= alphas.min()) & (alpha_vals <= alphas.max()) & np.isfinite(dAdT_vals)
             alpha_masked = alpha_vals[mask]
             if len(alpha_masked) == 0: continue
-            
-            y_dAdt_per_min.extend(df["dAdT"].values[mask] * β) 
-            a.extend(alpha_masked); a1.extend(np.clip(1 - alpha_masked, EPS, None)); T.extend(df["Temp_K"].values[mask])
+
+            y_dAdt_per_min.extend(dAdT_vals[mask] * β)
+            a.extend(alpha_masked); a1.extend(a1_vals[mask]); T.extend(temp_vals[mask])
         
         arrs = [np.asarray(v, float) for v in (y_dAdt_per_min, a, a1, T)]
         good = np.all(np.isfinite(arrs), axis=0)
-        
-        # Add the fixed Ea to the data tuple
-        data = tuple(ar[good] for ar in arrs) + (np.full(np.sum(good), Ea_fixed_J),)
-        
+        y, a, a1, T = (ar[good] for ar in arrs)
+
+        # Fold the fixed Ea into ea_over_RT and hand resid_cka the same
+        # precomputed log basis the global SB fit uses.
+        ln_l = -np.log(a1)
+        data = (y, np.log(a), ln_l, np.log(ln_l), Ea_fixed_J / (R * T))
+
         if len(data[0]) < 10: raise ValueError("Too few data points for a reliable CKA fit.")
         
         # --- 6. Perform 4-parameter optimization ---
         initial_guess = [1, 1, 0, 30] # m, n, p, logA
         bounds = ([0, 0, 0, -30], [5, 5, 5, 70]) # Bounds for m, n, p, logA
         
-        res = least_squares(self.resid_cka, initial_guess, args=(data,), bounds=bounds, loss="soft_l1", x_scale='jac', method='trf')
+        res = least_squares(self.resid_cka, initial_guess, jac=self.jac_cka, args=(data,), bounds=bounds, loss="soft_l1", x_scale='jac', method='trf')
         if not res.success: raise RuntimeError("The CKA (Fixed Ea) optimization did not converge.")
         
         m, n, p_, logA = res.x
         
         # --- 7. Calculate Std. Errors for the 4 fitted parameters ---
-        try:
-            n_samples, n_params = len(data[0]), len(res.x) # n_params is 4
-            cov = np.linalg.pinv(res.jac.T @ res.jac) * res.cost * 2 / (n_samples - n_params)
-            se = np.sqrt(np.diag(cov)) # 4-element array
-        except: 
-            se = np.full(4, np.nan); cov = np.full((4, 4), np.nan)
+        cov, se = _cov_from_jac(res.jac, res.cost, len(data[0]), len(res.x))
         
         # --- 8. Re-assemble the full 5-parameter result set ---
         return {
@@ -2777,10 +4118,7 @@ class App(tk.Tk):
         # --- END MODIFICATION ---
 
         win = tk.Toplevel(self, bg=self.BG); win.title(win_title)
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.co")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("800x550")
 
         frame = ttk.Frame(win, padding="20"); frame.pack(fill="both", expand=True)
@@ -2803,10 +4141,7 @@ class App(tk.Tk):
         ttk.Button(btn_frame, text="Compare Mechanism Shape...", command=lambda: self.launch_mechanism_comparison(fit_type='cka'), style="Secondary.TButton").pack(side="right", padx=5)
         p = self.cka_results['params']
         eq_text = f"$f(\\alpha) = \\alpha^{{{p['m']:.2f}}} (1-\\alpha)^{{{p['n']:.2f}}} [-\\ln(1-\\alpha)]^{{{p['p']:.2f}}}$"
-        fig_eq = plt.figure(figsize=(6, 1.5), facecolor=self.BG)
-        fig_eq.text(0.5, 0.5, eq_text, va='center', ha='center', fontsize=12, color=self.FG)
-        canvas = FigureCanvasTkAgg(fig_eq, master=frame); canvas.draw()
-        canvas.get_tk_widget().pack(fill='x', expand=False, pady=(10,15)); plt.close(fig_eq)
+        self._equation_label(frame, eq_text, (6, 1.5), 12).pack(fill='x', expand=False, pady=(10,15))
 
         tv_cols = ("Parameter", "Value", "Std. Error")
         tv = ttk.Treeview(frame, columns=tv_cols, show="headings", height=6, style="Modern.Treeview"); tv.pack(fill="x", expand=True)
@@ -2829,22 +4164,22 @@ class App(tk.Tk):
         fig, ax = plt.subplots(figsize=(6, 5))
         
         num_curves = 0
-        for i, (beta_k_min, df) in enumerate(self.dfs.items()):
+        fit_rates = self._predict_rate_from_fit_batch(self.cka_results, self.dfs.values())
+        for (beta_k_min, df), dAdt_model_per_min in zip(self.dfs.items(), fit_rates):
+            T_K = _rate_inputs(df)[0]
             ### MODIFICATION START: Renamed dadt -> dAdT ###
-            dAdt_exp_per_min = df['dAdT'] * beta_k_min 
+            dAdt_exp_per_min = _rate_inputs(df)[3] * beta_k_min
             ### MODIFICATION END ###
-            
-            ax.plot(df['Temp_K'], dAdt_exp_per_min, '--', alpha=0.7, label=f"β={beta_k_min:.1f} (Exp.)")
+
+            ax.plot(T_K, dAdt_exp_per_min, '--', alpha=0.7, label=f"β={beta_k_min:.1f} (Exp.)")
             num_curves += 1
 
-            dAdt_model_per_min = self._predict_rate_from_fit(self.cka_results, df)
-            ax.plot(df['Temp_K'], dAdt_model_per_min, '-', label=f"β={beta_k_min:.1f} (CKA Fit)")
+            ax.plot(T_K, dAdt_model_per_min, '-', label=f"β={beta_k_min:.1f} (CKA Fit)")
             num_curves += 1
 
         ax.set_xlabel("Temperature (K)"); ax.set_ylabel(r"Reaction Rate, d$\alpha$/dt (min$^{-1}$)")
         ax.margins(x=0)
         self.add_smart_legend(fig, ax, num_curves)
-        fig.tight_layout()
         self._create_plot_window(fig, "CKA Fit Plot")
 
     def launch_mechanism_comparison(self, fit_type):
@@ -2876,7 +4211,7 @@ class App(tk.Tk):
         if not fit_results:
             return messagebox.showwarning("No Data", f"Please run a relevant analysis first.")
         
-        dlg = ModelSelectionDialog(self, IDEAL_MODELS)
+        dlg = ModelSelectionDialog(self, IDEAL_MODEL_NAMES)
         self.wait_window(dlg)
         
         if dlg.result:
@@ -2886,10 +4221,7 @@ class App(tk.Tk):
     def show_mechanism_comparison_results(self, selected_models, fit_results, fit_name):
         win = tk.Toplevel(self)
         win.title(f"Mechanism Comparison ({fit_name})")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("900x750")
 
         main_frame = ttk.Frame(win, padding=15)
@@ -2902,6 +4234,11 @@ class App(tk.Tk):
         
         exp_col_name = f'Experimental ({fit_name})'
 
+        # Evaluate every selected model into one packed matrix, plus f(0.5)
+        # for normalization — two buffers total instead of one per model.
+        F_table = eval_models(selected_models, alphas_table)
+        F_half = eval_models(selected_models, 0.5)[:, 0]
+
         with np.errstate(divide='ignore', invalid='ignore'):
             f_exp = alphas_table**m * (1 - alphas_table)**n * (-np.log(1 - alphas_table))**p_
             f_exp_05 = 0.5**m * (1 - 0.5)**n * (-np.log(1 - 0.5))**p_
@@ -2909,10 +4246,9 @@ class App(tk.Tk):
             comparison_df[exp_col_name] = y_exp_norm
 
             ranking_results = []
-            for model_code in selected_models:
-                model_func = IDEAL_MODELS[model_code][1]
-                f_ideal = model_func(alphas_table)
-                f_ideal_05 = model_func(np.array(0.5))
+            for row, model_code in enumerate(selected_models):
+                f_ideal = F_table[row]
+                f_ideal_05 = F_half[row]
                 y_model_norm = f_ideal / f_ideal_05 if np.abs(f_ideal_05) > EPS else np.full_like(f_ideal, np.nan)
                 comparison_df[model_code] = y_model_norm
 
@@ -2923,7 +4259,7 @@ class App(tk.Tk):
                     r2 = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0.0
                 else:
                     r2 = np.nan
-                ranking_results.append({'Model Code': model_code, 'Model Name': IDEAL_MODELS[model_code][0], 'R-squared': r2})
+                ranking_results.append({'Model Code': model_code, 'Model Name': IDEAL_MODEL_NAMES[model_code], 'R-squared': r2})
             
             ranking_df = pd.DataFrame(ranking_results).sort_values(by='R-squared', ascending=False).reset_index(drop=True)
             self.mech_ranking = ranking_df
@@ -2967,24 +4303,25 @@ class App(tk.Tk):
     def plot_mechanism_comparison_graph(self, comparison_df, exp_col_name):
         fig, ax = plt.subplots(figsize=(6, 5))
         num_items = 0
+        alphas_dense = np.linspace(0.01, 0.99, 200)
+        model_cols = [c for c in comparison_df.columns
+                      if c != 'alpha' and 'Experimental' not in c]
+        # All dense curves land in one packed matrix instead of one array each.
+        F_dense = eval_models(model_cols, alphas_dense)
+        F_half = eval_models(model_cols, 0.5)[:, 0]
         for column in comparison_df.columns:
-            if column == 'alpha': continue
+            if column == 'alpha' or 'Experimental' not in column: continue
             num_items += 1
-            if 'Experimental' in column:
-                ax.plot(comparison_df['alpha'], comparison_df[column], 'p', color='black', markersize=6, label=column, zorder=10)
-            else:
-                alphas_dense = np.linspace(0.01, 0.99, 200)
-                model_func = IDEAL_MODELS[column][1]
-                with np.errstate(divide='ignore', invalid='ignore'):
-                    f_ideal = model_func(alphas_dense)
-                    f_ideal_05 = model_func(np.array(0.5))
-                    if np.abs(f_ideal_05) > EPS:
-                        ax.plot(alphas_dense, f_ideal / f_ideal_05, label=column)
+            ax.plot(comparison_df['alpha'], comparison_df[column], 'p', color='black', markersize=6, label=column, zorder=10)
+        for row, column in enumerate(model_cols):
+            num_items += 1
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if np.abs(F_half[row]) > EPS:
+                    ax.plot(alphas_dense, F_dense[row] / F_half[row], label=column)
 
         ax.set_xlabel(r"Conversion, $\alpha$"); ax.set_ylabel(r"$f(\alpha) / f(0.5)$")
         ax.set_xlim(0, 1.0); ax.set_ylim(0, 2.1)
         self.add_smart_legend(fig, ax, num_items)
-        fig.tight_layout()
         self._create_plot_window(fig, "Mechanism Shape Comparison Plot")
     
     def launch_prediction_dialog(self):
@@ -3024,10 +4361,7 @@ class App(tk.Tk):
         model_source = results['model_source']
         
         win = tk.Toplevel(self); win.configure(bg=self.BG); win.title(f"Conversion Time Prediction @ {T0} K (from {model_source})")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("900x600")
 
         frame = ttk.Frame(win, padding=10); frame.pack(fill="both", expand=True)
@@ -3342,8 +4676,7 @@ class App(tk.Tk):
             # This elif now correctly follows the if block
             elif model_name in ["CKA", "CKA (Fixed Ea)", "GlobalFit"]:
                 if model_info.get('Ea_source') == 'isoconversional':
-                    ea_ser = self.ea.set_index("alpha")["Ea_kJ_per_mol"] * 1000
-                    Ea_J = np.interp(alpha_clipped, ea_ser.index, ea_ser.values)
+                    Ea_J = np.interp(alpha_clipped, self._ea_alpha, self._ea_J)
                 else:
                     Ea_J = params.get('Ea_kJ_per_mol', self.ea['Ea_kJ_per_mol'].mean()) * 1000
                 
@@ -3437,6 +4770,8 @@ class App(tk.Tk):
 
     def _add_plot_to_doc(self, doc, plot_type, data_source=None):
         """Generates a plot in memory and adds it to the Word doc."""
+        from docx.shared import Cm
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
         fig, ax = plt.subplots(figsize=(14/2.54, 10/2.54))
         
         if plot_type == 'Ea':
@@ -3458,11 +4793,11 @@ class App(tk.Tk):
             # Handle fit history plots
             params = data_source['params']
             model_name = data_source.get('model_name', 'Model')
-            for beta, df in self.dfs.items():
-                rate_exp = df['dAdT'] * beta 
+            fit_rates = self._predict_rate_from_fit_batch(data_source, self.dfs.values())
+            for (beta, df), rate_calc in zip(self.dfs.items(), fit_rates):
+                rate_exp = df['dAdT'] * beta
                 p = ax.plot(df['Temp_K'], rate_exp, 'o', ms=2, alpha=0.4, label=f"{beta} (Exp)")
                 color = p[0].get_color()
-                rate_calc = self._predict_rate_from_fit(data_source, df)
                 ax.plot(df['Temp_K'], rate_calc, '-', color=color, lw=1.5)
             ax.set_xlabel("Temperature (K)")
             ax.set_ylabel(r"Rate, $d\alpha/dt$ (min$^{-1}$)")
@@ -3495,6 +4830,7 @@ class App(tk.Tk):
         plt.close(fig)
 
     def _save_report_worker(self, path):
+        from docx import Document
         doc = Document()
         doc.add_heading("Comprehensive Kinetic Analysis Report", 0)
         doc.add_paragraph(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}")
@@ -3719,9 +5055,7 @@ class App(tk.Tk):
         
     def show_parameter_table(self, results_df, title, plot_callback):
         win = tk.Toplevel(self); win.title(title); win.geometry("900x500")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico"); win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         frame = ttk.Frame(win, padding="20"); frame.pack(fill="both", expand=True)
         btn_frame = ttk.Frame(frame); btn_frame.pack(fill="x", pady=5)
         ttk.Label(btn_frame, text=title, font=("Segoe UI", 12, "bold")).pack(side="left")
@@ -3755,14 +5089,15 @@ class App(tk.Tk):
     def _export_plot_data_cka(self):
         if not self.cka_results or not self.dfs: return messagebox.showwarning("No Data", "No CKA results to export.")
         all_data = []
-        for beta_k_min, df in self.dfs.items():
+        fit_rates = self._predict_rate_from_fit_batch(self.cka_results, self.dfs.values())
+        for (beta_k_min, df), fit_rate in zip(self.dfs.items(), fit_rates):
             temp_df = df[['Temp_K', 'alpha']].copy(); temp_df['Heating_Rate (K/min)'] = beta_k_min
-            
+
             ### MODIFICATION START: Renamed dadt -> dAdT ###
             temp_df['Experimental_Rate (min^-1)'] = df['dAdT'] * beta_k_min
             ### MODIFICATION END ###
-            
-            temp_df['CKA_Fit_Rate (min^-1)'] = self._predict_rate_from_fit(self.cka_results, df)
+
+            temp_df['CKA_Fit_Rate (min^-1)'] = fit_rate
             all_data.append(temp_df)
         self._export_table(pd.concat(all_data, ignore_index=True), "CKA_Fit_Comparison_Data")
     
@@ -3791,7 +5126,7 @@ class App(tk.Tk):
             ax2.plot(df['Temp_K'], -df['DTG_min'], '--', label=f"DTG ({label})")
         ax1.set_xlabel("Temperature (K)"); ax1.set_ylabel("TG (%)", color=NATURE_COLORS[0]); ax2.set_ylabel("Mass Loss Rate (%/min)", color=NATURE_COLORS[1])
         ax1.tick_params(axis='y', labelcolor=NATURE_COLORS[0]); ax2.tick_params(axis='y', labelcolor=NATURE_COLORS[1])
-        ax1.margins(x=0); self.add_smart_legend(fig, ax1, num_items=len(self.dfs) * 2); fig.tight_layout()
+        ax1.margins(x=0); self.add_smart_legend(fig, ax1, num_items=len(self.dfs) * 2)
         self._create_plot_window(fig, "TG/DTG Analysis Plot")
 
     def plot_dsc(self, results_df, baselines):
@@ -3809,7 +5144,7 @@ class App(tk.Tk):
                 sub_df = df[mask]; baseline_vals = np.linspace(y_start, y_end, len(sub_df))
                 ax.fill_between(sub_df['Temp_K'], sub_df['DSC'] / mass, baseline_vals, alpha=0.3)
         ax.set_xlabel("Temperature (K)"); ax.set_ylabel("Heat flow (a.u.)"); ax.set_yticks([]); ax.margins(x=0)
-        self.add_smart_legend(fig, ax, num_curves); fig.tight_layout()
+        self.add_smart_legend(fig, ax, num_curves)
         self._create_plot_window(fig, "DSC Analysis Plot", is_thermo_plot=True)
 
     ### NEW FUNCTION START: TG vs TG PLOT ###
@@ -3835,7 +5170,7 @@ class App(tk.Tk):
                 print(f"Could not predict TG curve for beta={beta_k_min}: {e}")
         
         ax.set_xlabel("Temperature (K)"); ax.set_ylabel(r"TG (%)")
-        ax.margins(x=0); self.add_smart_legend(fig, ax, num_curves); fig.tight_layout()
+        ax.margins(x=0); self.add_smart_legend(fig, ax, num_curves)
         self._create_plot_window(fig, f"Model TG vs. Experimental TG ({self.last_fitted_model['source']})")
 
     def export_tg_fit_table(self):
@@ -3896,8 +5231,7 @@ class App(tk.Tk):
                 m, n, p_, logA = raw_params
                 A_min = np.exp(logA)
                 f_alpha = (alpha**m) * (a1**n) * ((-np.log(a1))**p_)
-                ea_ser = self.ea.set_index("alpha")["Ea_kJ_per_mol"] * 1000
-                Ea_interp = np.interp(alpha, ea_ser.index, ea_ser.values)
+                Ea_interp = np.interp(alpha, self._ea_alpha, self._ea_J)
                 dAdt_per_min = A_min * np.exp(-Ea_interp / (R * T_K)) * f_alpha
                 dAdt_per_sec = dAdt_per_min / 60.0
             
@@ -3939,6 +5273,25 @@ class App(tk.Tk):
         if (m0 - m_inf) == 0:
             m0, m_inf = (100.0, 0.0)
 
+        # Fast path: integrate with numbalsoda's compiled rhs when the fitted
+        # model maps onto one of the packed parameter families.
+        if HAS_NUMBALSODA and beta_K_per_s > 0 and model_info.get('raw_params') is not None:
+            data = _lifetime_rhs_data(model_info.get('model_name', ''),
+                                      model_info['raw_params'], beta_K_per_s)
+            if data is not None:
+                T_eval_arr = np.asarray(T_eval, dtype=float)
+                usol, success = lsoda(_LIFETIME_RHS_PTR,
+                                      np.array([alpha_initial], dtype=float),
+                                      T_eval_arr, data=data)
+                if success:
+                    alpha_model = usol[:, 0].clip(0, 1)
+                    tg_pct_model = m0 - (alpha_model * (m0 - m_inf))
+                    return pd.DataFrame({
+                        'Temp_K': T_eval_arr,
+                        'alpha_model': alpha_model,
+                        'TG_pct_model': tg_pct_model
+                    })
+
         # Define the function for the ODE solver
         # The solver's function must take (t, y) which for us is (T, alpha)
         ode_func = lambda T, alpha: self._get_model_dAdT(T, alpha, model_info, beta_K_per_s)
@@ -3984,7 +5337,7 @@ class App(tk.Tk):
         try:
             a_min, a_max = map(float, rng.split(','))
             if not (0 < a_min < a_max < 1): raise ValueError
-            fit_alphas = np.round(np.arange(a_min, a_max + EPS, 0.01), 4)
+            fit_alphas, _ = get_alpha_grid(a_min, a_max)
         except (ValueError, IndexError): return messagebox.showerror("Error", "Invalid α range format.")
         
         self._start_task(self._run_npa_worker, self.dfs, self.ea, fit_alphas, on_success=self._on_npa_success)
@@ -4062,10 +5415,7 @@ class App(tk.Tk):
         """
         if self.npa_results is None or self.npa_results.empty: return # <--- ### MODIFICATION ###
         win = tk.Toplevel(self, bg=self.BG); win.title("Non-Parametric Analysis (NPA) Results")
-        try:
-            icon_path = self.resource_path("BIT_Kinetics_Icon_Tight.ico")
-            win.iconbitmap(icon_path)
-        except Exception: pass
+        self._apply_icon(win)
         win.geometry("800x550")
 
         frame = ttk.Frame(win, padding="20"); frame.pack(fill="both", expand=True)
@@ -4076,10 +5426,7 @@ class App(tk.Tk):
         ttk.Button(btn_frame, text="Predict Conversion Time...", command=self.launch_prediction_dialog, style="Secondary.TButton").pack(side="right", padx=5)
         ttk.Button(btn_frame, text="Plot Results", command=self.plot_npa_results, style="Secondary.TButton").pack(side="right", padx=5)
 
-        fig_eq = plt.figure(figsize=(6, 1.5), facecolor=self.BG)
-        fig_eq.text(0.5, 0.5, r"$Z(\alpha) = (d\alpha/dt) / \exp(-E_a(\alpha)/RT)$", va='center', ha='center', fontsize=12, color=self.FG)
-        canvas = FigureCanvasTkAgg(fig_eq, master=frame); canvas.draw()
-        canvas.get_tk_widget().pack(fill='x', expand=False, pady=(10,15)); plt.close(fig_eq)
+        self._equation_label(frame, r"$Z(\alpha) = (d\alpha/dt) / \exp(-E_a(\alpha)/RT)$", (6, 1.5), 12).pack(fill='x', expand=False, pady=(10,15))
 
         tv_cols = ("α", "Z(α) (s⁻¹)", "log₁₀(Z)")
         tv = ttk.Treeview(frame, columns=tv_cols, show="headings", style="Modern.Treeview"); tv.pack(fill="both", expand=True)
@@ -4101,7 +5448,6 @@ class App(tk.Tk):
         ax.set_ylabel(r"$\log_{10}(Z(\alpha))$ where $Z(\alpha) = A(\alpha)f(\alpha)$")
         ax.legend()
         ax.margins(x=0)
-        fig.tight_layout()
         self._create_plot_window(fig, "NPA Function Plot")
 
     ### MODIFICATION END ###
@@ -4110,8 +5456,7 @@ class App(tk.Tk):
 class DSCGoalDialog(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent); self.title("Choose DSC Analysis Goal"); self.result = None
-        try: icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico"); self.iconbitmap(icon_path)
-        except Exception: pass
+        parent._apply_icon(self)
         self.transient(parent); self.grab_set(); self.protocol("WM_DELETE_WINDOW", self.destroy)
         main_frame = ttk.Frame(self, padding="20"); main_frame.pack(fill="both", expand=True)
         ttk.Label(main_frame, text="What do you want to calculate?", font=("Segoe UI", 11, "bold")).pack(pady=10)
@@ -4132,8 +5477,7 @@ class DSCGoalDialog(tk.Toplevel):
 class DSCChoiceDialog(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent); self.title("Choose DSC Baseline Method"); self.result = None
-        try: icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico"); self.iconbitmap(icon_path)
-        except Exception: pass
+        parent._apply_icon(self)
         self.transient(parent); self.grab_set(); self.protocol("WM_DELETE_WINDOW", self.destroy)
         main_frame = ttk.Frame(self, padding="20"); main_frame.pack(fill="both", expand=True)
         ttk.Label(main_frame, text="Select a baseline method for enthalpy (ΔH) integration:", font=("Segoe UI", 11, "bold")).pack(pady=10)
@@ -4149,8 +5493,7 @@ class InteractivePlotter(tk.Toplevel):
     def __init__(self, parent, df, beta, mass):
         super().__init__(parent); self.parent = parent; self.title(f"Interactive Baseline for {beta:.1f} K/min")
         self.protocol("WM_DELETE_WINDOW", self.destroy)
-        try: icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico"); self.iconbitmap(icon_path)
-        except Exception: pass
+        parent._apply_icon(self)
         self.df, self.beta, self.mass, self.result, self.baseline_points, self.clicks = df, beta, mass, None, [], []
         self.fig, self.ax = plt.subplots(); self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         toolbar_frame = ttk.Frame(self); toolbar_frame.pack(side=tk.TOP, fill=tk.X)
@@ -4162,12 +5505,12 @@ class InteractivePlotter(tk.Toplevel):
     def plot_initial(self):
         self.ax.clear(); self.ax.plot(self.df['Temp_K'], self.df['DSC_norm'], label=f"{self.beta:.1f} K/min")
         self.ax.set_xlabel("Temperature (K)"); self.ax.set_ylabel("Heat flow (a.u.)"); self.ax.set_yticks([])
-        self.ax.set_title("Click to Define Baseline Start & End"); self.canvas.draw()
+        self.ax.set_title("Click to Define Baseline Start & End"); self.canvas.draw_idle()
     def on_click(self, event):
         if event.inaxes != self.ax: return
         self.clicks.append((event.xdata, event.ydata))
         if len(self.clicks) == 1:
-            self.ax.axvline(x=event.xdata, color='r', linestyle='--'); self.instructions_var.set("Click to define the end point of the baseline."); self.canvas.draw()
+            self.ax.axvline(x=event.xdata, color='r', linestyle='--'); self.instructions_var.set("Click to define the end point of the baseline."); self.canvas.draw_idle()
         elif len(self.clicks) == 2:
             self.canvas.mpl_disconnect(self.cid); self.ax.axvline(x=event.xdata, color='g', linestyle='--')
             (T_start, _), (T_end, _) = self.clicks
@@ -4175,7 +5518,7 @@ class InteractivePlotter(tk.Toplevel):
             y_start, y_end = np.interp(T_start, self.df['Temp_K'], self.df['DSC_norm']), np.interp(T_end, self.df['Temp_K'], self.df['DSC_norm'])
             self.baseline_points = [(T_start, y_start), (T_end, y_end)]
             self.ax.plot([T_start, T_end], [y_start, y_end], 'k--', lw=2)
-            self.instructions_var.set("Baseline defined. Calculating..."); self.canvas.draw(); self.calculate_and_close()
+            self.instructions_var.set("Baseline defined. Calculating..."); self.canvas.draw_idle(); self.calculate_and_close()
     def calculate_and_close(self):
         try:
             (T_start, y_start), (T_end, y_end) = self.baseline_points
@@ -4189,8 +5532,7 @@ class InteractivePlotter(tk.Toplevel):
 class AutocatalyticModelDialog(tk.Toplevel):
     def __init__(self, parent, models):
         super().__init__(parent); self.title("Autocatalytic Model Fit"); self.result = None
-        try: icon_path = parent.resource_path("BIT_Kinetics_Icon_Tight.ico"); self.iconbitmap(icon_path)
-        except Exception: pass
+        parent._apply_icon(self)
         self.transient(parent); self.grab_set(); self.protocol("WM_DELETE_WINDOW", self.destroy); self.configure(bg=parent.BG)
         main_frame = ttk.Frame(self, padding="20"); main_frame.pack(fill="both", expand=True)
         ttk.Label(main_frame, text="Select a model for multi-rate global fitting:", font=("Segoe UI", 12, "bold")).pack(pady=(0, 15), anchor="w")
@@ -4208,6 +5550,9 @@ class AutocatalyticModelDialog(tk.Toplevel):
 
 
 if __name__ == "__main__":
+    # Must run first in the frozen exe: spawned pool workers re-execute the
+    # binary, and without this each worker would launch the full GUI.
+    multiprocessing.freeze_support()
     app = App()
-    app.mainloop()   
+    app.mainloop()
 